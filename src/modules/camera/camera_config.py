@@ -10,6 +10,8 @@ import logging
 from pathlib import Path
 from typing import Dict, List, Optional
 
+from src.modules.utils.json_cache import load_json_cached
+
 logger = logging.getLogger(__name__)
 
 
@@ -34,19 +36,20 @@ class CameraConfig:
         """
         self.config_path = config_path
         self.config_data: Dict = {}
+        # channel_id -> channel config, built on the first get_channel() call
+        self._channel_index: Optional[Dict[int, Dict]] = None
         self._load_config()
 
     def _load_config(self) -> None:
         """Load configuration from JSON file."""
         try:
-            if not self.config_path.exists():
-                raise CameraConfigError(f"Config file not found: {self.config_path}")
-
-            with open(self.config_path, "r", encoding="utf-8") as file:
-                self.config_data = json.load(file)
+            # Shared with other loads of the same unchanged file; only read from it
+            self.config_data = load_json_cached(self.config_path)
 
             logger.info(f"Loaded camera config from {self.config_path}")
 
+        except FileNotFoundError as e:
+            raise CameraConfigError(f"Config file not found: {self.config_path}") from e
         except json.JSONDecodeError as e:
             raise CameraConfigError(f"Invalid JSON in config: {e}") from e
         except Exception as e:
@@ -77,11 +80,13 @@ class CameraConfig:
         Returns:
             Channel configuration or None if not found
         """
-        channels = self.get_channels()
-        for channel in channels:
-            if channel.get("channel_id") == channel_id:
-                return channel
-        return None
+        if self._channel_index is None:
+            index: Dict[int, Dict] = {}
+            for channel in self.get_channels():
+                # First entry wins, as with a linear scan
+                index.setdefault(channel.get("channel_id"), channel)
+            self._channel_index = index
+        return self._channel_index.get(channel_id)
 
     def get_server_info(self) -> Dict:
         """Get server information."""
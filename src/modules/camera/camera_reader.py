@@ -6,13 +6,70 @@ This module provides functionality to read frames from RTSP camera streams.
 """
 
 import logging
-from typing import Optional, Tuple
+import os
+import threading
+from contextlib import contextmanager
+from typing import Iterator, Optional, Tuple
+from urllib.parse import urlsplit, urlunsplit
 
 import cv2
 import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# FFmpeg demuxer options for live RTSP: no input buffering, low-delay decoding.
+# Only applied when OPENCV_FFMPEG_CAPTURE_OPTIONS is not already set.
+FFMPEG_LOW_LATENCY_OPTIONS = "fflags;nobuffer|flags;low_delay|max_delay;0"
+
+# Environment variable OpenCV reads FFmpeg capture options from when a capture opens
+FFMPEG_OPTIONS_ENV = "OPENCV_FFMPEG_CAPTURE_OPTIONS"
+
+# Serializes temporary changes to FFMPEG_OPTIONS_ENV between readers
+_ffmpeg_env_lock = threading.Lock()
+
+
+def redact_rtsp_url(url: str) -> str:
+    """
+    Mask the password in an RTSP URL for logging.
+
+    Args:
+        url: RTSP URL, optionally with user:password@ credentials
+
+    Returns:
+        URL with the password replaced by '***' (unchanged if it has none)
+    """
+    parts = urlsplit(url)
+    if not parts.password:
+        return url
+    host = parts.netloc.rpartition("@")[2]
+    return urlunsplit(parts._replace(netloc=f"{parts.username}:***@{host}"))
+
+
+@contextmanager
+def _ffmpeg_capture_options(options: Optional[str]) -> Iterator[None]:
+    """
+    Expose FFmpeg capture options to OpenCV only while a capture is being opened.
+
+    OpenCV has no per-capture setting for these, so the environment variable is set
+    for the duration of the block and removed afterwards. A value configured by the
+    user is left untouched and wins.
+
+    Args:
+        options: FFmpeg options string, or None to open with the current environment
+    """
+    if options is None:
+        yield
+        return
+    with _ffmpeg_env_lock:
+        if FFMPEG_OPTIONS_ENV in os.environ:
+            yield
+            return
+        os.environ[FFMPEG_OPTIONS_ENV] = options
+        try:
+            yield
+        finally:
+            os.environ.pop(FFMPEG_OPTIONS_ENV, None)
+
 
 class CameraReaderError(Exception):
     """Raised when camera reading errors occur."""
@@ -24,7 +81,12 @@ class CameraReader:
     """Manages RTSP camera stream reading."""
 
     def __init__(
-        self, rtsp_url: str, reconnect_delay: int = 5, timeout: int = 10
+        self,
+        rtsp_url: str,
+        reconnect_delay: int = 5,
+        timeout: int = 10,
+        soft_retries: int = 3,
+        hw_decode: bool = False,
     ) -> None:
         """
         Initialize camera reader.
@@ -33,6 +95,9 @@ class CameraReader:
             rtsp_url: RTSP URL of the camera
             reconnect_delay: Delay in seconds before reconnecting
             timeout: Connection timeout in seconds
+            soft_retries: grab() attempts on the open capture before a full reconnect
+            hw_decode: Ask the FFmpeg backend for hardware-accelerated decoding
+                (falls back to software decoding if unavailable)
 
         Raises:
             CameraReaderError: If initialization fails
@@ -40,6 +105,8 @@ class CameraReader:
         self.rtsp_url = rtsp_url
         self.reconnect_delay = reconnect_delay
         self.timeout = timeout
+        self.soft_retries = max(0, int(soft_retries))
+        self.hw_decode = bool(hw_decode)
         self.cap: Optional[cv2.VideoCapture] = None
         self.is_connected = False
         self.last_frame: Optional[np.ndarray] = None
@@ -51,8 +118,12 @@ class CameraReader:
         try:
             logger.info(f"Connecting to RTSP stream: {self.rtsp_url}")
 
+            # Drop any previous capture so its RTSP session is not leaked
+            if self.cap is not None:
+                self.cap.release()
+
             # Create VideoCapture with RTSP URL
-            self.cap = cv2.VideoCapture(self.rtsp_url)
+            self.cap = self._open_capture()
 
             # Set buffer size to reduce latency
             self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
@@ -81,6 +152,30 @@ class CameraReader:
             self.is_connected = False
             raise CameraReaderError(f"Connection failed: {e}") from e
 
+    def _open_capture(self) -> cv2.VideoCapture:
+        """Open the stream, with low-latency FFmpeg options for RTSP."""
+        options = FFMPEG_LOW_LATENCY_OPTIONS if self.rtsp_url.startswith("rtsp://") else None
+        with _ffmpeg_capture_options(options):
+            return self._create_capture()
+
+    def _create_capture(self) -> cv2.VideoCapture:
+        """Create the capture, with hardware decoding when requested and supported."""
+        if self.hw_decode and hasattr(cv2, "CAP_PROP_HW_ACCELERATION"):
+            cap = cv2.VideoCapture(
+                self.rtsp_url,
+                cv2.CAP_FFMPEG,
+                [cv2.CAP_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY],
+            )
+            if cap.isOpened():
+                logger.info(
+                    "Hardware decode enabled (acceleration=%.0f)",
+                    cap.get(cv2.CAP_PROP_HW_ACCELERATION),
+                )
+                return cap
+            cap.release()
+            logger.warning("Hardware decode unavailable, falling back to software decode")
+        return cv2.VideoCapture(self.rtsp_url)
+
     def read_frame(self) -> Optional[np.ndarray]:
         """
         Read a frame from the camera stream.
@@ -101,6 +196,10 @@ class CameraReader:
                 raise CameraReaderError("VideoCapture not initialized")
             ret, frame = cap.read()
 
+            if not ret and self.soft_reconnect():
+                # Decode the frame grab() just recovered instead of reading another
+                ret, frame = cap.retrieve()
+
             if not ret:
                 logger.warning("Failed to read frame, trying reconnect...")
                 self._connect()
@@ -122,6 +221,58 @@ class CameraReader:
             logger.error(f"Error reading frame: {e}")
             return None
 
+    def soft_reconnect(self, max_attempts: Optional[int] = None) -> bool:
+        """
+        Try to recover a stalled stream on the existing capture.
+
+        Transient RTSP hiccups usually clear after a few grab() calls, which is
+        far cheaper than tearing down the capture and renegotiating the session.
+
+        Args:
+            max_attempts: Number of grab() attempts (defaults to soft_retries)
+
+        Returns:
+            True if the stream delivered a frame again, False if a full
+            reconnect is needed
+        """
+        attempts = self.soft_retries if max_attempts is None else max_attempts
+        cap = self.cap
+        if cap is None or not cap.isOpened():
+            return False
+
+        for attempt in range(attempts):
+            try:
+                if cap.grab():
+                    self.is_connected = True
+                    logger.info(f"Stream recovered after {attempt + 1} soft retries")
+                    return True
+            except Exception as e:
+                logger.debug(f"Soft reconnect grab failed: {e}")
+                break
+        return False
+
+    def grab_frame(self) -> bool:
+        """
+        Advance the stream by one frame without decoding it.
+
+        Use for frames the caller will not process; only the packet is read,
+        so no decode or color conversion work is done.
+
+        Returns:
+            True if a frame was grabbed, False otherwise
+        """
+        cap = self.cap
+        if not self.is_connected or cap is None:
+            return False
+        try:
+            ok = bool(cap.grab())
+        except Exception as e:
+            logger.error(f"Error grabbing frame: {e}")
+            return False
+        if ok:
+            self.frame_count += 1
+        return ok
+
     def get_frame_size(self) -> Optional[Tuple[int, int]]:
         """
         Get current frame dimensions.
@@ -169,20 +169,17 @@ class DailyPersonCounter:
         # Query all global counters to get total unique persons counted system-wide
         all_global_counts = self.identity_manager.get_all_global_daily_counts()
         
-        unique_persons_entered = set()
-        unique_persons_exited = set()
-        
-        # Count unique persons who have entered/exited globally (across all channels)
-        for person_id, counts in all_global_counts.items():
-            if counts.get("enter", 0) > 0:
-                unique_persons_entered.add(person_id)
-            if counts.get("exit", 0) > 0:
-                unique_persons_exited.add(person_id)
-        
-        # Global totals = count of unique persons who entered/exited (synced across all channels)
-        global_enter_total = len(unique_persons_entered)
-        global_exit_total = len(unique_persons_exited)
-        global_unique_total = len(unique_persons_entered | unique_persons_exited)
+        # Count unique persons who have entered/exited globally (across all channels);
+        # person ids are already unique keys, so plain counters replace per-call sets
+        global_enter_total = 0
+        global_exit_total = 0
+        global_unique_total = 0
+        for counts in all_global_counts.values():
+            entered = counts.get("enter", 0) > 0
+            exited = counts.get("exit", 0) > 0
+            global_enter_total += entered
+            global_exit_total += exited
+            global_unique_total += entered or exited
         
         # Add global counts to all zones for display (separate from local daily counts)
         for zone_id in result["counts"]:
@@ -193,9 +190,9 @@ class DailyPersonCounter:
         
         return result
 
-    def draw_zones(self, frame: Any) -> Any:
+    def draw_zones(self, frame: Any, inplace: bool = False) -> Any:
         """Draw zones on frame (delegate to ZoneCounter)."""
-        return self.zone_counter.draw_zones(frame)
+        return self.zone_counter.draw_zones(frame, inplace=inplace)
 
     def get_counts(self) -> Dict[str, Dict[str, int]]:
         """Get current zone counts (includes daily counts)."""
@@ -12,9 +12,33 @@ from typing import Any, Dict, List, Optional, Tuple
 import cv2
 import numpy as np
 
+from src.modules.utils.jit import NUMBA_AVAILABLE, njit
+
 logger = logging.getLogger(__name__)
 
 
+@njit
+def _point_in_zone(poly: np.ndarray, x: float, y: float) -> bool:
+    """Ray-casting test compiled with Numba; poly is a float64 (K, 2) vertex array."""
+    n = poly.shape[0]
+    inside = False
+    p1x = poly[0, 0]
+    p1y = poly[0, 1]
+    for i in range(1, n + 1):
+        p2x = poly[i % n, 0]
+        p2y = poly[i % n, 1]
+        if min(p1y, p2y) < y <= max(p1y, p2y) and x <= max(p1x, p2x):
+            if p1x == p2x:
+                inside = not inside
+            elif p1y != p2y:
+                xinters = (y - p1y) * (p2x - p1x) / (p2y - p1y) + p1x
+                if x <= xinters:
+                    inside = not inside
+        p1x = p2x
+        p1y = p2y
+    return inside
+
+
 def point_in_polygon(point: Tuple[float, float], polygon: List[Tuple[float, float]]) -> bool:
     """
     Check if a point is inside a polygon using ray casting algorithm.
@@ -27,6 +51,9 @@ def point_in_polygon(point: Tuple[float, float], polygon: List[Tuple[float, floa
         True if point is inside polygon, False otherwise
     """
     x, y = point
+    if NUMBA_AVAILABLE:
+        return bool(_point_in_zone(np.asarray(polygon, dtype=np.float64), float(x), float(y)))
+
     n = len(polygon)
     inside = False
 
@@ -156,6 +183,8 @@ class ZoneCounter:
         self.disappeared_tracks: Dict[int, Dict[str, Any]] = {}  # Track disappeared tracks for position matching
         self._frame_size: Optional[Tuple[int, int]] = None  # (width, height)
         self._position_match_threshold: float = 100.0  # Pixels - max distance to match tracks
+        # Absolute (K, 2) vertex arrays of percentage zones, keyed by zone_id -> (frame_size, array)
+        self._zone_polygon_cache: Dict[str, Tuple[Tuple[int, int], np.ndarray]] = {}
 
         # Initialize counts for each zone
         for zone in self.zones:
@@ -225,6 +254,7 @@ class ZoneCounter:
                         "type": "polygon",
                         "coordinate_type": "percentage",
                         "points_percent": parsed_points,  # Store as percentage
+                        "polygon_percent": np.asarray(parsed_points, dtype=np.float64),
                         "direction": zone.get("direction", "bidirectional"),
                         "enter_threshold": zone.get("enter_threshold", 0.5),
                         "exit_threshold": zone.get("exit_threshold", 0.5),
@@ -238,6 +268,7 @@ class ZoneCounter:
                         "type": "polygon",
                         "coordinate_type": "absolute",
                         "points": parsed_points,
+                        "polygon": np.asarray(parsed_points, dtype=np.float64),
                         "direction": zone.get("direction", "bidirectional"),
                         "enter_threshold": zone.get("enter_threshold", 0.5),
                         "exit_threshold": zone.get("exit_threshold", 0.5),
@@ -295,7 +326,7 @@ class ZoneCounter:
             (x, y) centroid coordinates or None if bbox invalid
         """
         bbox = detection.get("bbox")
-        if not bbox or len(bbox) < 4:
+        if bbox is None or len(bbox) < 4:
             return None
 
         # Handle both [x1, y1, x2, y2] and [x, y, w, h] formats
@@ -330,6 +361,37 @@ class ZoneCounter:
             # Already absolute
             return zone.get("points", [])
 
+    def _get_zone_polygon(
+        self, zone: Dict[str, Any], frame_width: int, frame_height: int
+    ) -> np.ndarray:
+        """
+        Get absolute float64 (K, 2) vertex array for a polygon zone.
+
+        Absolute zones are converted once at parse time; percentage zones are
+        scaled once per frame size and cached until the resolution changes.
+
+        Args:
+            zone: Zone configuration dictionary
+            frame_width: Frame width
+            frame_height: Frame height
+
+        Returns:
+            Vertex array in absolute coordinates
+        """
+        if zone.get("coordinate_type") != "percentage":
+            return zone["polygon"]
+
+        zone_id = zone["zone_id"]
+        frame_size = (frame_width, frame_height)
+        cached = self._zone_polygon_cache.get(zone_id)
+        if cached is not None and cached[0] == frame_size:
+            return cached[1]
+
+        scale = np.array([frame_width / 100.0, frame_height / 100.0], dtype=np.float64)
+        polygon = zone["polygon_percent"] * scale
+        self._zone_polygon_cache[zone_id] = (frame_size, polygon)
+        return polygon
+
     def _update_current_count(self, zone_id: str) -> None:
         """
         Recalculate current count for a zone based on actual track states.
@@ -387,6 +449,9 @@ class ZoneCounter:
         Returns:
             True if point is inside polygon
         """
+        if NUMBA_AVAILABLE:
+            polygon = self._get_zone_polygon(zone, frame_width, frame_height)
+            return bool(_point_in_zone(polygon, float(point[0]), float(point[1])))
         points = self._get_zone_points(zone, frame_width, frame_height)
         return point_in_polygon(point, points)
 
@@ -783,17 +848,19 @@ class ZoneCounter:
             else:
                 logger.warning(f"Zone {zone_id} not found for reset")
 
-    def draw_zones(self, frame: np.ndarray) -> np.ndarray:
+    def draw_zones(self, frame: np.ndarray, inplace: bool = False) -> np.ndarray:
         """
         Draw zones and counts on frame.
 
         Args:
             frame: Frame to draw on
+            inplace: Draw directly onto frame instead of a copy
 
         Returns:
             Frame with zones and counts drawn
         """
-        frame = frame.copy()
+        if not inplace:
+            frame = frame.copy()
         
         # Get frame size for percentage conversion
         if frame is not None and len(frame.shape) >= 2:
@@ -808,19 +875,25 @@ class ZoneCounter:
             counts = self.zone_counts[zone_id]
 
             if zone["type"] == "polygon":
-                # Get absolute points (convert percentage if needed)
-                points = self._get_zone_points(zone, frame_width, frame_height)
-                pts = np.array(points, np.int32)
-                pts = pts.reshape((-1, 1, 2))
+                # Vertices from the array built at parse time (scaled once per frame size)
+                pts = (
+                    self._get_zone_polygon(zone, frame_width, frame_height)
+                    .astype(np.int32)
+                    .reshape((-1, 1, 2))
+                )
                 cv2.polylines(frame, [pts], True, (0, 255, 0), 2)
-                # Draw filled polygon with transparency
-                overlay = frame.copy()
-                cv2.fillPoly(overlay, [pts], (0, 255, 0))
-                cv2.addWeighted(overlay, 0.2, frame, 0.8, 0, frame)
+                # Draw filled polygon with transparency, blending only its bounding box
+                bx, by, bw, bh = cv2.boundingRect(pts)
+                x0, y0 = max(bx, 0), max(by, 0)
+                x1, y1 = min(bx + bw, frame_width), min(by + bh, frame_height)
+                if x1 > x0 and y1 > y0:
+                    roi = frame[y0:y1, x0:x1]
+                    overlay = roi.copy()
+                    cv2.fillPoly(overlay, [pts - np.array([x0, y0], np.int32)], (0, 255, 0))
+                    cv2.addWeighted(overlay, 0.2, roi, 0.8, 0, roi)
 
                 # Draw point numbers (0, 1, 2, 3...) at each vertex
-                for idx, point in enumerate(points):
-                    x, y = int(point[0]), int(point[1])
+                for idx, (x, y) in enumerate(pts[:, 0].tolist()):
                     # Draw circle at point
                     cv2.circle(frame, (x, y), 8, (255, 255, 0), -1)  # Yellow filled circle
                     cv2.circle(frame, (x, y), 8, (0, 0, 0), 2)  # Black border
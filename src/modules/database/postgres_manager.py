@@ -5,15 +5,35 @@ PostgreSQL manager with connection pooling and batch operations.
 
 from __future__ import annotations
 
+import csv
+import io
+import json
 import logging
 from contextlib import contextmanager
-from typing import Generator, Iterable, Optional
+from typing import Generator, Iterable, Optional, Sequence
 import time
 
 from .models import PersonDetection, PersonTrack
 
 logger = logging.getLogger(__name__)
 
+# Column order of rows passed to PostgresManager.insert_detection_rows/copy_detection_rows
+DETECTION_COLUMNS = (
+    "timestamp",
+    "camera_id",
+    "channel_id",
+    "detection_id",
+    "track_id",
+    "confidence",
+    "bbox_x",
+    "bbox_y",
+    "bbox_width",
+    "bbox_height",
+    "gender",
+    "gender_confidence",
+    "frame_number",
+)
+
 
 class PostgresManager:
     """Minimal synchronous PostgreSQL manager (psycopg2 expected)."""
@@ -55,46 +75,41 @@ class PostgresManager:
 
     def insert_detections(self, detections: Iterable[PersonDetection]) -> int:
         """Batch insert detections; returns number of rows inserted."""
-        rows = list(detections)
-        if len(rows) == 0:
-            return 0
-        placeholders = (
-            "(%(timestamp)s,%(camera_id)s,%(channel_id)s,%(detection_id)s,%(track_id)s,"
-            "%(confidence)s,%(bbox_x)s,%(bbox_y)s,%(bbox_w)s,%(bbox_h)s,%(gender)s,"
-            "%(gender_confidence)s,%(frame_number)s)"
-        )
-        params = []
-        for d in rows:
+        rows = []
+        for d in detections:
             x, y, w, h = d.bbox
-            params.append(
-                {
-                    "timestamp": d.timestamp,
-                    "camera_id": d.camera_id,
-                    "channel_id": d.channel_id,
-                    "detection_id": d.detection_id,
-                    "track_id": d.track_id,
-                    "confidence": d.confidence,
-                    "bbox_x": x,
-                    "bbox_y": y,
-                    "bbox_w": w,
-                    "bbox_h": h,
-                    "gender": d.gender,
-                    "gender_confidence": d.gender_confidence,
-                    "frame_number": d.frame_number,
-                }
+            rows.append(
+                (
+                    d.timestamp,
+                    d.camera_id,
+                    d.channel_id,
+                    d.detection_id,
+                    d.track_id,
+                    d.confidence,
+                    x,
+                    y,
+                    w,
+                    h,
+                    d.gender,
+                    d.gender_confidence,
+                    d.frame_number,
+                )
             )
+        return self.insert_detection_rows(rows)
+
+    def insert_detection_rows(self, rows: Sequence[tuple]) -> int:
+        """Batch insert pre-shaped detection rows in one statement; returns rows inserted.
+
+        Each row holds the DETECTION_COLUMNS values in order.
+        """
+        if len(rows) == 0:
+            return 0
+        placeholders = "(" + ",".join(["%s"] * len(DETECTION_COLUMNS)) + ")"
         try:
             with self._conn() as conn:
                 with conn.cursor() as cur:
-                    # psycopg2 allows passing a list of params dicts expanded by mogrify.
-                    vals = []
-                    for p in params:
-                        vals.append(cur.mogrify(placeholders, p).decode("utf-8"))
-                    base = (
-                        "INSERT INTO detections (timestamp,camera_id,channel_id,detection_id,"
-                        "track_id,confidence,bbox_x,bbox_y,bbox_width,bbox_height,gender,"
-                        "gender_confidence,frame_number) VALUES "
-                    )
+                    vals = [cur.mogrify(placeholders, row).decode("utf-8") for row in rows]
+                    base = f"INSERT INTO detections ({','.join(DETECTION_COLUMNS)}) VALUES "
                     final_sql = base + ",".join(vals)
                     t0 = time.monotonic()
                     cur.execute(final_sql)
@@ -106,6 +121,32 @@ class PostgresManager:
             logger.error("insert_detections failed: %s", e)
             return 0
 
+    def copy_detection_rows(self, rows: Sequence[tuple]) -> int:
+        """Bulk load pre-shaped detection rows with COPY FROM STDIN; returns rows loaded.
+
+        Each row holds the DETECTION_COLUMNS values in order. The batch is streamed
+        as CSV in one roundtrip and skips per-row statement parsing; None values are
+        written as unquoted empty fields, which CSV COPY reads as NULL.
+        """
+        if len(rows) == 0:
+            return 0
+        buf = io.StringIO()
+        csv.writer(buf).writerows(rows)
+        buf.seek(0)
+        sql = f"COPY detections ({','.join(DETECTION_COLUMNS)}) FROM STDIN WITH (FORMAT csv)"
+        try:
+            with self._conn() as conn:
+                with conn.cursor() as cur:
+                    t0 = time.monotonic()
+                    cur.copy_expert(sql, buf)
+                conn.commit()
+            dur_ms = (time.monotonic() - t0) * 1000.0
+            self._record_insert_latency_ms(float(dur_ms))
+            return len(rows)
+        except Exception as e:
+            logger.error("copy_detection_rows failed: %s", e)
+            return 0
+
     def upsert_track(self, track: PersonTrack) -> None:
         """Upsert single track."""
         try:
@@ -241,6 +282,47 @@ class PostgresManager:
         except Exception as e:
             logger.warning("insert_counter_event failed: %s", e)
 
+    def insert_counter_events(self, events: Iterable[dict]) -> int:
+        """Batch insert counter event rows in one statement; returns rows inserted.
+
+        Each event dict takes the keyword arguments of insert_counter_event.
+        """
+        rows = list(events)
+        if len(rows) == 0 or self._pool is None:
+            return 0
+        placeholders = "(NOW(), %s, %s, %s, %s, %s, %s, %s, %s)"
+        try:
+            with self._conn() as conn:
+                with conn.cursor() as cur:
+                    vals = []
+                    for ev in rows:
+                        track_id = ev.get("track_id")
+                        person_id = ev.get("person_id")
+                        frame_number = ev.get("frame_number")
+                        params = (
+                            int(ev["channel_id"]),
+                            str(ev["zone_id"]),
+                            str(ev.get("zone_name") or ""),
+                            str(ev["event_type"]),
+                            int(track_id) if track_id is not None else None,
+                            str(person_id) if person_id is not None else None,
+                            int(frame_number) if frame_number is not None else None,
+                            json.dumps(ev.get("extra_json") or {}),
+                        )
+                        vals.append(cur.mogrify(placeholders, params).decode("utf-8"))
+                    sql = (
+                        "INSERT INTO counter_events (occurred_at, channel_id, zone_id, zone_name, "
+                        "event_type, track_id, person_id, frame_number, extra_json) VALUES "
+                    )
+                    t0 = time.monotonic()
+                    cur.execute(sql + ",".join(vals))
+                conn.commit()
+            self._record_insert_latency_ms((time.monotonic() - t0) * 1000.0)
+            return len(rows)
+        except Exception as e:
+            logger.warning("insert_counter_events failed: %s", e)
+            return 0
+
     def upsert_channel_metadata(
         self,
         *,
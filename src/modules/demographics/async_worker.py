@@ -16,19 +16,24 @@ from __future__ import annotations
 import logging
 import threading
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from queue import Empty, Full, PriorityQueue
-from typing import Callable, Dict, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
 
 logger = logging.getLogger(__name__)
 
+# Task ids are strings or tuples such as (session_id, track_id, frame_num); ids in one
+# queue must be of the same kind since they order tasks of equal priority and age
+TaskId = Union[str, Tuple[Any, ...]]
+
 
 @dataclass(order=True)
 class _QueuedTask:
     priority: int
     enqueued_at: float
-    task_id: str
-    func: Callable[[], Tuple[str, float]]  # gender, confidence only (age disabled)
+    task_id: TaskId
+    func: Callable[[], Any]  # (gender, confidence), or a list of them for batch tasks
+    batch_task_ids: Tuple[TaskId, ...] = field(default=(), compare=False)
 
 
 class AsyncGenderWorker:
@@ -41,7 +46,8 @@ class AsyncGenderWorker:
         task_timeout_ms: int = 50,
     ) -> None:
         self._queue: PriorityQueue[_QueuedTask] = PriorityQueue(maxsize=queue_size)
-        self._results: Dict[str, Tuple[str, float, float]] = {}  # gender, conf, timestamp (age disabled)
+        # gender, conf, timestamp (age disabled)
+        self._results: Dict[TaskId, Tuple[str, float, float]] = {}
         self._results_lock = threading.Lock()
         self._shutdown = threading.Event()
         self._workers = [
@@ -63,12 +69,13 @@ class AsyncGenderWorker:
         )
 
     def enqueue(
-        self, task_id: str, priority: int, func: Callable[[], Tuple[str, float, int, float]]
+        self, task_id: TaskId, priority: int, func: Callable[[], Tuple[str, float, int, float]]
     ) -> bool:
         """Enqueue a classification task.
 
         Args:
-            task_id: Unique identifier (e.g., f"{session}:{track_id}:{frame}")
+            task_id: Unique identifier (e.g., f"{session}:{track_id}:{frame}" or
+                (session, track_id, frame))
             priority: Lower value processes sooner (0 is highest)
             func: Callable returning (gender_label, confidence) - age disabled
 
@@ -89,7 +96,48 @@ class AsyncGenderWorker:
             logger.debug("AsyncGenderWorker queue full; dropping task_id=%s", task_id)
             return False
 
-    def try_get_result(self, task_id: str) -> Optional[Tuple[str, float, float]]:
+    def enqueue_batch(
+        self,
+        task_ids: Sequence[TaskId],
+        priority: int,
+        func: Callable[[], List[Tuple[str, float]]],
+    ) -> bool:
+        """Enqueue one task that classifies several crops in a single call.
+
+        Each (gender, confidence) returned by ``func`` is stored under the
+        task id at the same position, so results are polled per crop with
+        ``try_get_result`` exactly as for single tasks.
+
+        Args:
+            task_ids: Per-crop identifiers, aligned with the list ``func`` returns
+            priority: Lower value processes sooner (0 is highest)
+            func: Callable returning a list of (gender_label, confidence)
+
+        Returns:
+            True if enqueued, False if queue is full.
+        """
+        if not task_ids:
+            return False
+        try:
+            self._queue.put_nowait(
+                _QueuedTask(
+                    priority=priority,
+                    enqueued_at=time.time(),
+                    task_id=task_ids[0],
+                    func=func,
+                    batch_task_ids=tuple(task_ids),
+                )
+            )
+            return True
+        except Full:
+            logger.debug(
+                "AsyncGenderWorker queue full; dropping batch of %d (task_id=%s)",
+                len(task_ids),
+                task_ids[0],
+            )
+            return False
+
+    def try_get_result(self, task_id: TaskId) -> Optional[Tuple[str, float, float]]:
         """Get result if available.
 
         Returns (gender, confidence, completed_at) or None. Age disabled.
@@ -113,7 +161,7 @@ class AsyncGenderWorker:
             try:
                 start = time.time()
                 # Soft timeout: if task exceeds budget, we still let it finish
-                gender, conf = queued.func()  # Age disabled - only gender
+                output = queued.func()  # Age disabled - only gender
                 done = time.time()
                 if (done - start) * 1000.0 > self._task_timeout_ms:
                     logger.debug(
@@ -123,7 +171,12 @@ class AsyncGenderWorker:
                         queued.task_id,
                     )
                 with self._results_lock:
-                    self._results[queued.task_id] = (gender, conf, done)
+                    if queued.batch_task_ids:
+                        for task_id, (gender, conf) in zip(queued.batch_task_ids, output):
+                            self._results[task_id] = (gender, conf, done)
+                    else:
+                        gender, conf = output
+                        self._results[queued.task_id] = (gender, conf, done)
             except Exception as e:
                 logger.warning("Gender task failed: %s (task_id=%s)", e, queued.task_id)
             finally:
@@ -7,8 +7,10 @@ Pretrained on UTKFace dataset for robust performance.
 """
 
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
 
 import cv2
 import numpy as np
@@ -22,8 +24,14 @@ logger = logging.getLogger(__name__)
 class FaceGenderClassifier:
     """Gender classifier optimized for face crops using MobileNetV2."""
 
+    INPUT_SIZE = 224
+
     def __init__(
-        self, device: Optional[str] = None, min_confidence: float = 0.5
+        self,
+        device: Optional[str] = None,
+        min_confidence: float = 0.5,
+        max_batch: int = 8,
+        quantize: bool = False,
     ) -> None:
         """
         Initialize face-based gender classifier.
@@ -31,6 +39,8 @@ class FaceGenderClassifier:
         Args:
             device: Device for inference ('mps', 'cpu', 'cuda')
             min_confidence: Minimum confidence threshold for prediction
+            max_batch: Initial capacity of the per-thread input staging buffer
+            quantize: Apply int8 dynamic quantization when running on CPU
         """
         self.device = device or ("mps" if torch.backends.mps.is_available() else "cpu")
         self.min_confidence = min_confidence
@@ -38,6 +48,20 @@ class FaceGenderClassifier:
         # Initialize model
         self.model = self._build_model()
         self.model.eval()
+        if quantize and self.device == "cpu":
+            self.model = self._quantize_model(self.model)
+
+        # ImageNet normalization stats, kept on device for reuse across batches
+        self._mean = torch.tensor([0.485, 0.456, 0.406]).view(1, 3, 1, 1).to(self.device)
+        self._std = torch.tensor([0.229, 0.224, 0.225]).view(1, 3, 1, 1).to(self.device)
+
+        # Host staging buffers for crops, one per calling thread (gender workers run
+        # concurrently), pinned when the model lives on an accelerator
+        self._max_batch = max(1, int(max_batch))
+        self._staging_local = threading.local()
+
+        # cv2.cvtColor/resize release the GIL, so crops of a batch preprocess in parallel
+        self._preproc_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="preproc")
 
         logger.info(f"FaceGenderClassifier initialized on {self.device}")
         logger.info(f"Min confidence threshold: {min_confidence}")
@@ -83,6 +107,45 @@ class FaceGenderClassifier:
 
         return base_model
 
+    def _quantize_model(self, model: nn.Module) -> nn.Module:
+        """Convert Linear layers to int8 dynamic quantization (CPU only)."""
+        try:
+            quantized = torch.ao.quantization.quantize_dynamic(
+                model, {nn.Linear}, dtype=torch.qint8
+            )
+            logger.info("FaceGenderClassifier quantized to int8 (dynamic, Linear layers)")
+            return quantized
+        except Exception as e:
+            logger.warning(f"Dynamic quantization failed, keeping fp32 model: {e}")
+            return model
+
+    def _get_staging(self, n: int) -> torch.Tensor:
+        """Return this thread's uint8 NHWC staging buffer with room for n crops."""
+        staging = getattr(self._staging_local, "buffer", None)
+        if staging is None or staging.shape[0] < n:
+            shape = (max(n, self._max_batch), self.INPUT_SIZE, self.INPUT_SIZE, 3)
+            staging = torch.empty(shape, dtype=torch.uint8)
+            if self.device != "cpu":
+                try:
+                    staging = staging.pin_memory()
+                except RuntimeError as e:
+                    logger.debug("Pinned memory unavailable, using pageable buffer: %s", e)
+            self._staging_local.buffer = staging
+        return staging
+
+    def _preproc_crop(self, face_crop: np.ndarray, dst: np.ndarray) -> None:
+        """Convert a BGR crop to RGB and resize it into a staging slot (cv2 only, GIL-free)."""
+        h, w = face_crop.shape[:2]
+
+        # Convert BGR to RGB
+        face_rgb = cv2.cvtColor(face_crop, cv2.COLOR_BGR2RGB)
+
+        # Resize to 224x224 (MobileNetV2 input size) - use better interpolation for small crops
+        interpolation = cv2.INTER_LINEAR if min(h, w) >= 64 else cv2.INTER_CUBIC
+        cv2.resize(
+            face_rgb, (self.INPUT_SIZE, self.INPUT_SIZE), dst=dst, interpolation=interpolation
+        )
+
     def classify(self, face_crop: np.ndarray) -> Tuple[str, float]:
         """
         Classify gender from face crop.
@@ -93,44 +156,63 @@ class FaceGenderClassifier:
         Returns:
             Tuple of (gender, confidence) - ('M' or 'F', confidence score)
         """
+        return self.classify_batch([face_crop])[0]
+
+    def classify_batch(self, face_crops: List[np.ndarray]) -> List[Tuple[str, float]]:
+        """
+        Classify gender for several face crops with a single forward pass.
+
+        Args:
+            face_crops: Face crop images (BGR format from OpenCV)
+
+        Returns:
+            List of (gender, confidence) aligned with face_crops; invalid crops
+            yield ('Unknown', 0.0)
+        """
+        results: List[Tuple[str, float]] = [("Unknown", 0.0)] * len(face_crops)
         try:
-            # Validate face crop quality - skip if too small or invalid
-            if face_crop is None or face_crop.size == 0:
-                logger.debug("Face crop is None or empty")
-                return "Unknown", 0.0
-            
-            h, w = face_crop.shape[:2]
-            if h < 48 or w < 48:  # Minimum size for reasonable classification
-                logger.debug("Face crop too small: %dx%d, skipping classification", w, h)
-                return "Unknown", 0.0
-            
-            # Convert BGR to RGB
-            face_rgb = cv2.cvtColor(face_crop, cv2.COLOR_BGR2RGB)
-
-            # Resize to 224x224 (MobileNetV2 input size) - use better interpolation for small crops
-            interpolation = cv2.INTER_LINEAR if min(h, w) >= 64 else cv2.INTER_CUBIC
-            face_resized = cv2.resize(face_rgb, (224, 224), interpolation=interpolation)
-
-            # Normalize to [0, 1] and transform to tensor
-            face_tensor = torch.from_numpy(face_resized).float() / 255.0
-            face_tensor = face_tensor.permute(2, 0, 1)  # HWC to CHW
-            face_tensor = face_tensor.unsqueeze(0).to(self.device)
-
-            # Normalize with ImageNet stats
-            mean = torch.tensor([0.485, 0.456, 0.406]).view(3, 1, 1).to(self.device)
-            std = torch.tensor([0.229, 0.224, 0.225]).view(3, 1, 1).to(self.device)
-            face_tensor = (face_tensor - mean) / std
+            valid_idx = []
+            for i, face_crop in enumerate(face_crops):
+                # Validate face crop quality - skip if too small or invalid
+                if face_crop is None or face_crop.size == 0:
+                    logger.debug("Face crop is None or empty")
+                    continue
+
+                h, w = face_crop.shape[:2]
+                if h < 48 or w < 48:  # Minimum size for reasonable classification
+                    logger.debug("Face crop too small: %dx%d, skipping classification", w, h)
+                    continue
+                valid_idx.append(i)
+
+            if not valid_idx:
+                return results
+
+            staging = self._get_staging(len(valid_idx))
+            staging_np = staging.numpy()
+            valid_crops = [face_crops[i] for i in valid_idx]
+            slots = [staging_np[slot] for slot in range(len(valid_idx))]
+            if len(valid_crops) > 1:
+                list(self._preproc_pool.map(self._preproc_crop, valid_crops, slots))
+            else:
+                self._preproc_crop(valid_crops[0], slots[0])
+
+            # Zero-copy view of the filled slots; async upload from pinned memory.
+            # The buffer is not reused before .cpu() below synchronizes the stream.
+            face_tensor = staging[: len(valid_idx)].to(self.device, non_blocking=True)
+            face_tensor = face_tensor.permute(0, 3, 1, 2).float() / 255.0  # NHWC to NCHW
+            face_tensor = (face_tensor - self._mean) / self._std
 
             # Run inference
             with torch.no_grad():
                 outputs = self.model(face_tensor)
 
                 # Apply softmax to get probabilities
-                prob = torch.softmax(outputs, dim=1).squeeze()
+                probs = torch.softmax(outputs, dim=1).cpu().numpy()
 
+            for row, i in enumerate(valid_idx):
                 # Class 0 = Male, Class 1 = Female (as per UTKFace dataset convention)
-                class_0_prob = prob[0].item()
-                class_1_prob = prob[1].item()
+                class_0_prob = float(probs[row, 0])
+                class_1_prob = float(probs[row, 1])
 
                 # Get prediction and confidence
                 predicted_class = 0 if class_0_prob > class_1_prob else 1
@@ -139,27 +221,30 @@ class FaceGenderClassifier:
                 # Map to labels (based on UTKFace: 0=Male, 1=Female)
                 gender = "M" if predicted_class == 0 else "F"
 
-            logger.debug(
-                "Face gender: %s (conf=%.3f, class0=%.3f, class1=%.3f)",
-                gender,
-                confidence,
-                class_0_prob,
-                class_1_prob,
-            )
+                logger.debug(
+                    "Face gender: %s (conf=%.3f, class0=%.3f, class1=%.3f)",
+                    gender,
+                    confidence,
+                    class_0_prob,
+                    class_1_prob,
+                )
 
-            # Apply minimum confidence threshold
-            if confidence < self.min_confidence:
-                logger.debug(f"Low confidence: {confidence:.2f}, returning 'Unknown'")
-                return "Unknown", confidence
+                # Apply minimum confidence threshold
+                if confidence < self.min_confidence:
+                    logger.debug(f"Low confidence: {confidence:.2f}, returning 'Unknown'")
+                    results[i] = ("Unknown", confidence)
+                else:
+                    results[i] = (gender, confidence)
 
-            return gender, confidence
+            return results
 
         except Exception as e:
             logger.error(f"Error classifying face gender: {e}")
-            return "Unknown", 0.0
+            return [("Unknown", 0.0)] * len(face_crops)
 
     def release(self) -> None:
         """Release resources."""
+        self._preproc_pool.shutdown(wait=False)
         if hasattr(self, "model") and self.model is not None:
             del self.model
             self.model = None
@@ -8,7 +8,7 @@ Optimized for face crops with OpenCL GPU acceleration support.
 
 import logging
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
 
 import cv2
 import numpy as np
@@ -105,25 +105,42 @@ class GenderOpenCV:
         Returns:
             Tuple of (gender, confidence) - ('M' or 'F', confidence score)
         """
+        return self.classify_batch([face_crop])[0]
+
+    def classify_batch(self, face_crops: List[np.ndarray]) -> List[Tuple[str, float]]:
+        """
+        Classify gender for several face crops with a single forward pass.
+
+        Args:
+            face_crops: Face crop images (BGR format from OpenCV)
+
+        Returns:
+            List of (gender, confidence) aligned with face_crops; invalid crops
+            yield ('Unknown', 0.0)
+        """
+        results: List[Tuple[str, float]] = [("Unknown", 0.0)] * len(face_crops)
         if self.gender_net is None:
-            return "Unknown", 0.0
+            return results
 
         try:
-            # Validate face crop
-            if face_crop is None or face_crop.size == 0:
-                logger.debug("Face crop is None or empty")
-                return "Unknown", 0.0
-
-            h, w = face_crop.shape[:2]
-            if h < 48 or w < 48:  # Minimum size for reasonable classification
-                logger.debug("Face crop too small: %dx%d", w, h)
-                return "Unknown", 0.0
-
-            # Model expects 227x227 input
-            # Use better interpolation for small crops
-            interpolation = cv2.INTER_LINEAR if min(h, w) >= 64 else cv2.INTER_CUBIC
-            blob = cv2.dnn.blobFromImage(
-                face_crop,
+            # Validate face crops
+            valid_idx = []
+            for i, face_crop in enumerate(face_crops):
+                if face_crop is None or face_crop.size == 0:
+                    logger.debug("Face crop is None or empty")
+                    continue
+                h, w = face_crop.shape[:2]
+                if h < 48 or w < 48:  # Minimum size for reasonable classification
+                    logger.debug("Face crop too small: %dx%d", w, h)
+                    continue
+                valid_idx.append(i)
+
+            if not valid_idx:
+                return results
+
+            # Model expects 227x227 input; stack all crops into one NCHW blob
+            blob = cv2.dnn.blobFromImages(
+                [face_crops[i] for i in valid_idx],
                 1.0,
                 (227, 227),
                 (78.4263377603, 87.7689143744, 114.895847746),
@@ -137,41 +154,44 @@ class GenderOpenCV:
             # Run inference
             predictions = self.gender_net.forward()
 
-            # Get gender prediction
-            # Model outputs: [Male_prob, Female_prob]
-            male_prob = float(predictions[0, 0])
-            female_prob = float(predictions[0, 1])
+            # Model outputs one [Male_prob, Female_prob] row per crop
+            for row, i in enumerate(valid_idx):
+                results[i] = self._to_label(float(predictions[row, 0]), float(predictions[row, 1]))
 
-            # Determine gender and confidence
-            if male_prob > female_prob:
-                gender = "M"
-                confidence = male_prob
-            else:
-                gender = "F"
-                confidence = female_prob
+            return results
 
+        except Exception as e:
+            logger.error("Error classifying gender with OpenCV DNN: %s", e, exc_info=True)
+            return [("Unknown", 0.0)] * len(face_crops)
+
+    def _to_label(self, male_prob: float, female_prob: float) -> Tuple[str, float]:
+        """Map class probabilities to (gender, confidence) with the confidence threshold."""
+        # Determine gender and confidence
+        if male_prob > female_prob:
+            gender = "M"
+            confidence = male_prob
+        else:
+            gender = "F"
+            confidence = female_prob
+
+        logger.debug(
+            "Gender OpenCV: %s (conf=%.3f, M=%.3f, F=%.3f)",
+            gender,
+            confidence,
+            male_prob,
+            female_prob,
+        )
+
+        # Apply minimum confidence threshold
+        if confidence < self.min_confidence:
             logger.debug(
-                "Gender OpenCV: %s (conf=%.3f, M=%.3f, F=%.3f)",
-                gender,
+                "Low confidence: %.2f < %.2f, returning 'Unknown'",
                 confidence,
-                male_prob,
-                female_prob,
+                self.min_confidence,
             )
+            return "Unknown", confidence
 
-            # Apply minimum confidence threshold
-            if confidence < self.min_confidence:
-                logger.debug(
-                    "Low confidence: %.2f < %.2f, returning 'Unknown'",
-                    confidence,
-                    self.min_confidence,
-                )
-                return "Unknown", confidence
-
-            return gender, confidence
-
-        except Exception as e:
-            logger.error("Error classifying gender with OpenCV DNN: %s", e, exc_info=True)
-            return "Unknown", 0.0
+        return gender, confidence
 
     def release(self) -> None:
         """Release resources."""
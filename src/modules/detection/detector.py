@@ -114,29 +114,38 @@ class Detector:
         self, frames: List[np.ndarray], return_images: bool = False
     ) -> List[Tuple[List[Dict], Optional[np.ndarray]]]:
         """
-        Detect persons in multiple frames (batch processing).
+        Detect persons in multiple frames with one batched model call.
 
         Args:
             frames: List of input frames
             return_images: Whether to return annotated images
 
         Returns:
-            List of (detections, annotated_image) tuples
+            List of (detections, annotated_image) tuples, in input order
         """
-        results = []
-
-        # Use thread pool for CPU-bound preprocessing
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            futures = []
+        if not frames:
+            return []
+        start_time = time.time()
 
-            for frame in frames:
-                future = executor.submit(self.detect, frame, return_images)
-                futures.append(future)
+        try:
+            batch_detections = self.model_loader.detect_persons_batch(
+                frames, conf=self.conf_threshold
+            )
+        except Exception as e:
+            logger.error(f"Batch detection error: {e}")
+            return [([], None) for _ in frames]
 
-            for future in futures:
-                result = future.result()
-                results.append(result)
+        # Statistics stay per frame so the periodic stats line is comparable to detect()
+        self.frame_count += len(frames)
+        self.total_inference_time += time.time() - start_time
+        self.detection_count += sum(len(d) for d in batch_detections)
 
+        results: List[Tuple[List[Dict], Optional[np.ndarray]]] = []
+        for frame, detections in zip(frames, batch_detections):
+            annotated = None
+            if return_images and len(detections) > 0:
+                annotated = self.processor.draw_detections(frame, detections)
+            results.append((detections, annotated))
         return results
 
     def get_statistics(self) -> Dict:
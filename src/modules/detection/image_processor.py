@@ -107,6 +107,7 @@ class ImageProcessor:
         color: Tuple[int, int, int] = (0, 255, 0),
         thickness: int = 2,
         show_labels: bool = True,
+        inplace: bool = False,
     ) -> np.ndarray:
         """
         Draw detection bounding boxes on frame.
@@ -117,11 +118,12 @@ class ImageProcessor:
             color: Box color (BGR format)
             thickness: Box thickness
             show_labels: Whether to show labels
+            inplace: Draw directly onto frame instead of a copy
 
         Returns:
             Annotated frame
         """
-        annotated = frame.copy()
+        annotated = frame if inplace else frame.copy()
 
         for detection in detections:
             bbox = detection["bbox"]
@@ -192,8 +194,25 @@ class ImageProcessor:
         Returns:
             Cropped person region or None
         """
-        x1, y1, x2, y2 = map(int, bbox)
+        x1, y1, x2, y2 = map(int, bbox[:4])
+        return self.crop_person_xyxy(frame, x1, y1, x2, y2)
 
+    def crop_person_xyxy(
+        self, frame: np.ndarray, x1: int, y1: int, x2: int, y2: int
+    ) -> Optional[np.ndarray]:
+        """
+        Crop person region from frame given integer corner coordinates.
+
+        Args:
+            frame: Input frame
+            x1: Left edge
+            y1: Top edge
+            x2: Right edge
+            y2: Bottom edge
+
+        Returns:
+            Cropped person region (a view into frame) or None
+        """
         # Validate coordinates
         h, w = frame.shape[:2]
         x1 = max(0, min(x1, w))
@@ -206,6 +225,33 @@ class ImageProcessor:
 
         return frame[y1:y2, x1:x2]
 
+    def detach_crop(self, region: np.ndarray, min_side: int) -> np.ndarray:
+        """
+        Copy a frame region for later use, downscaled when it is larger than needed.
+
+        The shorter side is kept at no less than min_side, so a consumer that resizes
+        to a min_side square input still only downsamples. Larger regions are resized
+        straight into a new image (cv2.resize allocates only the smaller output)
+        instead of copying the full-resolution region first.
+
+        Args:
+            region: View into a frame
+            min_side: Smallest side length the consumer needs
+
+        Returns:
+            Image that does not share memory with the frame
+        """
+        h, w = region.shape[:2]
+        short = min(h, w)
+        if short <= min_side:
+            return region.copy()
+        scale = min_side / short
+        size = (
+            max(min_side, int(round(w * scale))),
+            max(min_side, int(round(h * scale))),
+        )
+        return cv2.resize(region, size, interpolation=cv2.INTER_AREA)
+
 
 if __name__ == "__main__":
     # Test the module
@@ -6,12 +6,16 @@ Optimized for Apple M4 Pro with Metal Performance Shaders.
 """
 
 import logging
+import threading
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
+import numpy as np
 import torch
 from ultralytics import YOLO
 
+from .onnx_model import OnnxYoloModel
+
 logger = logging.getLogger(__name__)
 
 
@@ -36,7 +40,7 @@ class ModelLoader:
 
         Args:
             model_path: Path to YOLOv8 model file
-            device: Device to use ('mps', 'cpu', or None for auto-select)
+            device: Device to use ('mps', 'cuda', 'cpu', or None for auto-select)
             conf_threshold: Confidence threshold for detections
             iou_threshold: IOU threshold for NMS
 
@@ -54,6 +58,10 @@ class ModelLoader:
             self.device = device
 
         self.model: Optional[YOLO] = None
+        self.onnx_model: Optional[OnnxYoloModel] = None
+        # Per-thread CUDA streams so concurrent detection workers don't serialize
+        # on the default stream
+        self._local = threading.local()
         self._load_model()
 
     def _select_device(self) -> str:
@@ -75,6 +83,17 @@ class ModelLoader:
         try:
             logger.info("Loading YOLOv8 model from %s", str(self.model_path))
 
+            if self.model_path.suffix == ".onnx":
+                # Exported model: run through ONNX Runtime instead of ultralytics/torch
+                self.onnx_model = OnnxYoloModel(
+                    str(self.model_path),
+                    conf_threshold=self.conf_threshold,
+                    iou_threshold=self.iou_threshold,
+                )
+                self.device = f"onnx:{self.onnx_model.get_provider()}"
+                logger.info("Model loaded successfully")
+                return
+
             if not self.model_path.exists():
                 # Download model if not exists
                 logger.info("Model file not found, downloading...")
@@ -94,6 +113,16 @@ class ModelLoader:
             logger.error("Failed to load model: %s", e)
             raise ModelLoaderError(f"Model loading failed: {e}") from e
 
+    def _get_cuda_stream(self) -> Optional["torch.cuda.Stream"]:
+        """Return this thread's CUDA stream, or None when not running on CUDA."""
+        if not str(self.device).startswith("cuda"):
+            return None
+        stream = getattr(self._local, "stream", None)
+        if stream is None:
+            stream = torch.cuda.Stream(device=self.device)
+            self._local.stream = stream
+        return stream
+
     def detect(self, frame, conf: Optional[float] = None, iou: Optional[float] = None):
         """
         Run detection on frame.
@@ -111,10 +140,22 @@ class ModelLoader:
 
         try:
             if self.model is None:
-                raise ModelLoaderError("Model is not loaded")
-            results = self.model.predict(
-                frame, device=self.device, conf=conf, iou=iou, verbose=False
-            )
+                raise ModelLoaderError(
+                    "Model is not loaded"
+                    if self.onnx_model is None
+                    else "Raw results are not available for ONNX models, use detect_persons"
+                )
+            stream = self._get_cuda_stream()
+            if stream is None:
+                return self.model.predict(
+                    frame, device=self.device, conf=conf, iou=iou, verbose=False
+                )
+            with torch.cuda.stream(stream):
+                results = self.model.predict(
+                    frame, device=self.device, conf=conf, iou=iou, verbose=False
+                )
+            # Wait for this worker's stream only; other workers' kernels keep running
+            stream.synchronize()
             return results
 
         except Exception as e:
@@ -132,28 +173,67 @@ class ModelLoader:
         Returns:
             List of person detections
         """
+        if self.onnx_model is not None:
+            try:
+                return self.onnx_model.detect_persons(frame, conf=conf)
+            except Exception as e:
+                logger.error("Detection failed: %s", e)
+                raise ModelLoaderError(f"Detection failed: {e}") from e
+
         results = self.detect(frame, conf=conf)
 
         if len(results) == 0:
             return []
 
-        result = results[0]
+        return self._person_detections(results[0])
+
+    def detect_persons_batch(
+        self, frames: List[np.ndarray], conf: Optional[float] = None
+    ) -> List[list]:
+        """
+        Detect persons in several frames with one batched forward pass.
+
+        ONNX models are exported with a fixed batch of 1 and run frame by frame.
+
+        Args:
+            frames: Input frames
+            conf: Confidence threshold
+
+        Returns:
+            One list of person detections per frame, in input order
+        """
+        if not frames:
+            return []
+        if self.onnx_model is not None:
+            return [self.detect_persons(frame, conf=conf) for frame in frames]
+
+        # Ultralytics batches a list source into one tensor and returns one result per image
+        results = self.detect(list(frames), conf=conf)
+        return [self._person_detections(result) for result in results]
+
+    @staticmethod
+    def _person_detections(result) -> list:
+        """Convert one Ultralytics result into person detection dicts."""
         person_detections = []
 
         # Filter for person class (class 0 in COCO dataset)
-        if result.boxes is not None:
-            for box in result.boxes:
-                class_id = int(box.cls[0])
-
-                # Class 0 is 'person' in COCO dataset
-                if class_id == 0:
-                    detection = {
-                        "bbox": box.xyxy[0].cpu().numpy(),
-                        "confidence": float(box.conf[0]),
-                        "class_id": class_id,
+        # Pull all boxes to host once as contiguous SoA arrays instead of per-box tensors
+        boxes = result.boxes
+        if boxes is not None and len(boxes) > 0:
+            xyxy = boxes.xyxy.cpu().numpy().astype(np.float32, copy=False)
+            confs = boxes.conf.cpu().numpy()
+            class_ids = boxes.cls.cpu().numpy().astype(np.int32)
+
+            # Class 0 is 'person' in COCO dataset
+            for i in np.flatnonzero(class_ids == 0):
+                person_detections.append(
+                    {
+                        "bbox": xyxy[i],
+                        "confidence": float(confs[i]),
+                        "class_id": 0,
                         "class_name": "person",
                     }
-                    person_detections.append(detection)
+                )
 
         return person_detections
 
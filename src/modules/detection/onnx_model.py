@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+YOLOv8 person detection through ONNX Runtime.
+
+Runs an exported ``yolov8*.onnx`` model without the ultralytics/torch
+per-call overhead. Pre- and post-processing (letterbox, NMS) are done with
+OpenCV and NumPy, and inputs are fed through IO binding from a reusable
+per-thread buffer.
+
+Reduced-precision exports are used as-is: the input buffer takes the
+model's declared element type, so FP16 models get a float16 tensor and
+models exported with a uint8 input (normalization baked into the graph,
+e.g. quantized INT8 exports) receive the letterboxed pixels directly.
+"""
+
+import logging
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import cv2
+import numpy as np
+
+try:
+    import onnxruntime as ort
+
+    ORT_AVAILABLE = True
+except ImportError:
+    ORT_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# ONNX input element types -> NumPy buffer dtype
+INPUT_DTYPES = {
+    "tensor(float)": np.float32,
+    "tensor(float16)": np.float16,
+    "tensor(uint8)": np.uint8,
+}
+
+# Preferred execution providers, fastest first; unavailable ones are skipped
+DEFAULT_PROVIDERS = (
+    "CoreMLExecutionProvider",
+    "CUDAExecutionProvider",
+    "OpenVINOExecutionProvider",
+    "CPUExecutionProvider",
+)
+
+
+class OnnxYoloModel:
+    """YOLOv8 detection model backed by an ONNX Runtime session."""
+
+    def __init__(
+        self,
+        model_path: str,
+        conf_threshold: float = 0.5,
+        iou_threshold: float = 0.45,
+        intra_op_num_threads: int = 4,
+        providers: Sequence[str] = DEFAULT_PROVIDERS,
+    ) -> None:
+        """
+        Initialize ONNX Runtime session.
+
+        Args:
+            model_path: Path to exported YOLOv8 ONNX model
+            conf_threshold: Confidence threshold for detections
+            iou_threshold: IOU threshold for NMS
+            intra_op_num_threads: ONNX Runtime intra-op thread count
+            providers: Execution providers in order of preference
+
+        Raises:
+            RuntimeError: If onnxruntime is not installed or the model input type
+                is not float32, float16 or uint8
+        """
+        if not ORT_AVAILABLE:
+            raise RuntimeError("onnxruntime is not installed")
+
+        self.model_path = Path(model_path)
+        self.conf_threshold = conf_threshold
+        self.iou_threshold = iou_threshold
+
+        sess_options = ort.SessionOptions()
+        sess_options.intra_op_num_threads = max(1, int(intra_op_num_threads))
+        sess_options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+
+        available = set(ort.get_available_providers())
+        selected = [p for p in providers if p in available] or ["CPUExecutionProvider"]
+        self.session = ort.InferenceSession(
+            str(self.model_path), sess_options=sess_options, providers=selected
+        )
+
+        model_input = self.session.get_inputs()[0]
+        self._input_name = model_input.name
+        self._output_name = self.session.get_outputs()[0].name
+        if model_input.type not in INPUT_DTYPES:
+            raise RuntimeError(f"Unsupported ONNX input type: {model_input.type}")
+        self.input_dtype = np.dtype(INPUT_DTYPES[model_input.type])
+        # Dynamic dims come back as strings; YOLOv8 exports default to 640x640
+        _, _, in_h, in_w = model_input.shape
+        self.input_size: Tuple[int, int] = (
+            in_w if isinstance(in_w, int) else 640,
+            in_h if isinstance(in_h, int) else 640,
+        )
+
+        # Detection runs on several threads; each gets its own input buffer and binding
+        self._local = threading.local()
+
+        logger.info(
+            "ONNX model loaded: %s (providers=%s, input=%dx%d %s, threads=%d)",
+            self.model_path,
+            self.session.get_providers(),
+            self.input_size[0],
+            self.input_size[1],
+            self.input_dtype.name,
+            sess_options.intra_op_num_threads,
+        )
+
+    def get_provider(self) -> str:
+        """Return the execution provider actually in use."""
+        return self.session.get_providers()[0]
+
+    def _get_binding(self) -> Tuple[np.ndarray, "ort.IOBinding"]:
+        """Return this thread's preallocated NCHW input buffer and IO binding."""
+        buf = getattr(self._local, "input", None)
+        if buf is None:
+            in_w, in_h = self.input_size
+            buf = np.zeros((1, 3, in_h, in_w), dtype=self.input_dtype)
+            binding = self.session.io_binding()
+            binding.bind_cpu_input(self._input_name, buf)
+            binding.bind_output(self._output_name)
+            self._local.input = buf
+            self._local.binding = binding
+        return buf, self._local.binding
+
+    def _letterbox_into(self, frame: np.ndarray, buf: np.ndarray) -> Tuple[float, float, float]:
+        """Letterbox a BGR frame into the NCHW buffer; returns (ratio, pad_x, pad_y)."""
+        in_w, in_h = self.input_size
+        h, w = frame.shape[:2]
+        ratio = min(in_w / w, in_h / h)
+        new_w, new_h = int(round(w * ratio)), int(round(h * ratio))
+        pad_x = (in_w - new_w) / 2.0
+        pad_y = (in_h - new_h) / 2.0
+        left, top = int(round(pad_x - 0.1)), int(round(pad_y - 0.1))
+
+        resized = cv2.resize(frame, (new_w, new_h), interpolation=cv2.INTER_LINEAR)
+        canvas = np.full((in_h, in_w, 3), 114, dtype=np.uint8)
+        canvas[top : top + new_h, left : left + new_w] = resized
+
+        # BGR HWC uint8 -> RGB CHW, written in place; float inputs are scaled to [0, 1]
+        rgb = canvas[:, :, ::-1].transpose(2, 0, 1)
+        if buf.dtype == np.uint8:
+            buf[0] = rgb
+        else:
+            np.multiply(rgb, 1.0 / 255.0, out=buf[0], casting="unsafe")
+        return ratio, float(left), float(top)
+
+    def detect_persons(self, frame: np.ndarray, conf: Optional[float] = None) -> List[Dict]:
+        """
+        Detect persons in frame.
+
+        Args:
+            frame: Input frame (BGR)
+            conf: Confidence threshold (uses default if None)
+
+        Returns:
+            List of person detections in the same format as ModelLoader.detect_persons
+        """
+        conf = conf if conf is not None else self.conf_threshold
+        buf, binding = self._get_binding()
+        ratio, pad_x, pad_y = self._letterbox_into(frame, buf)
+
+        self.session.run_with_iobinding(binding)
+        # (1, 4 + num_classes, num_anchors) -> (num_anchors, 4 + num_classes)
+        # FP16 exports also return half-precision outputs; box math is done in float32
+        preds = binding.copy_outputs_to_cpu()[0][0].T.astype(np.float32, copy=False)
+
+        class_scores = preds[:, 4:]
+        class_ids = class_scores.argmax(axis=1)
+        scores = class_scores[np.arange(class_scores.shape[0]), class_ids]
+
+        # Class 0 is 'person' in COCO dataset
+        keep = (class_ids == 0) & (scores >= conf)
+        if not keep.any():
+            return []
+        boxes_cxcywh = preds[keep, :4]
+        scores = scores[keep]
+
+        # cxcywh in letterbox space -> xyxy in frame space
+        boxes = np.empty_like(boxes_cxcywh)
+        boxes[:, 0] = boxes_cxcywh[:, 0] - boxes_cxcywh[:, 2] / 2.0
+        boxes[:, 1] = boxes_cxcywh[:, 1] - boxes_cxcywh[:, 3] / 2.0
+        boxes[:, 2] = boxes_cxcywh[:, 0] + boxes_cxcywh[:, 2] / 2.0
+        boxes[:, 3] = boxes_cxcywh[:, 1] + boxes_cxcywh[:, 3] / 2.0
+        boxes -= np.array([pad_x, pad_y, pad_x, pad_y], dtype=boxes.dtype)
+        boxes /= ratio
+        h, w = frame.shape[:2]
+        boxes[:, [0, 2]] = np.clip(boxes[:, [0, 2]], 0, w)
+        boxes[:, [1, 3]] = np.clip(boxes[:, [1, 3]], 0, h)
+        boxes = boxes.astype(np.float32, copy=False)
+
+        xywh = np.column_stack([boxes[:, :2], boxes[:, 2:] - boxes[:, :2]])
+        kept = cv2.dnn.NMSBoxes(xywh.tolist(), scores.tolist(), conf, self.iou_threshold)
+        kept = np.asarray(kept, dtype=np.int64).reshape(-1)
+
+        return [
+            {
+                "bbox": boxes[i],
+                "confidence": float(scores[i]),
+                "class_id": 0,
+                "class_name": "person",
+            }
+            for i in kept
+        ]
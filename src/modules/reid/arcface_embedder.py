@@ -9,6 +9,7 @@ embedding. Falls back to lightweight embedder if no face found or model missing.
 from __future__ import annotations
 
 import logging
+from typing import List, Sequence
 
 import numpy as np
 
@@ -46,6 +47,12 @@ class ArcFaceEmbedder(ReIDEmbedder):
             logger.warning("Failed to initialize ArcFace: %s", e)
             return None
 
+    def embed_batch(self, crops: Sequence[np.ndarray]) -> List[np.ndarray]:
+        # Face detection runs per image, so ArcFace cannot share one forward pass
+        if self._face_app is None:
+            return super().embed_batch(crops)
+        return [self.embed(crop) for crop in crops]
+
     def embed(self, crop: np.ndarray) -> np.ndarray:
         if self._face_app is None or crop is None or crop.size == 0:
             return super().embed(crop)
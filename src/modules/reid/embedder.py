@@ -9,7 +9,7 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
-from typing import Optional, Tuple
+from typing import List, Optional, Sequence, Tuple
 
 import numpy as np
 
@@ -94,3 +94,44 @@ class ReIDEmbedder:
         tensor = self._preprocess(crop)
         embedding = self._forward_model(tensor)
         return self._l2_normalize(embedding)
+
+    def embed_batch(self, crops: Sequence[np.ndarray]) -> List[np.ndarray]:
+        """
+        Compute normalized embeddings for several person crops at once.
+
+        All crops are resized to the target size and projected with a single
+        matrix multiply instead of one call per crop.
+
+        Args:
+            crops: Person image crops (H, W, 3) in uint8
+
+        Returns:
+            L2-normalized embedding vectors (dim 128), one per crop
+        """
+        if len(crops) == 0:
+            return []
+        if self._proj is None:
+            raise RuntimeError("Projection matrix is not initialized")
+
+        in_dim = self._proj.shape[1]
+        flat = np.stack(
+            [self._preprocess(crop).reshape(-1).astype(np.float32) for crop in crops]
+        )
+        if flat.shape[1] != in_dim:
+            # Unusual channel counts: use the padding/trimming single-crop path
+            return [self.embed(crop) for crop in crops]
+
+        embeddings = flat @ self._proj.T
+        # Rows with invalid input or output become zero vectors, as in embed()
+        invalid = (
+            ~np.isfinite(flat).all(axis=1)
+            | ~flat.any(axis=1)
+            | ~np.isfinite(embeddings).all(axis=1)
+        )
+        if invalid.any():
+            logger.warning("Invalid tensor detected in embed_batch(), returning zero vector")
+            embeddings[invalid] = 0.0
+
+        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+        np.divide(embeddings, norms, out=embeddings, where=norms >= 1e-9)
+        return list(embeddings.astype(np.float32, copy=False))
@@ -7,8 +7,7 @@ from __future__ import annotations
 
 import logging
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Tuple
 
 import numpy as np
 
@@ -61,7 +60,7 @@ def integrate_reid_for_tracks(
 
         processor = ImageProcessor()
         
-        # OPTIMIZED: Filter and prepare detections for parallel processing
+        # Filter detections that need a fresh embedding
         candidates: List[Tuple[Dict, int]] = []  # (detection, track_id)
         
         for det in detections_with_tracks:
@@ -96,21 +95,28 @@ def integrate_reid_for_tracks(
         if len(candidates) == 0:
             return
         
-        # OPTIMIZED: Parallelize embedding computation
-        def _compute_embedding(det_info: Tuple[Dict, int]) -> Tuple[int, np.ndarray, Optional[List[List[float]]]]:
-            """Compute embedding for a single detection in parallel."""
-            det, track_id = det_info
+        # Crop all candidates first, then embed them in one batched call
+        crops: List[np.ndarray] = []
+        crop_track_ids: List[int] = []
+        for det, track_id in candidates:
+            try:
+                x1, y1, x2, y2 = map(int, det.get("bbox"))
+                crop = processor.crop_person_xyxy(frame, x1, y1, x2, y2)
+            except Exception as e:
+                logger.debug("Re-ID crop error for track %d: %s", track_id, e)
+                continue
+            if crop is None:
+                continue
+            crops.append(crop)
+            crop_track_ids.append(track_id)
+
+        if len(crops) == 0:
+            return
+
+        embeddings = embedder.embed_batch(crops)
+
+        for track_id, emb in zip(crop_track_ids, embeddings):
             try:
-                bbox = det.get("bbox")
-                x1, y1, x2, y2 = map(int, bbox)
-                crop = processor.crop_person(
-                    frame, np.array([x1, y1, x2, y2], dtype=np.int32)
-                )
-                if crop is None:
-                    return track_id, None, None
-                
-                emb = embedder.embed(crop)
-                
                 # Multi-embedding support
                 embeddings_list = None
                 if append_mode and max_embeddings > 1:
@@ -126,36 +132,18 @@ def integrate_reid_for_tracks(
                         existing = [prev.embedding.tolist()]
                     existing.append(emb.tolist())
                     embeddings_list = existing[-int(max_embeddings):]
-                
-                return track_id, emb, embeddings_list
+
+                cache.set(
+                    session_id,
+                    ReIDCacheItem(
+                        track_id=track_id,
+                        embedding=emb,
+                        updated_at=time.time(),
+                        embeddings=embeddings_list,
+                        aggregation_method=aggregation_method,
+                    ),
+                )
             except Exception as e:
-                logger.debug("Embedding computation error for track %d: %s", track_id, e)
-                return track_id, None, None
-        
-        # Use ThreadPoolExecutor for parallel embedding (2 workers for Re-ID)
-        embeds_done = 0
-        with ThreadPoolExecutor(max_workers=2, thread_name_prefix="reid-embed") as executor:
-            futures = {executor.submit(_compute_embedding, cand): cand for cand in candidates}
-            
-            for future in as_completed(futures):
-                if embeds_done >= max_per_frame:
-                    break
-                
-                try:
-                    track_id, emb, embeddings_list = future.result(timeout=1.0)
-                    if emb is not None:
-                        cache.set(
-                            session_id,
-                            ReIDCacheItem(
-                                track_id=track_id,
-                                embedding=emb,
-                                updated_at=time.time(),
-                                embeddings=embeddings_list,
-                                aggregation_method=aggregation_method,
-                            ),
-                        )
-                        embeds_done += 1
-                except Exception as e:
-                    logger.debug("Re-ID embedding result error: %s", e)
+                logger.debug("Re-ID embedding result error for track %d: %s", track_id, e)
     except Exception as e:
         logger.warning("Re-ID integration skipped due to error: %s", e)
@@ -5,6 +5,6 @@ Object tracking module.
 Handles multi-object tracking for detected persons.
 """
 
-from .tracker import Tracker
+from .tracker import Tracker, iou_matrix
 
-__all__ = ["Tracker"]
+__all__ = ["Tracker", "iou_matrix"]
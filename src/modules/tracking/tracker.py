@@ -12,6 +12,8 @@ from typing import Dict, List, Optional, Protocol, Tuple
 
 import numpy as np
 
+from src.modules.utils.jit import NUMBA_AVAILABLE, njit
+
 logger = logging.getLogger(__name__)
 
 
@@ -25,6 +27,61 @@ class _SupportsCache(Protocol):
         ...
 
 
+@njit
+def _iou_matrix_kernel(boxes_a: np.ndarray, boxes_b: np.ndarray) -> np.ndarray:
+    """Pairwise IoU loop compiled with Numba (float32 (N, 4) x (M, 4) -> (N, M))."""
+    n = boxes_a.shape[0]
+    m = boxes_b.shape[0]
+    out = np.zeros((n, m), dtype=np.float32)
+    for i in range(n):
+        ax1, ay1, ax2, ay2 = boxes_a[i, 0], boxes_a[i, 1], boxes_a[i, 2], boxes_a[i, 3]
+        area_a = (ax2 - ax1) * (ay2 - ay1)
+        for j in range(m):
+            iw = min(ax2, boxes_b[j, 2]) - max(ax1, boxes_b[j, 0])
+            ih = min(ay2, boxes_b[j, 3]) - max(ay1, boxes_b[j, 1])
+            if iw <= 0.0 or ih <= 0.0:
+                continue
+            inter = iw * ih
+            area_b = (boxes_b[j, 2] - boxes_b[j, 0]) * (boxes_b[j, 3] - boxes_b[j, 1])
+            union = area_a + area_b - inter
+            if union > 0.0:
+                out[i, j] = inter / union
+    return out
+
+
+def iou_matrix(boxes_a: np.ndarray, boxes_b: np.ndarray) -> np.ndarray:
+    """
+    Compute pairwise IoU between two sets of boxes.
+
+    Uses a Numba-compiled loop when Numba is installed, otherwise a
+    broadcast NumPy implementation.
+
+    Args:
+        boxes_a: Array of shape (N, 4) in [x1, y1, x2, y2] format
+        boxes_b: Array of shape (M, 4) in [x1, y1, x2, y2] format
+
+    Returns:
+        IoU matrix of shape (N, M)
+    """
+    a = np.ascontiguousarray(boxes_a, dtype=np.float32).reshape(-1, 4)
+    b = np.ascontiguousarray(boxes_b, dtype=np.float32).reshape(-1, 4)
+
+    if NUMBA_AVAILABLE:
+        return _iou_matrix_kernel(a, b)
+
+    ix1 = np.maximum(a[:, None, 0], b[None, :, 0])
+    iy1 = np.maximum(a[:, None, 1], b[None, :, 1])
+    ix2 = np.minimum(a[:, None, 2], b[None, :, 2])
+    iy2 = np.minimum(a[:, None, 3], b[None, :, 3])
+
+    inter = np.clip(ix2 - ix1, 0.0, None) * np.clip(iy2 - iy1, 0.0, None)
+    area_a = (a[:, 2] - a[:, 0]) * (a[:, 3] - a[:, 1])
+    area_b = (b[:, 2] - b[:, 0]) * (b[:, 3] - b[:, 1])
+    union = area_a[:, None] + area_b[None, :] - inter
+
+    return np.divide(inter, union, out=np.zeros_like(inter), where=union > 0)
+
+
 @dataclass
 class Track:
     """Represents a tracked object."""
@@ -255,25 +312,25 @@ class Tracker:
                     )
 
         # Handle remaining unmatched detections (try Re-ID match; else create new track)
-        for d_idx in list(unmatched_detections):
+        unmatched_order = list(unmatched_detections)
+        reid_ready = (
+            self.reid_enable
+            and self._reid_cache is not None
+            and self._reid_embedder is not None
+            and frame is not None
+            and bool(session_id)
+        )
+        # Embed all unmatched detections in one batch before matching them one by one
+        det_embs = (
+            self._embed_detections(frame, detections, unmatched_order) if reid_ready else {}
+        )
+        for d_idx in unmatched_order:
             bbox = self._convert_detection(detections[d_idx])
             assigned = False
-            if (
-                self.reid_enable
-                and self._reid_cache is not None
-                and self._reid_embedder is not None
-                and frame is not None
-                and session_id
-            ):
+            if reid_ready:
                 try:
-                    xi1, yi1, xi2, yi2 = map(int, bbox.tolist())
-                    xi1 = max(0, xi1)
-                    yi1 = max(0, yi1)
-                    xi2 = max(xi1 + 1, xi2)
-                    yi2 = max(yi1 + 1, yi2)
-                    crop = frame[yi1:yi2, xi1:xi2].copy()
-                    if crop.size > 0:
-                        det_emb = self._reid_embedder.embed(crop)
+                    det_emb = det_embs.get(d_idx)
+                    if det_emb is not None:
                         # Compare against existing tracks' cached embeddings
                         best_sim = -1.0
                         best_t_idx: Optional[int] = None
@@ -329,6 +386,46 @@ class Tracker:
         # Return tracked detections with track_id attached
         return self._attach_track_ids_to_detections(detections, matched_indices)
 
+    def _embed_detections(
+        self, frame: np.ndarray, detections: List[Dict], det_indices: List[int]
+    ) -> Dict[int, np.ndarray]:
+        """
+        Compute Re-ID embeddings for the given detections with one batched call.
+
+        Args:
+            frame: Full frame image
+            detections: All detections of the frame
+            det_indices: Indices into detections to embed
+
+        Returns:
+            Mapping of detection index to embedding (missing for empty crops)
+        """
+        indices: List[int] = []
+        crops: List[np.ndarray] = []
+        for d_idx in det_indices:
+            xi1, yi1, xi2, yi2 = map(int, self._convert_detection(detections[d_idx]).tolist())
+            xi1 = max(0, xi1)
+            yi1 = max(0, yi1)
+            xi2 = max(xi1 + 1, xi2)
+            yi2 = max(yi1 + 1, yi2)
+            crop = frame[yi1:yi2, xi1:xi2]
+            if crop.size > 0:
+                indices.append(d_idx)
+                crops.append(crop)
+        if not crops:
+            return {}
+
+        try:
+            embed_batch = getattr(self._reid_embedder, "embed_batch", None)
+            if embed_batch is not None:
+                embeddings = embed_batch(crops)
+            else:
+                embeddings = [self._reid_embedder.embed(crop) for crop in crops]
+        except Exception as e:
+            logger.debug("Re-ID embedding for unmatched detections failed: %s", e)
+            return {}
+        return dict(zip(indices, embeddings))
+
     @staticmethod
     def _cosine_similarity(a: np.ndarray, b: np.ndarray, eps: float = 1e-9) -> float:
         denom = float(np.linalg.norm(a) * np.linalg.norm(b))
@@ -376,14 +473,10 @@ class Tracker:
         if len(detections) == 0 or len(self.tracks) == 0:
             return np.empty((0, 0))
 
-        cost_matrix = np.zeros((len(detections), len(self.tracks)))
-
-        for d_idx, detection in enumerate(detections):
-            detection_bbox = self._convert_detection(detection)
-            for t_idx, track in enumerate(self.tracks):
-                cost_matrix[d_idx][t_idx] = self._iou(detection_bbox, track.bbox)
+        detection_boxes = np.stack([self._convert_detection(d) for d in detections])
+        track_boxes = np.stack([track.bbox for track in self.tracks])
 
-        return cost_matrix
+        return iou_matrix(detection_boxes, track_boxes)
 
     def _associate_detections_to_tracks(
         self, cost_matrix: np.ndarray
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Out-of-process display window.
+
+``cv2.imshow``/``cv2.waitKey`` pump GUI events on the calling thread and can
+stall under load. ``DisplaySink`` moves the window into a child process: the
+parent copies each frame into a shared-memory block and sends a small
+descriptor over a pipe, and the child shows it and acknowledges. A frame is
+only handed over once the previous one was acknowledged, so a slow window
+drops frames instead of blocking the caller.
+"""
+
+import logging
+import multiprocessing as mp
+from multiprocessing import resource_tracker, shared_memory
+from multiprocessing.connection import Connection
+from typing import Any, Callable, Optional, Tuple
+
+import cv2
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+def _attach_untracked(name: str) -> shared_memory.SharedMemory:
+    """
+    Attach to a segment created by another process without tracking it here.
+
+    Attaching normally registers the segment with the resource tracker as if this
+    process owned it. The creating DisplaySink owns it and unlinks it, so the
+    display process must neither register it (leaked-segment warnings or a second
+    unlink) nor unregister it afterwards, since spawned children share the
+    parent's tracker and that would drop the owner's entry.
+
+    Args:
+        name: Name of the existing segment
+
+    Returns:
+        Attached shared memory block (close it, never unlink it)
+    """
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)  # type: ignore[call-arg]
+    except TypeError:
+        pass  # Python < 3.13 has no track flag
+    register = resource_tracker.register
+    resource_tracker.register = lambda *args, **kwargs: None  # type: ignore[assignment]
+    try:
+        return shared_memory.SharedMemory(name=name)
+    finally:
+        resource_tracker.register = register  # type: ignore[assignment]
+
+
+class _FrameReceiver:
+    """Display-process side of the frame protocol: maps descriptors to frame views."""
+
+    def __init__(self) -> None:
+        self._shm: Optional[shared_memory.SharedMemory] = None
+
+    def frame(self, msg: Tuple[str, Tuple[int, ...], str]) -> np.ndarray:
+        """
+        Return a view of the frame described by a message from DisplaySink.show.
+
+        Args:
+            msg: (segment name, shape, dtype string)
+
+        Returns:
+            Frame view into shared memory, valid until the frame is acknowledged
+        """
+        shm_name, shape, dtype = msg
+        if self._shm is None or self._shm.name != shm_name:
+            self.close()
+            self._shm = _attach_untracked(shm_name)
+        return np.ndarray(shape, dtype=np.dtype(dtype), buffer=self._shm.buf)
+
+    def close(self) -> None:
+        """Detach from the current segment."""
+        if self._shm is not None:
+            self._shm.close()
+            self._shm = None
+
+
+def _display_loop(conn: Connection, window_name: str, quit_event: Any) -> None:
+    """Child process: show frames as they arrive and watch for the 'q' key."""
+    receiver = _FrameReceiver()
+    try:
+        while True:
+            if conn.poll(0.01):
+                msg = conn.recv()
+                if msg is None:
+                    break
+                # imshow copies the pixels, so the block can be reused after the ack
+                cv2.imshow(window_name, receiver.frame(msg))
+                conn.send(True)
+            if (cv2.waitKey(1) & 0xFF) == ord("q"):
+                quit_event.set()
+    except (EOFError, KeyboardInterrupt):
+        pass
+    finally:
+        receiver.close()
+        cv2.destroyAllWindows()
+
+
+class DisplaySink:
+    """Shows frames in an OpenCV window owned by a separate process."""
+
+    def __init__(
+        self,
+        window_name: str,
+        loop: Callable[[Connection, str, Any], None] = _display_loop,
+    ) -> None:
+        """
+        Start the display process.
+
+        Args:
+            window_name: Title of the OpenCV window
+            loop: Display process entry point taking (conn, window_name, quit_event);
+                must be importable by a spawned process
+        """
+        ctx = mp.get_context("spawn")
+        self._conn, child_conn = ctx.Pipe()
+        self._quit = ctx.Event()
+        self._proc = ctx.Process(
+            target=loop,
+            args=(child_conn, window_name, self._quit),
+            name="display",
+            daemon=True,
+        )
+        self._proc.start()
+        child_conn.close()
+
+        self._shm: Optional[shared_memory.SharedMemory] = None
+        self._layout: Optional[Tuple[Tuple[int, ...], str]] = None
+        self._idle = True
+
+    @property
+    def quit_requested(self) -> bool:
+        """Whether 'q' was pressed in the display window."""
+        return self._quit.is_set()
+
+    def show(self, frame: np.ndarray) -> bool:
+        """
+        Hand a frame to the display process unless it is still busy.
+
+        Args:
+            frame: Image to show (copied into shared memory)
+
+        Returns:
+            True if the frame was sent, False if it was dropped
+        """
+        try:
+            while self._conn.poll():
+                self._conn.recv()
+                self._idle = True
+        except (EOFError, OSError):
+            return False
+        if not self._idle:
+            return False
+
+        layout = (frame.shape, frame.dtype.str)
+        if self._shm is None or self._layout != layout:
+            # The child is idle, so the old block can go; it re-attaches by name
+            self._release_shm()
+            self._shm = shared_memory.SharedMemory(create=True, size=max(1, frame.nbytes))
+            self._layout = layout
+        np.ndarray(frame.shape, dtype=frame.dtype, buffer=self._shm.buf)[...] = frame
+        try:
+            self._conn.send((self._shm.name, frame.shape, frame.dtype.str))
+        except (BrokenPipeError, OSError) as e:
+            logger.debug("Display process unavailable: %s", e)
+            return False
+        self._idle = False
+        return True
+
+    def _release_shm(self) -> None:
+        if self._shm is not None:
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
+
+    def close(self) -> None:
+        """Stop the display process and free the shared frame buffer."""
+        try:
+            self._conn.send(None)
+        except (BrokenPipeError, OSError):
+            pass
+        self._proc.join(timeout=2.0)
+        if self._proc.is_alive():
+            self._proc.terminate()
+            self._proc.join(timeout=1.0)
+        self._conn.close()
+        self._release_shm()
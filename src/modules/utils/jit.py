@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""
+Optional Numba JIT helpers.
+
+Exposes an ``njit`` decorator that compiles with Numba when it is installed
+and falls back to returning the plain Python function otherwise, so hot-loop
+kernels can be written once and still run without Numba.
+"""
+
+import logging
+from typing import Any, Callable
+
+logger = logging.getLogger(__name__)
+
+try:
+    import numba
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def njit(func: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Compile a numeric kernel in nopython mode if Numba is available.
+
+    Kernels are compiled with ``cache=True`` (no recompilation across runs),
+    ``nogil=True`` (safe to call concurrently from worker threads) and
+    ``fastmath=True``.
+
+    Args:
+        func: Function containing only NumPy/scalar operations
+
+    Returns:
+        Compiled dispatcher, or ``func`` unchanged when Numba is missing
+    """
+    if not NUMBA_AVAILABLE:
+        return func
+    return numba.njit(cache=True, nogil=True, fastmath=True)(func)
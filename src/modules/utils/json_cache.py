@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Memoized JSON file loading.
+
+Config files are parsed once per process and re-parsed only when their
+modification time or size changes. Callers share the returned object and
+must treat it as read-only. Files are parsed with ``orjson`` when it is
+installed and with the standard library otherwise.
+"""
+
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, Tuple, Union
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Both parsers take bytes; orjson.JSONDecodeError subclasses json.JSONDecodeError
+_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+# Resolved path -> ((st_mtime_ns, st_size), parsed document)
+_PARSED_JSON_CACHE: Dict[str, Tuple[Tuple[int, int], Any]] = {}
+_cache_lock = threading.Lock()
+
+
+def load_json_cached(path: Union[str, Path]) -> Any:
+    """
+    Parse a JSON file, reusing the previous result while the file is unchanged.
+
+    Args:
+        path: Path to the JSON file
+
+    Returns:
+        Parsed document (shared between callers; do not mutate)
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+        OSError: If the file cannot be stat'ed or read
+        json.JSONDecodeError: If the file is not valid JSON
+    """
+    # abspath is pure string work; resolve() would lstat every path component
+    key = os.path.abspath(path)
+    st = os.stat(key)
+    version = (st.st_mtime_ns, st.st_size)
+    with _cache_lock:
+        cached = _PARSED_JSON_CACHE.get(key)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+
+    data = _loads(Path(key).read_bytes())
+    with _cache_lock:
+        _PARSED_JSON_CACHE[key] = (version, data)
+    logger.debug("Parsed JSON config %s", key)
+    return data
+
+
+def clear_json_cache() -> None:
+    """Drop all memoized documents."""
+    with _cache_lock:
+        _PARSED_JSON_CACHE.clear()
@@ -7,16 +7,22 @@ tracking, gender classification, and data storage integration.
 """
 
 import argparse
+import atexit
+import fcntl
+import functools
 import logging
+import os
 import queue
 import signal
 import sys
 import threading
 import time
+from collections import ChainMap, deque
 from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, cast
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple, cast
 
 import cv2  # noqa: E402
 import numpy as np
@@ -25,10 +31,9 @@ import torch  # noqa: E402
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from src.modules.camera.camera_config import load_camera_config  # noqa: E402
-from src.modules.camera.camera_reader import CameraReader  # noqa: E402
+from src.modules.camera.camera_config import CameraConfigError, load_camera_config  # noqa: E402
+from src.modules.camera.camera_reader import CameraReader, redact_rtsp_url  # noqa: E402
 from src.modules.camera.camera_reader import CameraReaderError
-from src.modules.database.models import PersonDetection  # noqa: E402
 from src.modules.database.postgres_manager import PostgresManager  # noqa: E402
 from src.modules.database.redis_manager import RedisManager  # noqa: E402
 
@@ -47,13 +52,16 @@ from src.modules.detection.face_detector_retinaface import (  # noqa: E402
 )
 from src.modules.detection.image_processor import ImageProcessor  # noqa: E402
 from src.modules.reid.arcface_embedder import ArcFaceEmbedder  # noqa: E402
-from src.modules.reid.cache import ReIDCache  # noqa: E402
+from src.modules.reid.cache import ReIDCache, ReIDCacheItem  # noqa: E402
 from src.modules.reid.embedder import ReIDEmbedder  # noqa: E402
 from src.modules.reid.integrator import integrate_reid_for_tracks  # noqa: E402
-from src.modules.tracking.tracker import Tracker  # noqa: E402
-from src.modules.counter.zone_counter import ZoneCounter  # noqa: E402
+from src.modules.tracking.tracker import Tracker, iou_matrix  # noqa: E402
+from src.modules.counter.zone_counter import ZoneCounter, point_in_polygon  # noqa: E402
 from src.modules.counter.daily_person_counter import DailyPersonCounter  # noqa: E402
 from src.modules.counter.person_identity_manager import PersonIdentityManager  # noqa: E402
+from src.modules.utils.display_sink import DisplaySink  # noqa: E402
+from src.modules.utils.jit import NUMBA_AVAILABLE  # noqa: E402
+from src.modules.utils.json_cache import load_json_cached  # noqa: E402
 
 logging.basicConfig(
     level=logging.INFO,
@@ -61,6 +69,82 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Resolved once per process; every channel processor reuses it
+_MPS_DEVICE = "mps" if torch.backends.mps.is_available() else "cpu"
+
+# Number of slots in the per-track face bbox cache (live tracks per channel stay well below this)
+FACE_BBOX_CACHE_SLOTS = 256
+
+# Maximum number of annotated frames waiting on the render thread
+RENDER_QUEUE_DEPTH = 2
+
+# Bound on remembered (embedding version, person_id) pairs; cleared when reached
+PID_WATERMARK_MAX_TRACKS = 4096
+
+# Timed runs per path when deciding between OpenCL and CPU detection downscale
+OPENCL_CALIBRATION_RUNS = 5
+
+# Largest gender classifier input side (OpenCV DNN 227, PyTorch 224); gender crops are
+# downscaled no further than this on their shorter side
+GENDER_CLASSIFIER_INPUT_SIDE = 227
+
+# Pending DB writes held for the writer thread; when full, new detection writes are
+# dropped and counter event writes wait for room
+DB_QUEUE_SIZE = 64
+
+# Minimum seconds between warnings about dropped DB writes
+DB_DROP_WARN_INTERVAL_S = 5.0
+
+# Initial capacity of the per-track arrays indexed by track id (grown on demand)
+TRACK_SLOTS = 1 << 16
+
+# Per-track gender codes; -1 means not classified yet
+GENDER_LABELS = ("M", "F")
+GENDER_CODES = {label: code for code, label in enumerate(GENDER_LABELS)}
+# Code of a track whose voted gender is "Unknown" (stored as such, unlike -1)
+GENDER_CODE_UNKNOWN = -2
+
+
+def _now_ms() -> int:
+    """Monotonic clock in integer milliseconds (immune to wall-clock adjustments)."""
+    return time.monotonic_ns() // 1_000_000
+
+
+# Processor settings of the gender_main_v1 preset; main() adds db_dsn and redis_url
+GENDER_MAIN_V1_PRESET: Mapping[str, Any] = MappingProxyType(
+    {
+        "reid_enable": True,
+        "reid_every_k": 20,
+        "reid_ttl_seconds": 86400,  # 24 hours = 24 * 60 * 60 seconds (for daily person counting)
+        "reid_similarity_threshold": 0.65,
+        "reid_aggregation_method": "avg_sim",
+        "reid_append_mode": True,
+        "reid_max_embeddings": 3,
+        "gender_enable": True,
+        "gender_every_k": 15,
+        "gender_max_per_frame": 4,
+        "gender_model_type": "timm_mobile",
+        "gender_min_confidence": 0.50,
+        "gender_female_min_confidence": 0.50,
+        "gender_male_min_confidence": 0.50,
+        "gender_voting_window": 35,
+        "gender_adaptive_enabled": True,
+        "gender_queue_high_watermark": 200,
+        "gender_queue_low_watermark": 100,
+        "db_enable": True,
+        "db_batch_size": 200,
+        "db_flush_interval_ms": 500,
+        "redis_enable": True,
+    }
+)
+
+
+def _bbox_xyxy_fast(bbox: Any) -> Optional[Tuple[Any, Any, Any, Any]]:
+    """Unpack a list/tuple/ndarray bbox as (x1, y1, x2, y2); None for any other form."""
+    if isinstance(bbox, (list, tuple, np.ndarray)) and len(bbox) >= 4:
+        return bbox[0], bbox[1], bbox[2], bbox[3]
+    return None
+
 
 class LiveCameraProcessor:
     """Process live RTSP camera streams with detection pipeline."""
@@ -98,6 +182,7 @@ class LiveCameraProcessor:
         gender_face_every_k: int = 5,
         gender_cache_ttl_frames: int = 90,
         gender_adaptive_enabled: bool = False,
+        gender_lock_confidence: Optional[float] = None,
         gender_queue_high_watermark: int = 200,
         gender_queue_low_watermark: int = 100,
         reid_max_embeddings: int = 1,
@@ -113,8 +198,12 @@ class LiveCameraProcessor:
         reconnect_interval_seconds: float = 5.0,
         display: bool = False,
         display_fps: float = 15.0,
+        display_process: bool = False,
         counter_zones: Optional[List[Dict[str, Any]]] = None,
         detect_every_n: Optional[int] = None,
+        opencl_resize: bool = False,
+        reader_decimation: bool = False,
+        hw_decode: bool = False,
     ) -> None:
         """
         Initialize live camera processor.
@@ -129,6 +218,14 @@ class LiveCameraProcessor:
             conf_threshold: Detection confidence threshold
             max_frames: Maximum frames to process (None = unlimited)
             reconnect_interval_seconds: Seconds to wait before reconnecting
+            display_process: Show the display window from a separate process so GUI
+                event handling never runs on the processing thread
+            opencl_resize: Downscale detection frames through cv2.UMat (OpenCL) when available
+            reader_decimation: Let the frame reader grab (not decode) frames that are
+                neither detection nor display frames; frame numbers then follow the source
+            hw_decode: Decode the RTSP stream with FFmpeg hardware acceleration when available
+            gender_lock_confidence: Stop re-classifying a track once its voted gender
+                confidence reaches this value (None = always re-classify)
         """
         self.camera_id = int(camera_id)
         self.channel_id = int(channel_id)
@@ -140,6 +237,7 @@ class LiveCameraProcessor:
         base_output.mkdir(parents=True, exist_ok=True)
         if run_id is None:
             run_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.run_id = str(run_id)
         self.output_dir = base_output / str(run_id)
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
@@ -302,8 +400,12 @@ class LiveCameraProcessor:
                 self.redis_enable = False
 
         # DB buffering
-        self._db_buffer: List[PersonDetection] = []
-        self._last_db_flush_ms: float = time.time() * 1000.0
+        # Detection rows in DETECTION_COLUMNS order, flushed in batches
+        self._db_buffer: List[tuple] = []
+        # Integer monotonic milliseconds (_now_ms)
+        self._last_db_flush_ms: int = _now_ms()
+        # Main-thread deadline for queueing the next time-based flush check
+        self._next_db_flush_check_ms: int = self._last_db_flush_ms + self.db_flush_interval_ms
 
         # Initialize Gender and Age components (PyTorch-based, no TensorFlow conflicts)
         self.gender_enable = bool(gender_enable)
@@ -320,8 +422,9 @@ class LiveCameraProcessor:
             try:
                 # FaceGenderClassifier uses PyTorch MobileNetV2 (no TensorFlow)
                 self.face_gender_classifier = FaceGenderClassifier(
-                    device="mps" if torch.backends.mps.is_available() else "cpu",
+                    device=_MPS_DEVICE,
                     min_confidence=0.65,  # Increased threshold for better accuracy
+                    quantize=_MPS_DEVICE == "cpu",  # int8 dynamic quantization on CPU fallback
                 )
                 logger.info("FaceGenderClassifier initialized (PyTorch-based)")
             except Exception as e:
@@ -380,12 +483,20 @@ class LiveCameraProcessor:
             self.gender_metrics = None
             logger.info("Gender classification disabled by config")
         self.gender_max_per_frame = gender_max_per_frame
-        self._pending_gender_tasks: List[str] = []
+        # (session_id, track_id, frame_num) of enqueued gender crops
+        self._pending_gender_tasks: "deque[Tuple[str, int, int]]" = deque()
         self.gender_face_every_k = max(1, int(gender_face_every_k))
         self.gender_cache_ttl_frames = max(1, int(gender_cache_ttl_frames))
-        self._face_bbox_cache: Dict[int, np.ndarray] = {}
-        self._face_bbox_cache_frame: Dict[int, int] = {}
+        # Last usable face bbox per track, stored as SoA arrays indexed by slot.
+        # A frame value of -1 marks a free slot.
+        self._face_bbox_cache_arr = np.zeros((FACE_BBOX_CACHE_SLOTS, 4), dtype=np.int32)
+        self._face_bbox_cache_frame_arr = np.full(FACE_BBOX_CACHE_SLOTS, -1, dtype=np.int32)
+        self._face_bbox_cache_owner_arr = np.full(FACE_BBOX_CACHE_SLOTS, -1, dtype=np.int64)
+        self._face_bbox_cache_slot: Dict[int, int] = {}
         self.gender_adaptive_enabled = bool(gender_adaptive_enabled)
+        self.gender_lock_confidence = (
+            float(gender_lock_confidence) if gender_lock_confidence is not None else None
+        )
         self.gender_queue_high_watermark = int(gender_queue_high_watermark)
         self.gender_queue_low_watermark = int(gender_queue_low_watermark)
 
@@ -395,10 +506,32 @@ class LiveCameraProcessor:
         self.display_frame_skip = max(
             1, int(24.0 / self.display_fps)
         )  # Skip frames for display
-        self._last_display_time = 0.0
+        # Display throttle in integer monotonic ms; -1 means nothing shown yet
+        self._display_interval_ms = int(1000 / self.display_fps)
+        self._last_display_time_ms = -1
         self._display_frame_count = 0
+        self._last_gender_frame = -1
+
+        # Track ids are small dense ints, so per-track state lives in arrays indexed by id
+        # rather than in hashed sets/dicts
+        self._seen_tracks = np.zeros(TRACK_SLOTS, dtype=np.uint8)
+        self._track_gender = np.full(TRACK_SLOTS, -1, dtype=np.int8)
+        self._track_gender_conf = np.zeros(TRACK_SLOTS, dtype=np.float32)
+        # track_id -> (cached embedding updated_at, person_id) of the last identity lookup
+        self._pid_watermark: Dict[int, Tuple[float, Optional[str]]] = {}
         # Resize for display to reduce lag (max width 1280)
         self.display_max_width = 1280
+        # Display size per source (w, h), computed on the render thread on first use
+        self._display_dims: Dict[Tuple[int, int], Tuple[int, int]] = {}
+        # Resize destinations reused round-robin by the render thread; one more than the
+        # pending render limit so the frame being shown is never written to
+        self._display_buffers: List[np.ndarray] = []
+        self._display_buffer_idx = 0
+        self._display_sink: Optional[DisplaySink] = (
+            DisplaySink(f"Live Stream - Channel {self.channel_id}")
+            if self.display and display_process
+            else None
+        )
 
         # Counter initialization (PID disabled) — always use ZoneCounter
         # Zones will be loaded from camera config if counter is enabled
@@ -430,44 +563,149 @@ class LiveCameraProcessor:
         else:
             self.detect_every_n = 4  # Detect every 4 frames for others (4x speed boost, tracker handles continuity well)
         self._last_detect_frame = -1
-        self._cached_detections = []  # Cache detections for skipped frames
+        self._cached_detections: List[Dict] = []  # Latest completed detection result
+
+        # Detection input size; target size and scale factors are computed once per source size
+        self._detect_size: Tuple[int, int] = (480, 360)
+        self._detect_resize_plan: Optional[Tuple[Tuple[int, int], bool, float, float, int]] = None
+        # Reusable resize destinations; a buffer is free again once its detection future is done
+        self._detect_buffers: List[np.ndarray] = []
+        self._detect_buffer_futures: List[Optional[Future]] = []
+        self._last_detect_buffer: Optional[int] = None
+        # Requested and available; whether it is actually used is re-measured per source size
+        self._opencl_resize_enabled = bool(opencl_resize) and cv2.ocl.haveOpenCL()
+        self._use_opencl_resize = self._opencl_resize_enabled
+        if self._opencl_resize_enabled:
+            cv2.ocl.setUseOpenCL(True)
+            logger.info("Detection downscale using OpenCL (cv2.UMat)")
+        elif opencl_resize:
+            logger.warning("OpenCL not available, detection downscale stays on CPU")
 
         # Multi-threading for parallel processing
         # OPTIMIZED: Increased workers for better parallelization
-        import os
-
         num_cores = os.cpu_count() or 4
         # Use 2 workers for detection (can process multiple frames in parallel)
         detection_workers = min(2, max(1, num_cores // 2))
 
-        self._frame_queue: queue.Queue[Optional[np.ndarray]] = queue.Queue(maxsize=2)
-        self._detection_queue: queue.Queue[Tuple[int, List[Dict]]] = queue.Queue(
+        # Cap OpenCV's internal pool so detection workers x cv2 threads x torch threads
+        # stays around the core count instead of oversubscribing the CPU
+        cv2_threads = max(1, num_cores // (detection_workers + 2))
+        cv2.setNumThreads(cv2_threads)
+        logger.info("OpenCV threads limited to %d", cv2_threads)
+
+        # When YOLO and the gender models both run on an accelerator, torch's CPU pool
+        # only does glue work and would compete with the worker threads for cores
+        if (
+            self.detector is not None
+            and self.detector.model_loader.get_device() != "cpu"
+            and _MPS_DEVICE != "cpu"
+        ):
+            torch.set_num_threads(1)
+            logger.info("Torch CPU threads limited to 1 (inference on %s)", _MPS_DEVICE)
+
+        self._frame_queue: queue.Queue[Optional[Tuple[int, np.ndarray]]] = queue.Queue(
             maxsize=2
         )
+        # Source frame index shared by the reader thread and the direct-read fallback
+        self._source_frame_idx = 0
+        self.reader_decimation = bool(reader_decimation)
+        self.hw_decode = bool(hw_decode)
         self._detection_executor = ThreadPoolExecutor(
             max_workers=detection_workers, thread_name_prefix="detection"
         )
-        self._db_executor = (
-            ThreadPoolExecutor(max_workers=1, thread_name_prefix="db-writer")
-            if db_enable
+        # DB writes run in order on one writer thread fed by a bounded queue
+        # (None is the shutdown sentinel)
+        self._db_queue: "queue.Queue[Optional[Tuple[Callable[..., None], tuple]]]" = (
+            queue.Queue(maxsize=DB_QUEUE_SIZE)
+        )
+        self._db_thread: Optional[threading.Thread] = None
+        self._db_dropped_unreported = 0
+        self._db_drop_warned_at = float("-inf")
+        if self.db_enable:
+            self._db_thread = threading.Thread(
+                target=self._db_writer_worker, name="db-writer", daemon=True
+            )
+            self._db_thread.start()
+        # Annotation runs on its own thread so the next frame can proceed meanwhile;
+        # at most RENDER_QUEUE_DEPTH renders are pending (oldest dropped first)
+        self._render_executor = (
+            ThreadPoolExecutor(max_workers=1, thread_name_prefix="render")
+            if self.display
             else None
         )
+        self._render_futures: "deque[Future]" = deque()
         logger.info("Detection executor initialized with %d workers", detection_workers)
 
         # Threading synchronization
         self._frame_reader_thread: Optional[threading.Thread] = None
-        self._detection_future: Optional[Future] = None
+        # Double-buffered detection: the active slot is being computed/consumed
+        # while the staged slot holds the next submitted frame.
+        self._fut_active: Optional[Future] = None
+        self._fut_staged: Optional[Future] = None
         self._pending_frame_num = 0
 
         # Shutdown flag
         self._shutdown_requested = False
         self._shutdown_lock = threading.Lock()
 
+        # Hot-path counters, summarized once per interval by the stats thread
+        self._stats: Dict[str, int] = {
+            "frames": 0,
+            "detection_frames": 0,
+            "detections": 0,
+            "gender_results": 0,
+            "gender_male": 0,
+            "gender_female": 0,
+            "db_dropped": 0,
+        }
+        self._stats_lock = threading.Lock()
+        self._stats_interval_s = 1.0
+        self._stats_stop = threading.Event()
+        self._stats_thread: Optional[threading.Thread] = None
+
+        self._warmup()
+
         logger.info("Live camera processor initialized")
         # logger.info("Device: %s", self.detector.model_loader.get_device())  # Disabled - using face detection
         logger.info("Using OpenCV DNN face detection (no YOLOv8 device needed)")
         # logger.info("MPS enabled: %s", self.detector.model_loader.is_mps_enabled())  # Disabled
 
+    def _warmup(self) -> None:
+        """Run every model once on dummy input so the first live frame doesn't pay
+        for lazy device kernel setup, JIT compilation or graph tracing."""
+        start = time.time()
+
+        # Numba kernels
+        if NUMBA_AVAILABLE:
+            iou_matrix(np.zeros((1, 4), dtype=np.float32), np.zeros((1, 4), dtype=np.float32))
+            point_in_polygon((0.0, 0.0), [(0.0, 0.0), (1.0, 0.0), (1.0, 1.0)])
+
+        detect_w, detect_h = self._detect_size
+        dummy = np.zeros((detect_h, detect_w, 3), dtype=np.uint8)
+        crop = dummy[:64, :64]
+
+        if self.detector is not None:
+            try:
+                self.detector.detect(dummy, return_image=False)
+                self.detector.reset_statistics()
+            except Exception as e:
+                logger.debug("Detector warmup failed: %s", e)
+
+        gender_model = self.gender_opencv or self.face_gender_classifier
+        if gender_model is not None:
+            try:
+                gender_model.classify_batch([crop])
+            except Exception as e:
+                logger.debug("Gender warmup failed: %s", e)
+
+        if self.reid_embedder is not None:
+            try:
+                self.reid_embedder.embed(dummy[:128, :64])
+            except Exception as e:
+                logger.debug("Re-ID warmup failed: %s", e)
+
+        logger.info("Model warmup finished in %.2fs", time.time() - start)
+
     def _frame_reader_worker(self, camera_reader: CameraReader) -> None:
         """Worker thread to continuously read frames from camera."""
         consecutive_failures = 0
@@ -475,6 +713,15 @@ class LiveCameraProcessor:
 
         while not self._shutdown_requested:
             try:
+                frame_idx = self._source_frame_idx + 1
+                if self.reader_decimation and not self._is_frame_used(frame_idx):
+                    # Nobody consumes this frame: advance the stream without decoding
+                    if camera_reader.grab_frame():
+                        self._source_frame_idx = frame_idx
+                        consecutive_failures = 0
+                        continue
+                    # Let read_frame() below handle reconnects on failure
+
                 frame = camera_reader.read_frame()
                 if frame is None:
                     consecutive_failures += 1
@@ -485,15 +732,16 @@ class LiveCameraProcessor:
                     continue
 
                 consecutive_failures = 0
+                self._source_frame_idx = frame_idx
 
                 # Put frame in queue (non-blocking, drop if full to prevent lag)
                 try:
-                    self._frame_queue.put_nowait(frame)
+                    self._frame_queue.put_nowait((frame_idx, frame))
                 except queue.Full:
                     # Drop oldest frame if queue is full (prevent memory buildup)
                     try:
                         self._frame_queue.get_nowait()
-                        self._frame_queue.put_nowait(frame)
+                        self._frame_queue.put_nowait((frame_idx, frame))
                     except queue.Empty:
                         pass
 
@@ -507,6 +755,185 @@ class LiveCameraProcessor:
         except queue.Full:
             pass
 
+    def _bump_stats(self, **increments: int) -> None:
+        """Add to the hot-path counters (cheap; no logging on the caller's thread)."""
+        with self._stats_lock:
+            for key, value in increments.items():
+                self._stats[key] += value
+
+    def _stats_worker(self) -> None:
+        """Emit one aggregated log line per interval until stopped."""
+        last = dict(self._stats)
+        last_time = time.monotonic()
+        while not self._stats_stop.wait(self._stats_interval_s):
+            now = time.monotonic()
+            with self._stats_lock:
+                current = dict(self._stats)
+            dt = max(now - last_time, 1e-6)
+            gender_qlen = 0
+            if self.gender_worker is not None:
+                gender_qlen = self.gender_worker.get_queue_size()
+            logger.info(
+                "Stats: frames=%d (%.1f FPS), detection frames/s=%.1f, detections/s=%.1f, "
+                "gender results/s=%.1f, gender queue=%d, tracks=%d, db writes dropped=%d",
+                current["frames"],
+                (current["frames"] - last["frames"]) / dt,
+                (current["detection_frames"] - last["detection_frames"]) / dt,
+                (current["detections"] - last["detections"]) / dt,
+                (current["gender_results"] - last["gender_results"]) / dt,
+                gender_qlen,
+                self._seen_track_count(),
+                current["db_dropped"],
+            )
+            # Per-result gender logs are DEBUG only; INFO gets one summary per interval
+            gender_results = current["gender_results"] - last["gender_results"]
+            if gender_results > 0:
+                male = current["gender_male"] - last["gender_male"]
+                female = current["gender_female"] - last["gender_female"]
+                logger.info(
+                    "Gender: results=%d M=%d F=%d Unknown=%d in last %.1fs",
+                    gender_results,
+                    male,
+                    female,
+                    gender_results - male - female,
+                    dt,
+                )
+            last = current
+            last_time = now
+
+    def _resolve_person_id(self, track_id: int, cached_item: ReIDCacheItem) -> Optional[str]:
+        """
+        Resolve person_id for a track from its cached Re-ID embedding.
+
+        The identity manager is only queried when the cached embedding changed
+        (new ``updated_at``) since the last lookup for this track.
+
+        Args:
+            track_id: Track ID
+            cached_item: Re-ID cache entry of the track
+
+        Returns:
+            person_id or None
+        """
+        last = self._pid_watermark.get(track_id)
+        if last is not None and last[0] == cached_item.updated_at:
+            return last[1]
+        pid = self.person_identity_manager.get_or_assign_person_id(
+            channel_id=self.channel_id,
+            track_id=track_id,
+            embedding=cached_item.embedding,
+        )
+        if len(self._pid_watermark) >= PID_WATERMARK_MAX_TRACKS:
+            self._pid_watermark.clear()
+        self._pid_watermark[track_id] = (cached_item.updated_at, pid)
+        return pid
+
+    def _ensure_track_capacity(self, max_id: int) -> None:
+        """Grow the per-track arrays so that max_id is a valid index."""
+        size = self._seen_tracks.shape[0]
+        if max_id < size:
+            return
+        new_size = max(max_id + 1, size * 2)
+        for name, fill in (("_seen_tracks", 0), ("_track_gender", -1), ("_track_gender_conf", 0)):
+            old = getattr(self, name)
+            grown = np.full(new_size, fill, dtype=old.dtype)
+            grown[:size] = old
+            setattr(self, name, grown)
+
+    @staticmethod
+    def _track_id_array(detections: List[Dict]) -> np.ndarray:
+        """Track id of each detection as an int64 array, -1 where untracked."""
+        return np.fromiter(
+            (-1 if d.get("track_id") is None else int(d["track_id"]) for d in detections),
+            dtype=np.int64,
+            count=len(detections),
+        )
+
+    def _mark_tracks_seen(self, track_ids: np.ndarray) -> None:
+        """Set the seen flag for every tracked id, growing the arrays if needed."""
+        ids_arr = track_ids[track_ids >= 0]
+        if ids_arr.size == 0:
+            return
+        self._ensure_track_capacity(int(ids_arr.max()))
+        self._seen_tracks[ids_arr] = 1
+
+    def _set_track_gender(self, track_id: int, gender: str, confidence: float) -> None:
+        """Store the voted gender label and confidence of a track."""
+        self._ensure_track_capacity(track_id)
+        self._track_gender[track_id] = GENDER_CODES.get(gender, GENDER_CODE_UNKNOWN)
+        self._track_gender_conf[track_id] = confidence
+
+    def _get_track_genders(self, track_ids: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Snapshot gender codes and confidences for a frame's tracks.
+
+        Args:
+            track_ids: Track id per detection, -1 where untracked
+
+        Returns:
+            (codes, confidences) aligned with track_ids; code -1 for unclassified or
+            untracked, GENDER_CODE_UNKNOWN for a voted "Unknown"
+        """
+        codes = np.full(track_ids.shape[0], -1, dtype=np.int8)
+        confs = np.zeros(track_ids.shape[0], dtype=np.float32)
+        known = (track_ids >= 0) & (track_ids < self._track_gender.shape[0])
+        codes[known] = self._track_gender[track_ids[known]]
+        confs[known] = self._track_gender_conf[track_ids[known]]
+        return codes, confs
+
+    @staticmethod
+    def _vote_gender(predictions: List[Tuple[str, float]]) -> Tuple[str, float]:
+        """
+        Confidence-weighted majority vote over one track's gender predictions.
+
+        "Unknown" only wins when every prediction is Unknown (highest confidence is
+        kept); an M/F tie falls back to the most confident valid prediction.
+
+        Args:
+            predictions: (gender, confidence) pairs, at least one
+
+        Returns:
+            (gender, confidence); the winner's confidence is its total over the
+            number of valid predictions
+        """
+        # A single prediction is its own vote; skip the array setup
+        if len(predictions) == 1:
+            return predictions[0]
+
+        labels = np.array([p[0] for p in predictions])
+        confs = np.array([p[1] for p in predictions], dtype=np.float64)
+        valid = labels != "Unknown"
+        n_valid = int(np.count_nonzero(valid))
+        if n_valid == 0:
+            best = int(np.argmax(confs))
+            return str(labels[best]), float(confs[best])
+
+        totals = np.array([confs[labels == g].sum() for g in GENDER_LABELS])
+        if totals[0] != totals[1]:
+            winner = int(np.argmax(totals))
+            return GENDER_LABELS[winner], float(totals[winner]) / n_valid
+
+        valid_idx = np.flatnonzero(valid)
+        best = int(valid_idx[np.argmax(confs[valid_idx])])
+        return str(labels[best]), float(confs[best])
+
+    def _gender_counts(self) -> Dict[str, int]:
+        """Per-gender number of tracks seen in the current stream."""
+        seen = self._seen_tracks.astype(bool)
+        codes = self._track_gender[seen]
+        male, female = np.bincount(codes[codes >= 0], minlength=len(GENDER_LABELS))[:2]
+        return {"M": int(male), "F": int(female), "Unknown": int(seen.sum() - male - female)}
+
+    def _seen_track_count(self) -> int:
+        """Number of distinct track ids seen in the current stream."""
+        return int(np.count_nonzero(self._seen_tracks))
+
+    def _is_frame_used(self, frame_idx: int) -> bool:
+        """Whether a source frame is a detection frame or a display frame."""
+        if frame_idx % self.detect_every_n == 0:
+            return True
+        return self.display and frame_idx % self.display_frame_skip == 0
+
     def process_stream(self, session_id: Optional[str] = None) -> Dict:
         """
         Process live camera stream with parallel processing.
@@ -522,29 +949,56 @@ class LiveCameraProcessor:
 
         logger.info("Starting live stream processing: %s", self.rtsp_url)
 
+        self._stats_stop.clear()
+        self._stats_thread = threading.Thread(
+            target=self._stats_worker, name="stats-logger", daemon=True
+        )
+        self._stats_thread.start()
+
         frame_num = 0
         start_time = time.time()
-        unique_track_ids = set()
-        track_id_to_gender: Dict[int, str] = {}
-        track_id_to_gender_conf: Dict[int, float] = {}
-        gender_counts = {"M": 0, "F": 0, "Unknown": 0}
+        self._seen_tracks[:] = 0
+        self._track_gender[:] = -1
+        self._track_gender_conf[:] = 0.0
+        self._pid_watermark.clear()
+        # frame_num restarts at 0, so a previous run's gender frame would stall the cadence
+        self._last_gender_frame = -1
 
         camera_reader = None
         consecutive_failures = 0
         max_consecutive_failures = 10
 
+        # Feature switches are fixed after __init__; resolve them once for the frame loop
+        display_on = self.display
+        reid_on = (
+            self.reid_enable
+            and self.reid_embedder is not None
+            and self.reid_cache is not None
+        )
+        gender_on = (
+            self.gender_enable
+            and (
+                self.face_gender_classifier is not None
+                or self.gender_opencv is not None
+            )
+            and self.gender_worker is not None
+        )
+        db_on = self.db_enable and self.db_manager is not None
+
         try:
             while not self._shutdown_requested:
                 # Initialize or reconnect camera
                 if camera_reader is None or not camera_reader.is_streaming():
+                    # Transient failures are soft-retried by read_frame on the reader thread;
+                    # the capture is not touched from here while that thread may use it
                     if camera_reader is not None:
                         camera_reader.release()
                         logger.warning("Camera disconnected, reconnecting...")
                         time.sleep(self.reconnect_interval)
 
                     try:
-                        camera_reader = CameraReader(self.rtsp_url)
-                        camera_reader._connect()
+                        # Constructor already connects and verifies the first frame
+                        camera_reader = CameraReader(self.rtsp_url, hw_decode=self.hw_decode)
                         consecutive_failures = 0
                         logger.info("Camera connected successfully")
 
@@ -596,6 +1050,8 @@ class LiveCameraProcessor:
                                 camera_reader = None
                             continue
                         consecutive_failures = 0
+                        self._source_frame_idx += 1
+                        frame_idx = self._source_frame_idx
                     except CameraReaderError as e:
                         logger.error("Camera reader error: %s", e)
                         if camera_reader is not None:
@@ -608,15 +1064,17 @@ class LiveCameraProcessor:
                 else:
                     # Get frame from worker thread queue
                     try:
-                        frame = self._frame_queue.get(timeout=0.1)
-                        if frame is None:  # Signal to stop
+                        item = self._frame_queue.get(timeout=0.1)
+                        if item is None:  # Signal to stop
                             logger.info("Frame reader signaled end")
                             break
+                        frame_idx, frame = item
                     except queue.Empty:
                         # No frame available yet, check for previous detection result
                         continue
 
-                frame_num += 1
+                # With reader-side decimation frames arrive with gaps, so keep source numbering
+                frame_num = frame_idx if self.reader_decimation else frame_num + 1
 
                 # Check frame limit
                 if self.max_frames is not None and frame_num > self.max_frames:
@@ -628,141 +1086,65 @@ class LiveCameraProcessor:
 
                 # PARALLEL PROCESSING: Submit detection task to worker thread
                 # Main thread can continue with other tasks while detection runs
-                detections = []
                 should_detect = frame_num % self.detect_every_n == 0
 
+                # Swap in the latest finished detection result (no polling/timeouts)
+                self._collect_detection_result()
+                detections = self._cached_detections
+
                 if (
                     should_detect
                     and not self.use_face_detection
                     and self.detector is not None
                 ):
-                    # OPTIMIZED: Check previous detection result first (non-blocking)
-                    if self._detection_future is not None:
-                        try:
-                            (
-                                prev_frame_num,
-                                prev_detections,
-                            ) = self._detection_future.result(timeout=0.0)
-                            if prev_detections is not None:
-                                detections = prev_detections
-                                self._last_detect_frame = prev_frame_num
-                                if len(detections) > 0:
-                                    logger.debug(
-                                        "Got detection result from previous frame %d: %d persons",
-                                        prev_frame_num,
-                                        len(detections),
-                                    )
-                        except Exception as e:
-                            # Previous detection not ready - will use empty detections
-                            # Tracker will maintain tracks from previous frames
-                            detections = []
-                            logger.debug("Previous detection not ready yet: %s", e)
-                    else:
-                        detections = []
-
                     # Submit new detection task (async, non-blocking)
                     # Pre-resize frame for faster detection (avoid double resize)
-                    # Use larger size for better face detection accuracy
-                    h_orig, w_orig = frame.shape[:2]
-                    target_w, target_h = (
-                        480,
-                        360,
-                    )  # Increased to 480x360 for better face detection
-                    if w_orig > target_w or h_orig > target_h:
-                        small_frame = cv2.resize(
-                            frame, (target_w, target_h), interpolation=cv2.INTER_LINEAR
-                        )
-                        scale_w = w_orig / target_w
-                        scale_h = h_orig / target_h
-                    else:
-                        small_frame = frame
-                        scale_w = scale_h = 1.0
+                    small_frame, scale_w, scale_h = self._downscale_for_detection(frame)
 
                     current_frame_num = frame_num
-                    logger.debug(
-                        "Submitting YOLOv8 detection task: frame=%d, resized=%dx%d, scale=(%.2f, %.2f)",
-                        current_frame_num,
-                        small_frame.shape[1],
-                        small_frame.shape[0],
-                        scale_w,
-                        scale_h,
-                    )
-                    self._detection_future = self._detection_executor.submit(
-                        self._detect_frame_async,
-                        small_frame,
-                        current_frame_num,
-                        scale_w,
-                        scale_h,
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(
+                            "Submitting YOLOv8 detection task: frame=%d, resized=%dx%d, "
+                            "scale=(%.2f, %.2f)",
+                            current_frame_num,
+                            small_frame.shape[1],
+                            small_frame.shape[0],
+                            scale_w,
+                            scale_h,
+                        )
+                    self._submit_detection(
+                        small_frame, current_frame_num, scale_w, scale_h
                     )
-                else:
-                    # On skipped frames, check if we have a pending detection result
-                    if self._detection_future is not None:
-                        try:
-                            _, cached_detections = self._detection_future.result(
-                                timeout=0.001
-                            )
-                            if cached_detections:
-                                detections = cached_detections
-                        except Exception:
-                            pass
-                    else:
-                        detections = []
-
-                # Create annotated frame if display enabled
-                annotated = None
-                if self.display and len(detections) > 0:
-                    annotated = self.processor.draw_detections(frame, detections)
 
                 # Face-based detection already filters out non-faces
                 # No need for complex geometric filtering - faces are reliable indicators
-                # Only basic validation needed
-                filtered_detections = []
-                for d in detections:
-                    # Basic validation: ensure bbox is valid
-                    bbox = d.get("bbox", [])
-                    if len(bbox) < 4:
-                        continue
-
-                    if hasattr(bbox, "tolist"):
-                        bbox = bbox.tolist()
-
-                    x1, y1, x2, y2 = (
-                        float(bbox[0]),
-                        float(bbox[1]),
-                        float(bbox[2]),
-                        float(bbox[3]),
+                # Only basic validation needed, done as array ops over all bboxes at once
+                valid = [d for d in detections if len(d.get("bbox", [])) >= 4]
+                if valid:
+                    bb = np.asarray([d["bbox"][:4] for d in valid], dtype=np.float32)
+                    w = bb[:, 2] - bb[:, 0]
+                    h = bb[:, 3] - bb[:, 1]
+                    # Positive size, not tiny, and not covering (almost) the whole frame
+                    keep = (
+                        (w > 0)
+                        & (h > 0)
+                        & (h >= 50)
+                        & (w >= 30)
+                        & (h <= frame_height * 0.9)
+                        & (w <= frame_width * 0.9)
                     )
-                    w = x2 - x1
-                    h = y2 - y1
-
-                    # Validate dimensions
-                    if w <= 0 or h <= 0:
-                        continue
-
-                    # Basic size check: filter tiny detections
-                    if h < 50 or w < 30:
-                        continue
-
-                    # Basic max size check
-                    if h > frame_height * 0.9 or w > frame_width * 0.9:
-                        continue
-
-                    filtered_detections.append(d)
-
-                detections = filtered_detections
+                    detections = [valid[i] for i in np.flatnonzero(keep)]
+                else:
+                    detections = []
 
-                # Log stats periodically - ALWAYS log detection attempts
-                if (
-                    should_detect and frame_num % 10 == 0
-                ):  # Log every 10 detection frames (every 40 frames total)
-                    logger.info(
-                        "YOLOv8 detection attempt: frame=%d, detected=%d persons, should_detect=%s",
-                        frame_num,
-                        len(detections),
-                        should_detect,
-                    )
-                elif len(detections) > 0:  # Always log when we detect someone
-                    logger.info(
+                # Per-frame numbers go to the stats thread; keep the hot loop free of INFO logging
+                self._bump_stats(
+                    frames=1,
+                    detection_frames=1 if should_detect else 0,
+                    detections=len(detections),
+                )
+                if len(detections) > 0 and logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
                         "YOLOv8 body detection: %d persons detected at frame %d",
                         len(detections),
                         frame_num,
@@ -770,37 +1152,46 @@ class LiveCameraProcessor:
 
                 # Run tracking - ALWAYS update tracker to get predicted tracks
                 # Tracker can maintain and predict tracks even without new detections
-                # This ensures bounding boxes display continuously
-                tracked_detections = self.tracker.update(
-                    detections, frame=frame, session_id=session_id
-                )
-                detections = tracked_detections
+                # This ensures bounding boxes display continuously. With no detections
+                # and no live tracks the update would return [], so idle frames skip it
+                if detections or self.tracker.tracks:
+                    detections = self.tracker.update(
+                        detections, frame=frame, session_id=session_id
+                    )
+                # Stage track ids once per frame; the per-track lookups below index this array
+                track_ids = self._track_id_array(detections)
+                # One clock read per frame for the display throttle and the DB flush interval
+                now_ms = _now_ms()
+
+                # Decide once whether this frame is displayed (display FPS cap to reduce lag);
+                # frames that will not be shown skip the display preparation entirely
+                will_display = False
+                if display_on:
+                    will_display = (
+                        now_ms - self._last_display_time_ms >= self._display_interval_ms
+                        or self._last_display_time_ms < 0
+                    )
 
-                # Create annotated frame if display enabled - OPTIMIZED
-                # Only annotate when we have detections (either new or recently validated)
                 # Prepare detections for display with gender/age info
-                display_detections = []
-                if self.display and len(detections) > 0:
-                    for d in detections:
-                        display_det = d.copy()
-                        track_id = d.get("track_id")
-                        if track_id is not None:
-                            track_id_int = int(track_id)
-                            # Add gender info if available (only display if confidence is high enough)
-                            gender = track_id_to_gender.get(track_id_int)
-                            gender_conf = track_id_to_gender_conf.get(track_id_int)
-                            if (
-                                gender is not None
-                                and gender != "Unknown"
-                                and gender_conf is not None
-                                and gender_conf >= 0.65
-                            ):
-                                display_det["gender"] = gender
-                                display_det["gender_confidence"] = gender_conf
-                        display_detections.append(display_det)
-
-                # Defer annotation until after Re-ID and Counter so PID can be rendered
-                annotated = None
+                # Gender is overlaid through a ChainMap instead of copying each detection;
+                # detections without a confident gender are drawn as-is
+                display_detections: List[Mapping[str, Any]] = []
+                if will_display and len(detections) > 0:
+                    gender_codes, gender_confs = self._get_track_genders(track_ids)
+                    for d, code, gender_conf in zip(detections, gender_codes, gender_confs):
+                        # Add gender info if available (only display if confidence is high enough)
+                        if code >= 0 and gender_conf >= 0.65:
+                            display_detections.append(
+                                ChainMap(
+                                    {
+                                        "gender": GENDER_LABELS[code],
+                                        "gender_confidence": float(gender_conf),
+                                    },
+                                    d,
+                                )
+                            )
+                        else:
+                            display_detections.append(d)
 
                 # Face verification no longer needed since we're using face-based detection
                 # All detections already have faces (detected from faces directly)
@@ -808,20 +1199,19 @@ class LiveCameraProcessor:
 
                 # Integrate Re-ID - ONLY when face detection found persons
                 # This saves significant processing time when no persons are present
-                if (
+                reid_frame = (
                     len(detections)
                     > 0  # CRITICAL: Only run Re-ID if we have detections (faces found)
                     and should_detect  # Only on detection frames (skip on interpolation frames)
-                    and self.reid_enable
-                    and self.reid_embedder is not None
-                    and self.reid_cache is not None
-                ):
+                    and reid_on
+                )
+                if reid_frame:
                     try:
                         integrate_reid_for_tracks(
                             frame,
                             detections,
                             cast(ReIDEmbedder, self.reid_embedder),
-                            self.reid_cache,
+                            cast(ReIDCache, self.reid_cache),
                             session_id=session_id,
                             every_k_frames=self.reid_every_k,
                             frame_index=frame_num,
@@ -831,99 +1221,95 @@ class LiveCameraProcessor:
                             append_mode=self.reid_append_mode,
                             aggregation_method=self.reid_aggregation_method,
                         )
-                        
-                        # Extract Re-ID embeddings from cache and add to detections
-                        # for PersonIdentityManager to resolve person_id
-                        if (
-                            self.person_identity_manager is not None
-                            and self.reid_embedder is not None
-                        ):
-                            import numpy as np
-                            from typing import cast as _cast
-                            # Try to attach embedding/person_id from cache; if missing, compute on-demand (limited)
-                            on_demand_budget = 10  # compute up to 10 embeddings per frame to ensure PID resolution
-                            for det in detections:
-                                track_id = det.get("track_id")
-                                if track_id is None:
-                                    continue
-                                got_embedding = False
-                                # Prefer cache if available
-                                try:
-                                    if self.reid_cache is not None:
-                                        cached_item = self.reid_cache.get(session_id, int(track_id))
-                                        if cached_item is not None and cached_item.embedding is not None:
-                                            det["reid_embedding"] = cached_item.embedding
-                                            det["channel_id"] = self.channel_id
-                                            pid = self.person_identity_manager.get_or_assign_person_id(
-                                                channel_id=self.channel_id,
-                                                track_id=int(track_id),
-                                                embedding=cached_item.embedding,
-                                            )
-                                            if pid:
-                                                det["person_id"] = pid
-                                            got_embedding = True
-                                except Exception as e:
-                                    logger.debug("Re-ID cache get failed for track %d: %s", track_id, e)
-
-                                # On-demand embedding if cache missing and budget remains
-                                if not got_embedding and on_demand_budget > 0:
-                                    try:
-                                        bbox = det.get("bbox")
-                                        if bbox is None:
-                                            continue
-                                        x1, y1, x2, y2 = map(int, bbox)
-                                        crop = self.processor.crop_person(frame, np.array([x1, y1, x2, y2], dtype=np.int32))
-                                        if crop is None:
-                                            continue
-                                        emb = _cast(ReIDEmbedder, self.reid_embedder).embed(crop)
-                                        det["reid_embedding"] = emb
-                                        det["channel_id"] = self.channel_id
-                                        pid = self.person_identity_manager.get_or_assign_person_id(
-                                            channel_id=self.channel_id,
-                                            track_id=int(track_id),
-                                            embedding=emb,
-                                        )
-                                        if pid:
-                                            det["person_id"] = pid
-                                        on_demand_budget -= 1
-                                    except Exception as e:
-                                        logger.debug("On-demand Re-ID embedding failed for track %d: %s", track_id, e)
                     except Exception as e:
                         logger.warning("Re-ID integration error: %s", e)
 
-                # Always try to attach person_id from cache every frame (independent of counter)
-                if self.reid_enable and self.person_identity_manager is not None and self.reid_cache is not None:
-                    for det in detections:
-                        track_id = det.get("track_id")
-                        if track_id is None:
+                # Attach person_id from the Re-ID cache every frame (independent of counter),
+                # one cache lookup per track. On Re-ID frames the embedding is attached too,
+                # and cache misses are embedded on demand (limited) to ensure PID resolution.
+                if (
+                    detections
+                    and self.reid_enable
+                    and self.person_identity_manager is not None
+                    and self.reid_cache is not None
+                ):
+                    on_demand_budget = 10 if reid_frame else 0
+                    pending: List[Tuple[Dict, int, np.ndarray]] = []  # (det, track_id, crop)
+                    for det, track_id in zip(detections, track_ids.tolist()):
+                        if track_id < 0:
                             continue
                         try:
-                            cached_item = self.reid_cache.get(session_id, int(track_id))
+                            cached_item = self.reid_cache.get(session_id, track_id)
                             if cached_item is not None and cached_item.embedding is not None:
-                                # Resolve/assign person_id using cached embedding
-                                pid_cached = self.person_identity_manager.get_or_assign_person_id(
-                                    channel_id=self.channel_id,
-                                    track_id=int(track_id),
-                                    embedding=cached_item.embedding,
-                                )
+                                if reid_frame:
+                                    det["reid_embedding"] = cached_item.embedding
+                                    det["channel_id"] = self.channel_id
+                                pid_cached = self._resolve_person_id(track_id, cached_item)
                                 if pid_cached:
                                     det["person_id"] = pid_cached
+                                continue
                         except Exception as e:
                             logger.debug("Attach PID from cache failed for track %d: %s", track_id, e)
+                            continue
 
-                # Update unique track id set
-                for d in detections:
-                    t_id = d.get("track_id")
-                    if t_id is not None:
-                        unique_track_ids.add(int(t_id))
+                        # Collect crops for on-demand embedding if budget remains
+                        if len(pending) >= on_demand_budget:
+                            continue
+                        bbox = det.get("bbox")
+                        if bbox is None:
+                            continue
+                        try:
+                            x1, y1, x2, y2 = map(int, bbox)
+                            crop = self.processor.crop_person_xyxy(frame, x1, y1, x2, y2)
+                        except Exception as e:
+                            logger.debug(
+                                "On-demand Re-ID crop failed for track %d: %s", track_id, e
+                            )
+                            continue
+                        if crop is None:
+                            continue
+                        pending.append((det, track_id, crop))
+
+                    # One batched embedding call for all cache misses
+                    if pending:
+                        try:
+                            embeddings = cast(ReIDEmbedder, self.reid_embedder).embed_batch(
+                                [crop for _, _, crop in pending]
+                            )
+                        except Exception as e:
+                            logger.debug("On-demand Re-ID embedding failed: %s", e)
+                            embeddings = []
+                        for (det, track_id, _), emb in zip(pending, embeddings):
+                            det["reid_embedding"] = emb
+                            det["channel_id"] = self.channel_id
+                            # One failed lookup must not skip the remaining detections
+                            try:
+                                pid = self.person_identity_manager.get_or_assign_person_id(
+                                    channel_id=self.channel_id,
+                                    track_id=track_id,
+                                    embedding=emb,
+                                )
+                            except Exception as e:
+                                logger.debug(
+                                    "On-demand Re-ID person id failed for track %d: %s",
+                                    track_id,
+                                    e,
+                                )
+                                continue
+                            if pid:
+                                det["person_id"] = pid
+
+                # Mark track ids of this frame as seen
+                self._mark_tracks_seen(track_ids)
 
                 # Counter update (if enabled) — after Re-ID so detections may include person_id
                 counter_result = None
                 if self.counter is not None and len(detections) > 0:
                     try:
                         counter_result = self.counter.update(detections, frame, frame_num=frame_num)
-                        if counter_result.get("events"):
-                            for event in counter_result["events"]:
+                        events = counter_result.get("events")
+                        if events:
+                            for event in events:
                                 logger.info(
                                     "Counter event: %s - Zone: %s (%s), Track: %d",
                                     event["type"],
@@ -931,128 +1317,74 @@ class LiveCameraProcessor:
                                     event["zone_name"],
                                     event["track_id"],
                                 )
-                                # DB write (non-blocking best-effort)
-                                if self.db_manager is not None:
-                                    try:
-                                        self.db_manager.insert_counter_event(
-                                            channel_id=self.channel_id,
-                                            zone_id=str(event.get("zone_id")),
-                                            zone_name=str(event.get("zone_name")),
-                                            event_type=str(event.get("type")),
-                                            track_id=int(event.get("track_id")) if event.get("track_id") is not None else None,
-                                            person_id=None,
-                                            frame_number=int(frame_num),
-                                            extra_json={"run_id": self.run_id or "", "session_id": session_id},
-                                        )
-                                    except Exception as e:
-                                        logger.debug("Failed to insert counter_event: %s", e)
+                            # One batched DB write per frame (best-effort, on the db-writer thread)
+                            if self.db_manager is not None:
+                                self._submit_db_write(
+                                    False,
+                                    self._store_counter_events,
+                                    list(events),
+                                    frame_num,
+                                    session_id,
+                                )
                     except Exception as e:
                         logger.warning("Counter update error: %s", e)
 
-                # Now render overlay after Re-ID and Counter so PID shows up
-                if self.display:
-                    if annotated is None:
-                        annotated = frame.copy()
-                    if len(display_detections) > 0:
-                        annotated = self.processor.draw_detections(annotated, display_detections)
-                    if self.counter is not None:
-                        annotated = self.counter.draw_zones(annotated)
+                # Render overlay after Re-ID and Counter so PID shows up; only frames due
+                # for display are annotated, on the render thread
+                if will_display:
+                    self._submit_render(frame, display_detections)
+                    self._last_display_time_ms = now_ms
 
                 # Gender and Age classification (PyTorch-based, no TensorFlow)
-                if (
-                    self.gender_enable
-                    and (
-                        self.face_gender_classifier is not None
-                        or self.gender_opencv is not None
-                    )
-                    and self.gender_worker is not None
-                ):
+                if gender_on:
                     self._process_gender_classification(
                         frame,
                         detections,
+                        track_ids,
                         frame_num,
                         session_id,
                         frame_width,
                         frame_height,
-                        track_id_to_gender,
-                        track_id_to_gender_conf,
                     )
 
-                # Display frame if enabled - OPTIMIZED for minimum overhead
-                if self.display:
-                    current_time = time.time()
-                    # Only update display at specified FPS to reduce lag
-                    time_since_last_display = current_time - self._last_display_time
-                    display_interval = 1.0 / self.display_fps
-
-                    if (
-                        time_since_last_display >= display_interval
-                        or self._last_display_time == 0.0
-                    ):
-                        window_name = f"Live Stream - Channel {self.channel_id}"
-
-                        # Use annotated frame if available, otherwise original frame
-                        frame_to_display = annotated if annotated is not None else frame
-
-                        # Resize frame for display to reduce lag (only if larger than max width)
-                        h, w = frame_to_display.shape[:2]
-                        if w > self.display_max_width:
-                            scale = self.display_max_width / w
-                            new_w = int(w * scale)
-                            new_h = int(h * scale)
-                            # Cache resized frame to avoid repeated resize on same size
-                            display_frame = cv2.resize(
-                                frame_to_display,
-                                (new_w, new_h),
-                                interpolation=cv2.INTER_LINEAR,
-                            )
-                        else:
-                            display_frame = frame_to_display  # No resize needed
-
-                        cv2.imshow(window_name, display_frame)
-                        self._last_display_time = current_time
-                        self._display_frame_count += 1
-
-                    # Always check for 'q' key (non-blocking, minimal overhead)
-                    key = cv2.waitKey(1) & 0xFF
-                    if key == ord("q"):
+                # Show the most recent finished render (imshow stays on this thread
+                # unless a display process owns the window)
+                if display_on:
+                    shown = self._show_rendered(f"Live Stream - Channel {self.channel_id}")
+                    if self._display_sink is not None:
+                        if self._display_sink.quit_requested:
+                            logger.info("User pressed 'q', stopping processing.")
+                            break
+                    # Poll the window (and the 'q' key) only when a new frame was shown;
+                    # waitKey pumps GUI events and can block for about 1 ms
+                    elif shown and (cv2.waitKey(1) & 0xFF) == ord("q"):
                         logger.info("User pressed 'q', stopping processing.")
                         break
 
                 # Database storage (async write to avoid blocking)
-                if should_detect and self.db_enable and self.db_manager is not None:
-                    if self._db_executor is not None:
-                        # Submit async write (non-blocking)
-                        self._db_executor.submit(
-                            self._store_detections_async,
-                            detections.copy(),
-                            frame_num,
-                            track_id_to_gender.copy(),
-                            track_id_to_gender_conf.copy(),
-                        )
-                    else:
-                        # Fallback to sync write
-                        self._store_detections(
-                            detections,
-                            frame_num,
-                            track_id_to_gender,
-                            track_id_to_gender_conf,
-                        )
-
-                # Log progress periodically
-                if frame_num % 100 == 0:
-                    elapsed = time.time() - start_time
-                    fps = frame_num / elapsed if elapsed > 0 else 0
-                    logger.info(
-                        "Processed %d frames (%.1f FPS) - Tracks: %d",
+                if should_detect and db_on:
+                    # Hand the writer per-frame arrays rather than the live detection dicts
+                    boxes, det_confs = self._stage_db_rows(detections)
+                    gender_codes, gender_confs = self._get_track_genders(track_ids)
+                    self._submit_db_write(
+                        True,
+                        self._store_detections,
+                        now_ms,
                         frame_num,
-                        fps,
-                        len(unique_track_ids),
+                        track_ids,
+                        boxes,
+                        det_confs,
+                        gender_codes,
+                        gender_confs,
                     )
+                elif db_on:
+                    # Frames that add no rows still flush a stale buffer on time
+                    self._maybe_flush_db(now_ms)
 
         except KeyboardInterrupt:
             logger.info("Processing interrupted by user")
         finally:
+            self._stats_stop.set()
             if camera_reader is not None:
                 try:
                     if hasattr(camera_reader, "release"):
@@ -1060,15 +1392,15 @@ class LiveCameraProcessor:
                 except Exception:
                     pass
 
-            if self.display:
+            if display_on and self._display_sink is None:
                 cv2.destroyAllWindows()
 
-            # Final DB flush
-            if self.db_enable and self.db_manager is not None:
+            # Final DB flush, after the writer has drained so the buffer is not shared
+            if db_on:
+                if self._db_thread is not None:
+                    self._db_queue.join()
                 self._finalize_db_storage(
-                    unique_track_ids,
-                    track_id_to_gender,
-                    track_id_to_gender_conf,
+                    np.flatnonzero(self._seen_tracks),
                     session_id,
                 )
 
@@ -1080,37 +1412,55 @@ class LiveCameraProcessor:
             "frames_processed": frame_num,
             "processing_time_seconds": elapsed_time,
             "avg_fps": fps,
-            "unique_tracks": len(unique_track_ids),
-            "gender_counts": gender_counts,
+            "unique_tracks": self._seen_track_count(),
+            "gender_counts": self._gender_counts(),
         }
 
     def _process_gender_classification(
         self,
         frame: np.ndarray,
         detections: List[Dict],
+        track_ids: np.ndarray,
         frame_num: int,
         session_id: str,
         frame_width: int,
         frame_height: int,
-        track_id_to_gender: Dict[int, str],
-        track_id_to_gender_conf: Dict[int, float],
     ) -> None:
-        """Process gender classification for detections using face crops from OpenCV."""
+        """Process gender classification for detections using face crops from OpenCV.
+
+        track_ids holds the frame's staged track id per detection (-1 if untracked).
+        """
         # Poll previously enqueued tasks
-        if self.gender_worker is None:
+        worker = self.gender_worker
+        if worker is None:
+            return
+        # Hot attributes bound once per call
+        metrics = self.gender_metrics
+        every_k = self.gender_every_k
+        max_per_frame = self.gender_max_per_frame
+        pending = self._pending_gender_tasks
+
+        # Adaptive sampling only ever stretches the interval, so before every_k frames
+        # have passed (or without detections) nothing is enqueued; with nothing to poll
+        # the call is a no-op
+        enqueue_due = len(detections) > 0 and (
+            frame_num - self._last_gender_frame >= every_k or self._last_gender_frame < 0
+        )
+        if not pending and not enqueue_due:
             return
 
         # Implement voting mechanism: collect multiple predictions per track for stability
         # Use a window of recent predictions to determine stable gender
-        new_pending = []
         track_predictions_temp: Dict[
             int, List[Tuple[str, float]]
         ] = {}  # track_id -> [(gender, gconf), ...]
 
-        for task_id in self._pending_gender_tasks:
-            res = self.gender_worker.try_get_result(task_id)
+        # Rotate through the pending ids once; unfinished ones go back to the tail
+        for _ in range(len(pending)):
+            task_id = pending.popleft()
+            res = worker.try_get_result(task_id)
             if res is None:
-                new_pending.append(task_id)
+                pending.append(task_id)
                 continue
             # Format: (gender, conf, done_ts) or (gender, conf)
             if len(res) >= 3:
@@ -1119,209 +1469,216 @@ class LiveCameraProcessor:
                 gender_label, gconf = res[:2]
             else:
                 continue
-            try:
-                _, track_str, _ = task_id.split(":", 2)
-                t_id_int = int(track_str)
-
-                # Collect predictions for voting
-                if t_id_int not in track_predictions_temp:
-                    track_predictions_temp[t_id_int] = []
-                track_predictions_temp[t_id_int].append((gender_label, float(gconf)))
-
-            except Exception as e:
-                logger.warning(
-                    "Failed to parse task_id for voting: %s", e, exc_info=True
-                )
+            # Task ids are (session_id, track_id, frame_num); collect predictions for voting
+            t_id_int = task_id[1]
+            if t_id_int not in track_predictions_temp:
+                track_predictions_temp[t_id_int] = []
+            track_predictions_temp[t_id_int].append((gender_label, float(gconf)))
 
         # Apply voting: use majority vote with confidence weighting for gender
+        # Vote tallies, reported to the stats thread once per call
+        voted_total = voted_male = voted_female = 0
         for t_id_int, predictions in track_predictions_temp.items():
             if len(predictions) == 0:
                 continue
-
-            # Filter out "Unknown" for voting (only count if all are Unknown)
-            valid_predictions = [p for p in predictions if p[0] != "Unknown"]
-            if len(valid_predictions) == 0:
-                # All predictions are Unknown - use highest confidence
-                best = max(predictions, key=lambda x: x[1])
-                gender_label, gconf = best
-            else:
-                # Gender: Majority vote with confidence weighting
-                gender_votes: Dict[str, List[float]] = {"M": [], "F": []}
-
-                for pred_gender, pred_gconf in valid_predictions:
-                    if pred_gender in ("M", "F"):
-                        gender_votes[pred_gender].append(pred_gconf)
-
-                # Gender: Weighted by confidence, majority wins
-                m_total = sum(gender_votes.get("M", []))
-                f_total = sum(gender_votes.get("F", []))
-                if m_total > f_total:
-                    gender_label = "M"
-                    gconf = (
-                        m_total / len(valid_predictions)
-                        if len(valid_predictions) > 0
-                        else 0.0
-                    )
-                elif f_total > m_total:
-                    gender_label = "F"
-                    gconf = (
-                        f_total / len(valid_predictions)
-                        if len(valid_predictions) > 0
-                        else 0.0
-                    )
-                else:
-                    # Tie - use highest confidence prediction
-                    best = max(valid_predictions, key=lambda x: x[1])
-                    gender_label, gconf = best[0], best[1]
+            gender_label, gconf = self._vote_gender(predictions)
 
             # Store final voted results
-            track_id_to_gender[t_id_int] = gender_label
-            track_id_to_gender_conf[t_id_int] = float(gconf)
+            self._set_track_gender(t_id_int, gender_label, float(gconf))
 
-            logger.info(
-                "Gender result stored (voted from %d predictions): track_id=%d, gender=%s(%.2f)",
-                len(predictions),
-                t_id_int,
-                gender_label,
-                float(gconf),
-            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Gender result stored (voted from %d predictions): track_id=%d, "
+                    "gender=%s(%.2f)",
+                    len(predictions),
+                    t_id_int,
+                    gender_label,
+                    float(gconf),
+                )
 
-            if self.gender_metrics is not None:
-                self.gender_metrics.results_total += 1
-                self.gender_metrics.observe_gender(t_id_int, gender_label)
+            voted_total += 1
+            if gender_label == "M":
+                voted_male += 1
+            elif gender_label == "F":
+                voted_female += 1
+            if metrics is not None:
+                metrics.results_total += 1
+                metrics.observe_gender(t_id_int, gender_label)
+        if voted_total:
+            self._bump_stats(
+                gender_results=voted_total, gender_male=voted_male, gender_female=voted_female
+            )
 
-        self._pending_gender_tasks = new_pending
+        if not enqueue_due:
+            return
 
-        # Adaptive sampling
-        eff_every_k = self.gender_every_k
-        eff_max_per_frame = self.gender_max_per_frame
-        qlen = 0
-        if self.gender_worker is not None:
-            try:
-                qlen = self.gender_worker.get_queue_size()
-            except Exception:
-                qlen = len(self._pending_gender_tasks)
-        else:
+        # Adaptive sampling; the worker queue is probed only on frames that may enqueue
+        eff_every_k = every_k
+        eff_max_per_frame = max_per_frame
+        try:
+            qlen = worker.get_queue_size()
+        except Exception:
             qlen = len(self._pending_gender_tasks)
 
         if self.gender_adaptive_enabled:
             if qlen >= self.gender_queue_high_watermark:
-                eff_every_k = max(self.gender_every_k, self.gender_every_k * 2)
-                eff_max_per_frame = max(1, min(self.gender_max_per_frame, 2))
+                eff_every_k = max(every_k, every_k * 2)
+                eff_max_per_frame = max(1, min(max_per_frame, 2))
             elif qlen <= self.gender_queue_low_watermark:
-                eff_every_k = self.gender_every_k
-                eff_max_per_frame = self.gender_max_per_frame
-
-        # Enqueue tasks every K frames
-        if frame_num % eff_every_k == 0:
-            enqueued_this_frame = 0
-            for d in detections:
-                if enqueued_this_frame >= eff_max_per_frame:
-                    break
-                if d.get("track_id") is None:
-                    continue
+                eff_every_k = every_k
+                eff_max_per_frame = max_per_frame
+
+        # Enqueue tasks every K frames (by distance, frame numbers may skip)
+        if frame_num - self._last_gender_frame >= eff_every_k or self._last_gender_frame < 0:
+            # Only tracks without a locked gender need a crop; when every current
+            # track is locked there is nothing to classify this round
+            pending_mask = track_ids >= 0
+            if self.gender_lock_confidence is not None:
+                codes, confs = self._get_track_genders(track_ids)
+                pending_mask &= ~((codes >= 0) & (confs >= self.gender_lock_confidence))
+            if not pending_mask.any():
+                return
+
+            self._last_gender_frame = frame_num
+            self._expire_face_bbox_cache(frame_num)
+            batch_task_ids: List[Tuple[str, int, int]] = []
+            batch_track_ids: List[int] = []
+            batch_crops: List[np.ndarray] = []
+            get_crop = self._get_gender_crop
+
+            # Clip all candidate boxes to the frame at once and drop empty ones
+            cand = np.flatnonzero(pending_mask)
+            boxes = self._bbox_array([detections[i] for i in cand.tolist()])
+            parsed = ~np.isnan(boxes).any(axis=1)
+            cand = cand[parsed]
+            boxes = boxes[parsed].astype(np.int64)  # truncates like int()
+            np.clip(
+                boxes,
+                0,
+                (frame_width - 1, frame_height - 1, frame_width - 1, frame_height - 1),
+                out=boxes,
+            )
+            nonempty = (boxes[:, 2] > boxes[:, 0]) & (boxes[:, 3] > boxes[:, 1])
 
-                bbox = d.get("bbox")
-                x1, y1, x2, y2 = self._parse_bbox_xyxy(bbox)
-                if x1 is None or y1 is None or x2 is None or y2 is None:
-                    continue
-                xi1 = max(0, min(frame_width - 1, int(x1)))
-                yi1 = max(0, min(frame_height - 1, int(y1)))
-                xi2 = max(0, min(frame_width - 1, int(x2)))
-                yi2 = max(0, min(frame_height - 1, int(y2)))
-                if xi2 <= xi1 or yi2 <= yi1:
-                    continue
+            for i, (xi1, yi1, xi2, yi2) in zip(cand[nonempty].tolist(), boxes[nonempty].tolist()):
+                if len(batch_crops) >= eff_max_per_frame:
+                    break
+                d = detections[i]
+                t_id_int = int(track_ids[i])
 
-                person_crop = frame[yi1:yi2, xi1:xi2].copy()
-                crop, use_face_classifier = self._get_gender_crop(
-                    person_crop, frame, frame_num, d, yi1, yi2, xi1, xi2
+                crop, use_face_classifier = get_crop(
+                    frame, frame_num, d, t_id_int, yi1, yi2, xi1, xi2
                 )
 
                 if crop is None or crop.size == 0:
                     logger.debug(
-                        "Gender/Age: Skipping track_id=%s - crop is None or empty",
-                        d.get("track_id"),
+                        "Gender/Age: Skipping track_id=%d - crop is None or empty",
+                        t_id_int,
                     )
                     continue
 
-                t_id_int = int(d["track_id"])
-                task_id = f"{session_id}:{t_id_int}:{frame_num}"
+                task_id = (session_id, t_id_int, frame_num)
 
-                # Debug logging
-                logger.debug(
-                    "Gender/Age: Enqueuing task for track_id=%d, frame=%d, crop_size=%s, use_face=%s",
-                    t_id_int,
-                    frame_num,
-                    crop.shape if crop is not None else "None",
-                    use_face_classifier,
-                )
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "Gender/Age: Collecting crop for track_id=%d, frame=%d, crop_size=%s, "
+                        "use_face=%s",
+                        t_id_int,
+                        frame_num,
+                        crop.shape,
+                        use_face_classifier,
+                    )
+                batch_task_ids.append(task_id)
+                batch_track_ids.append(t_id_int)
+                batch_crops.append(crop)
+
+            if not batch_crops:
+                return
+
+            # One forward pass for all crops of this frame
+            ok = worker.enqueue_batch(
+                task_ids=batch_task_ids,
+                priority=1,
+                func=functools.partial(
+                    self._gender_infer,
+                    batch_crops,
+                    batch_track_ids,
+                    self.face_gender_classifier,
+                    self.gender_opencv,
+                    metrics,
+                ),
+            )
+            if ok:
+                self._pending_gender_tasks.extend(batch_task_ids)
+                if metrics is not None:
+                    for _ in batch_task_ids:
+                        metrics.inc_call()
+            else:
+                if metrics is not None:
+                    for _ in batch_task_ids:
+                        metrics.inc_dropped()
+
+    @staticmethod
+    def _gender_infer(
+        crops: List[np.ndarray],
+        track_ids: List[int],
+        fgc: Optional[FaceGenderClassifier],
+        goc: Optional[GenderOpenCV],
+        metrics: Optional[GenderMetrics],
+    ) -> List[Tuple[str, float]]:
+        """
+        Classify one frame's gender crops in a single batch (runs on a gender worker).
 
-                def _make_func(
-                    c=crop,
-                    track_id_val=t_id_int,
-                    use_face=use_face_classifier,
-                    _fgc=self.face_gender_classifier,
-                    _goc=self.gender_opencv,
-                ):
-                    def _run():
-                        start_ms = time.time() * 1000.0
+        Args:
+            crops: Face or upper-body crops
+            track_ids: Track id per crop, for logging
+            fgc: PyTorch face gender classifier (fallback)
+            goc: OpenCV DNN gender classifier (preferred)
+            metrics: Gender metrics receiving the batch latency
 
-                        # Use OpenCV DNN model if available (pretrained, more accurate ~85-90%)
-                        if _goc is not None:
-                            try:
-                                gender, gconf = _goc.classify(c)
-                                logger.info(
-                                    "Gender (OpenCV DNN): track_id=%d, gender=%s(%.2f)",
-                                    track_id_val,
-                                    gender,
-                                    gconf,
-                                )
-                                dur = (time.time() * 1000.0) - start_ms
-                                if self.gender_metrics is not None:
-                                    self.gender_metrics.observe_latency(dur)
-                                return gender, float(gconf)
-                            except Exception as e:
-                                logger.warning(
-                                    "OpenCV gender classification error: %s",
-                                    e,
-                                    exc_info=True,
-                                )
+        Returns:
+            (gender, confidence) per crop
+        """
+        start = time.perf_counter()
+        results = None
+        source = ""
 
-                        # Fallback to PyTorch models
-                        if _fgc is not None:
-                            gender, gconf = _fgc.classify(c)
-                            logger.info(
-                                "Gender (PyTorch MobileNetV2): track_id=%d, gender=%s(%.2f)",
-                                track_id_val,
-                                gender,
-                                gconf,
-                            )
-                            dur = (time.time() * 1000.0) - start_ms
-                            if self.gender_metrics is not None:
-                                self.gender_metrics.observe_latency(dur)
-                            return gender, float(gconf)
-                        else:
-                            logger.warning(
-                                "Gender classifier not available for track_id=%d",
-                                track_id_val,
-                            )
-                            return "Unknown", 0.0
+        # Use OpenCV DNN model if available (pretrained, more accurate ~85-90%)
+        if goc is not None:
+            try:
+                results = goc.classify_batch(crops)
+                source = "OpenCV DNN"
+            except Exception as e:
+                logger.warning(
+                    "OpenCV gender classification error: %s",
+                    e,
+                    exc_info=True,
+                )
 
-                    return _run
+        # Fallback to PyTorch models
+        if results is None and fgc is not None:
+            results = fgc.classify_batch(crops)
+            source = "PyTorch MobileNetV2"
 
-                if self.gender_worker is None:
-                    continue
-                ok = self.gender_worker.enqueue(
-                    task_id=task_id, priority=1, func=_make_func()
+        if results is None:
+            logger.warning(
+                "Gender classifier not available for track_ids=%s",
+                track_ids,
+            )
+            return [("Unknown", 0.0)] * len(crops)
+
+        if logger.isEnabledFor(logging.DEBUG):
+            for track_id_val, (gender, gconf) in zip(track_ids, results):
+                logger.debug(
+                    "Gender (%s): track_id=%d, gender=%s(%.2f)",
+                    source,
+                    track_id_val,
+                    gender,
+                    gconf,
                 )
-                if ok:
-                    self._pending_gender_tasks.append(task_id)
-                    enqueued_this_frame += 1
-                    if self.gender_metrics is not None:
-                        self.gender_metrics.inc_call()
-                else:
-                    if self.gender_metrics is not None:
-                        self.gender_metrics.inc_dropped()
+        if metrics is not None:
+            metrics.observe_latency((time.perf_counter() - start) * 1000.0)
+        return [(gender, float(gconf)) for gender, gconf in results]
 
     def _parse_bbox_xyxy(self, bbox_obj) -> Tuple[Optional[float], ...]:
         """Parse bbox to (x1, y1, x2, y2)."""
@@ -1342,16 +1699,20 @@ class LiveCameraProcessor:
 
     def _get_gender_crop(
         self,
-        person_crop: np.ndarray,
         frame: np.ndarray,
         frame_num: int,
         detection: Dict,
+        track_id: int,
         yi1: int,
         yi2: int,
         xi1: int,
         xi2: int,
     ) -> Tuple[Optional[np.ndarray], bool]:
-        """Get crop for gender/age classification using face_bbox from OpenCV detection."""
+        """Get crop for gender/age classification using face_bbox from OpenCV detection.
+
+        Candidate regions are frame views; only the selected one is materialized by
+        ImageProcessor.detach_crop, and that owned image is what the gender worker reads.
+        """
         crop = None
         use_face_classifier = False
 
@@ -1381,17 +1742,23 @@ class LiveCameraProcessor:
                 if face_x2 > face_x1 and face_y2 > face_y1:
                     # Validate minimum size (at least 64x64 for better classification accuracy)
                     if (face_x2 - face_x1) >= 64 and (face_y2 - face_y1) >= 64:
-                        crop = frame[face_y1:face_y2, face_x1:face_x2].copy()
+                        crop = frame[face_y1:face_y2, face_x1:face_x2]
                         use_face_classifier = True
-                        logger.debug(
-                            "Extracted face crop: %dx%d from bbox [%.1f,%.1f,%.1f,%.1f]",
-                            face_x2 - face_x1,
-                            face_y2 - face_y1,
-                            face_x1,
-                            face_y1,
-                            face_x2,
-                            face_y2,
+                        self._cache_face_bbox(
+                            track_id,
+                            (face_x1, face_y1, face_x2, face_y2),
+                            frame_num,
                         )
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug(
+                                "Extracted face crop: %dx%d from bbox [%.1f,%.1f,%.1f,%.1f]",
+                                face_x2 - face_x1,
+                                face_y2 - face_y1,
+                                face_x1,
+                                face_y1,
+                                face_x2,
+                                face_y2,
+                            )
                     else:
                         logger.debug(
                             "Face crop too small: %dx%d, using upper-body fallback",
@@ -1405,67 +1772,171 @@ class LiveCameraProcessor:
         if crop is None or crop.size == 0:
             h_box = float(yi2) - float(yi1)
             upper_yi2 = yi1 + int(h_box * 0.6)
-            crop = frame[yi1:upper_yi2, xi1:xi2].copy()
+            crop = frame[yi1:upper_yi2, xi1:xi2]
             use_face_classifier = False
             logger.debug("Using upper-body crop as fallback")
 
-        return crop, use_face_classifier
+        return self.processor.detach_crop(crop, GENDER_CLASSIFIER_INPUT_SIDE), use_face_classifier
+
+    def _cache_face_bbox(
+        self, track_id: int, face_bbox: Tuple[int, int, int, int], frame_num: int
+    ) -> None:
+        """Remember the last usable face bbox of a track."""
+        slot = self._face_bbox_cache_slot.get(track_id)
+        if slot is None:
+            free = np.flatnonzero(self._face_bbox_cache_frame_arr < 0)
+            if free.size > 0:
+                slot = int(free[0])
+            else:
+                # Cache full: evict the least recently refreshed track
+                slot = int(np.argmin(self._face_bbox_cache_frame_arr))
+                self._face_bbox_cache_slot.pop(int(self._face_bbox_cache_owner_arr[slot]), None)
+            self._face_bbox_cache_slot[track_id] = slot
+            self._face_bbox_cache_owner_arr[slot] = track_id
+
+        self._face_bbox_cache_arr[slot] = face_bbox
+        self._face_bbox_cache_frame_arr[slot] = frame_num
+
+    def _expire_face_bbox_cache(self, frame_num: int) -> None:
+        """Free all cache slots older than gender_cache_ttl_frames in one vectorized pass."""
+        frames = self._face_bbox_cache_frame_arr
+        stale = (frames >= 0) & ((frame_num - frames) > self.gender_cache_ttl_frames)
+        if not stale.any():
+            return
+        frames[stale] = -1
+        for owner in self._face_bbox_cache_owner_arr[stale].tolist():
+            self._face_bbox_cache_slot.pop(owner, None)
+        self._face_bbox_cache_owner_arr[stale] = -1
+
+    def _bbox_array(self, detections: List[Dict]) -> np.ndarray:
+        """
+        Stack detection bboxes into one array.
+
+        Args:
+            detections: Frame detections
+
+        Returns:
+            (N, 4) float64 xyxy boxes, NaN rows where the bbox could not be parsed
+        """
+        boxes = np.full((len(detections), 4), np.nan, dtype=np.float64)
+        for i, d in enumerate(detections):
+            bbox = d.get("bbox")
+            # Detector bboxes are sequences; the tolerant parser handles anything else
+            xyxy = _bbox_xyxy_fast(bbox)
+            x1, y1, x2, y2 = xyxy if xyxy is not None else self._parse_bbox_xyxy(bbox)
+            if x1 is not None and y1 is not None and x2 is not None and y2 is not None:
+                boxes[i] = (x1, y1, x2, y2)
+        return boxes
+
+    def _stage_db_rows(self, detections: List[Dict]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Snapshot the fields stored per detection into arrays.
+
+        Args:
+            detections: Frame detections
+
+        Returns:
+            (boxes, confidences): _bbox_array boxes and (N,) float32 detection confidences
+        """
+        confs = np.fromiter(
+            (d.get("confidence", 0.0) for d in detections),
+            dtype=np.float32,
+            count=len(detections),
+        )
+        return self._bbox_array(detections), confs
 
     def _store_detections(
         self,
-        detections: List[Dict],
+        now_ms: int,
         frame_num: int,
-        track_id_to_gender: Dict[int, str],
-        track_id_to_gender_conf: Dict[int, float],
+        track_ids: np.ndarray,
+        boxes: np.ndarray,
+        confidences: np.ndarray,
+        gender_codes: np.ndarray,
+        gender_confs: np.ndarray,
     ) -> None:
-        """Store detections in database buffer."""
+        """Store detections in database buffer (all arrays aligned per detection).
+
+        now_ms is the frame's monotonic clock in ms, used for the flush interval.
+        """
         if self.db_manager is None:
             return
 
         now = datetime.now()
-        for d in detections:
-            bbox = d.get("bbox")
-            x1, y1, x2, y2 = self._parse_bbox_xyxy(bbox)
-            if x1 is None or y1 is None or x2 is None or y2 is None:
-                continue
-
-            track_id = d.get("track_id")
-            gender = track_id_to_gender.get(int(track_id)) if track_id else None
-            gender_conf = (
-                track_id_to_gender_conf.get(int(track_id)) if track_id else None
-            )
-
-            detection_obj = PersonDetection(
-                timestamp=now,
-                camera_id=self.camera_id,
-                channel_id=self.channel_id,
-                detection_id=f"{self.camera_id}_{self.channel_id}_{frame_num}_{track_id}",
-                track_id=track_id,
-                confidence=float(d.get("confidence", 0.0)),
-                bbox=(int(x1), int(y1), int(x2 - x1), int(y2 - y1)),
-                gender=gender,
-                gender_confidence=gender_conf,
-                frame_number=frame_num,
+        valid = ~np.isnan(boxes).any(axis=1)
+        for t_id, box, det_conf, code, conf in zip(
+            track_ids[valid].tolist(),
+            boxes[valid].tolist(),
+            confidences[valid].tolist(),
+            gender_codes[valid].tolist(),
+            gender_confs[valid].tolist(),
+        ):
+            x1, y1, x2, y2 = box
+            track_id = t_id if t_id >= 0 else None
+            # Classified tracks store their voted label, including "Unknown"
+            if code >= 0:
+                gender, gender_conf = GENDER_LABELS[code], conf
+            elif code == GENDER_CODE_UNKNOWN:
+                gender, gender_conf = "Unknown", conf
+            else:
+                gender, gender_conf = None, None
+
+            # DETECTION_COLUMNS order
+            self._db_buffer.append(
+                (
+                    now,
+                    self.camera_id,
+                    self.channel_id,
+                    f"{self.camera_id}_{self.channel_id}_{frame_num}_{track_id}",
+                    track_id,
+                    det_conf,
+                    int(x1),
+                    int(y1),
+                    int(x2 - x1),
+                    int(y2 - y1),
+                    gender,
+                    gender_conf,
+                    frame_num,
+                )
             )
-            self._db_buffer.append(detection_obj)
 
         # Flush if buffer full or interval reached
-        current_ms = time.time() * 1000.0
-        if (
-            len(self._db_buffer) >= self.db_batch_size
-            or (current_ms - self._last_db_flush_ms) >= self.db_flush_interval_ms
-        ):
-            if len(self._db_buffer) > 0:
-                count = self.db_manager.insert_detections(self._db_buffer)
-                logger.debug("DB flush inserted=%d", count)
-                self._db_buffer.clear()
-                self._last_db_flush_ms = current_ms
+        if len(self._db_buffer) >= self.db_batch_size:
+            self._flush_db_buffer(now_ms)
+        else:
+            self._flush_db_buffer_if_stale(now_ms)
+
+    def _maybe_flush_db(self, now_ms: int) -> None:
+        """Queue a time-based flush check at most once per db_flush_interval_ms.
+
+        Args:
+            now_ms: Monotonic clock in integer milliseconds
+        """
+        # With batch size 1 every stored row is flushed immediately
+        if self.db_manager is None or self.db_batch_size <= 1:
+            return
+        if now_ms < self._next_db_flush_check_ms:
+            return
+        self._next_db_flush_check_ms = now_ms + self.db_flush_interval_ms
+        self._submit_db_write(True, self._flush_db_buffer_if_stale, now_ms)
+
+    def _flush_db_buffer_if_stale(self, now_ms: int) -> None:
+        """Flush the buffer when db_flush_interval_ms has passed since the last flush."""
+        if (now_ms - self._last_db_flush_ms) >= self.db_flush_interval_ms:
+            self._flush_db_buffer(now_ms)
+
+    def _flush_db_buffer(self, now_ms: int) -> None:
+        """Write out buffered detection rows (runs on the db-writer thread)."""
+        if self.db_manager is None or len(self._db_buffer) == 0:
+            return
+        count = self.db_manager.copy_detection_rows(self._db_buffer)
+        logger.debug("DB flush inserted=%d", count)
+        self._db_buffer.clear()
+        self._last_db_flush_ms = now_ms
 
     def _finalize_db_storage(
         self,
-        unique_track_ids: set,
-        track_id_to_gender: Dict[int, str],
-        track_id_to_gender_conf: Dict[int, float],
+        unique_track_ids: np.ndarray,
         session_id: str,
     ) -> None:
         """Finalize database storage with track genders and summary."""
@@ -1474,26 +1945,20 @@ class LiveCameraProcessor:
 
         # Final flush
         if len(self._db_buffer) > 0:
-            count = self.db_manager.insert_detections(self._db_buffer)
+            count = self.db_manager.copy_detection_rows(self._db_buffer)
             logger.info("Final DB flush inserted=%d", count)
             self._db_buffer.clear()
 
         # Store track genders
-        male_count = 0
-        female_count = 0
-        unknown_count = 0
-
-        for track_id in unique_track_ids:
-            gender = track_id_to_gender.get(track_id, "Unknown")
-            conf = track_id_to_gender_conf.get(track_id, 0.0)
-
-            if gender == "M":
-                male_count += 1
-            elif gender == "F":
-                female_count += 1
-            else:
-                unknown_count += 1
+        codes = self._track_gender[unique_track_ids]
+        confs = self._track_gender_conf[unique_track_ids]
+        male_count, female_count = (
+            int(n) for n in np.bincount(codes[codes >= 0], minlength=len(GENDER_LABELS))[:2]
+        )
+        unknown_count = len(unique_track_ids) - male_count - female_count
 
+        for track_id, code, conf in zip(unique_track_ids.tolist(), codes.tolist(), confs.tolist()):
+            gender = GENDER_LABELS[code] if code >= 0 else "Unknown"
             try:
                 self.db_manager.upsert_track_gender(
                     camera_id=self.camera_id,
@@ -1528,6 +1993,236 @@ class LiveCameraProcessor:
         """Request graceful shutdown."""
         self._shutdown_requested = True
 
+    def _downscale_for_detection(self, frame: np.ndarray) -> Tuple[np.ndarray, float, float]:
+        """Resize a frame to the detection input size.
+
+        Returns:
+            (resized frame, scale_w, scale_h) to map bboxes back to the original frame
+        """
+        self._last_detect_buffer = None
+        h_orig, w_orig = frame.shape[:2]
+        plan = self._detect_resize_plan
+        if plan is None or plan[0] != (w_orig, h_orig):
+            target_w, target_h = self._detect_size
+            needs_resize = w_orig > target_w or h_orig > target_h
+            if needs_resize:
+                scale_w, scale_h = w_orig / target_w, h_orig / target_h
+                # INTER_AREA is both cheaper and alias-free for large downsample ratios
+                interpolation = (
+                    cv2.INTER_AREA if min(scale_w, scale_h) >= 2.0 else cv2.INTER_LINEAR
+                )
+                plan = ((w_orig, h_orig), True, scale_w, scale_h, interpolation)
+            else:
+                plan = ((w_orig, h_orig), False, 1.0, 1.0, cv2.INTER_LINEAR)
+            self._detect_resize_plan = plan
+            if needs_resize and self._opencl_resize_enabled:
+                self._use_opencl_resize = self._calibrate_opencl_resize(frame, plan[4])
+
+        _, needs_resize, scale_w, scale_h, interpolation = plan
+        if not needs_resize:
+            return frame, 1.0, 1.0
+
+        if self._use_opencl_resize:
+            # Detector consumes host arrays, so download right after the GPU resize
+            small = cv2.resize(
+                cv2.UMat(frame), self._detect_size, interpolation=interpolation
+            ).get()
+        else:
+            idx = self._acquire_detect_buffer(frame)
+            small = cv2.resize(
+                frame, self._detect_size, dst=self._detect_buffers[idx], interpolation=interpolation
+            )
+            self._last_detect_buffer = idx
+        return small, scale_w, scale_h
+
+    def _calibrate_opencl_resize(self, frame: np.ndarray, interpolation: int) -> bool:
+        """Time the OpenCL downscale (including upload/download) against the CPU one.
+
+        Returns:
+            True if the OpenCL path is faster for this source frame size
+        """
+        cpu_dst = np.empty(
+            (self._detect_size[1], self._detect_size[0]) + frame.shape[2:], dtype=frame.dtype
+        )
+
+        def _run_ocl() -> None:
+            cv2.resize(cv2.UMat(frame), self._detect_size, interpolation=interpolation).get()
+
+        def _run_cpu() -> None:
+            cv2.resize(frame, self._detect_size, dst=cpu_dst, interpolation=interpolation)
+
+        def _median_ms(fn) -> float:
+            fn()  # First call compiles OpenCL kernels / warms caches
+            times = []
+            for _ in range(OPENCL_CALIBRATION_RUNS):
+                start = time.perf_counter()
+                fn()
+                times.append((time.perf_counter() - start) * 1000.0)
+            return float(np.median(times))
+
+        try:
+            ocl_ms = _median_ms(_run_ocl)
+        except cv2.error as e:
+            logger.warning("OpenCL downscale failed, using CPU: %s", e)
+            return False
+        cpu_ms = _median_ms(_run_cpu)
+        use_ocl = ocl_ms < cpu_ms
+        logger.info(
+            "Detection downscale %dx%d: OpenCL %.2fms vs CPU %.2fms -> %s",
+            frame.shape[1],
+            frame.shape[0],
+            ocl_ms,
+            cpu_ms,
+            "OpenCL" if use_ocl else "CPU",
+        )
+        return use_ocl
+
+    def _acquire_detect_buffer(self, frame: np.ndarray) -> int:
+        """Return the index of a resize buffer not referenced by a pending detection."""
+        target_w, target_h = self._detect_size
+        shape = (target_h, target_w) + frame.shape[2:]
+        for idx, future in enumerate(self._detect_buffer_futures):
+            buf = self._detect_buffers[idx]
+            idle = future is None or future.done()
+            if idle and buf.shape == shape and buf.dtype == frame.dtype:
+                self._detect_buffer_futures[idx] = None
+                return idx
+        self._detect_buffers.append(np.empty(shape, dtype=frame.dtype))
+        self._detect_buffer_futures.append(None)
+        return len(self._detect_buffers) - 1
+
+    def _render_frame(
+        self, frame: np.ndarray, display_detections: List[Mapping[str, Any]]
+    ) -> np.ndarray:
+        """Annotate a frame and shrink it to the display width (runs on the render thread)."""
+        # The main loop still crops gender faces from frame, so draw on one private copy
+        annotated = frame.copy()
+        if len(display_detections) > 0:
+            self.processor.draw_detections(annotated, display_detections, inplace=True)
+        if self.counter is not None:
+            self.counter.draw_zones(annotated, inplace=True)
+
+        # Resize frame for display to reduce lag (only if larger than max width)
+        h, w = annotated.shape[:2]
+        if w > self.display_max_width:
+            dims = self._display_dims.get((w, h))
+            if dims is None:
+                scale = self.display_max_width / w
+                dims = (int(w * scale), int(h * scale))
+                self._display_dims[(w, h)] = dims
+            # Always a downscale here, where INTER_AREA avoids aliasing
+            annotated = cv2.resize(
+                annotated,
+                dims,
+                dst=self._next_display_buffer(dims, annotated),
+                interpolation=cv2.INTER_AREA,
+            )
+        return annotated
+
+    def _next_display_buffer(self, dims: Tuple[int, int], frame: np.ndarray) -> np.ndarray:
+        """Return the next reusable display-size buffer (render thread only)."""
+        shape = (dims[1], dims[0]) + frame.shape[2:]
+        if len(self._display_buffers) < RENDER_QUEUE_DEPTH + 1:
+            buf = np.empty(shape, dtype=frame.dtype)
+            self._display_buffers.append(buf)
+            self._display_buffer_idx = len(self._display_buffers) - 1
+            return buf
+        self._display_buffer_idx = (self._display_buffer_idx + 1) % len(self._display_buffers)
+        buf = self._display_buffers[self._display_buffer_idx]
+        if buf.shape != shape or buf.dtype != frame.dtype:
+            buf = np.empty(shape, dtype=frame.dtype)
+            self._display_buffers[self._display_buffer_idx] = buf
+        return buf
+
+    def _submit_render(
+        self, frame: np.ndarray, display_detections: List[Mapping[str, Any]]
+    ) -> None:
+        """Queue a frame for annotation, dropping the oldest pending render when full."""
+        if self._render_executor is None:
+            return
+        if len(self._render_futures) >= RENDER_QUEUE_DEPTH:
+            self._render_futures.popleft().cancel()
+        self._render_futures.append(
+            self._render_executor.submit(self._render_frame, frame, display_detections)
+        )
+
+    def _show_rendered(self, window_name: str) -> bool:
+        """Display the newest completed render, discarding older completed ones.
+
+        Returns:
+            True if a frame was shown
+        """
+        latest: Optional[Future] = None
+        while self._render_futures and self._render_futures[0].done():
+            future = self._render_futures.popleft()
+            if not future.cancelled():
+                latest = future
+        if latest is None:
+            return False
+        try:
+            display_frame = latest.result()
+        except Exception as e:
+            logger.debug("Render failed: %s", e)
+            return False
+        if self._display_sink is not None:
+            # Dropped when the display process is still busy with the previous frame
+            if not self._display_sink.show(display_frame):
+                return False
+        else:
+            cv2.imshow(window_name, display_frame)
+        self._display_frame_count += 1
+        return True
+
+    def _submit_detection(
+        self,
+        small_frame: np.ndarray,
+        frame_num: int,
+        scale_w: float,
+        scale_h: float,
+    ) -> None:
+        """Submit a detection into the free slot of the double buffer.
+
+        The first free slot becomes active; otherwise the staged slot is
+        (re)filled so only the most recent pending frame is kept.
+        """
+        future = self._detection_executor.submit(
+            self._detect_frame_async,
+            small_frame,
+            frame_num,
+            scale_w,
+            scale_h,
+        )
+        if self._last_detect_buffer is not None:
+            # Keep the resize buffer reserved until the worker is done reading it
+            self._detect_buffer_futures[self._last_detect_buffer] = future
+            self._last_detect_buffer = None
+        if self._fut_active is None:
+            self._fut_active = future
+        else:
+            if self._fut_staged is not None:
+                # Superseded before a worker picked it up: don't spend inference on it
+                self._fut_staged.cancel()
+            self._fut_staged = future
+
+    def _collect_detection_result(self) -> None:
+        """Consume the active detection slot if done and promote the staged one.
+
+        Polls ``Future.done()`` so frames without a finished detection never wait.
+        """
+        if self._fut_active is None or not self._fut_active.done():
+            return
+        prev_frame_num, prev_detections = self._fut_active.result()
+        self._cached_detections = prev_detections
+        self._last_detect_frame = prev_frame_num
+        if len(prev_detections) > 0 and logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Got detection result from frame %d: %d persons",
+                prev_frame_num,
+                len(prev_detections),
+            )
+        self._fut_active = self._fut_staged
+        self._fut_staged = None
+
     def _detect_frame_async(
         self,
         frame: np.ndarray,
@@ -1553,38 +2248,51 @@ class LiveCameraProcessor:
 
                     # Detections are already in dict format:
                     # [{"bbox": [x1, y1, x2, y2], "confidence": float, "class_id": int, "class_name": str}, ...]
-                    # Filter by confidence (already filtered by detector's conf_threshold, but double-check)
-                    detections = [
-                        det
-                        for det in detections
-                        if det.get("confidence", 0.0) >= self.conf_threshold
-                        and det.get("class_id", -1) == 0  # Person class
-                    ]
-
-                    # Scale bboxes back to original frame size
-                    if scale_w != 1.0 or scale_h != 1.0:
-                        for det in detections:
-                            bbox = det.get("bbox", [])
-                            if len(bbox) >= 4:
-                                det["bbox"] = [
-                                    bbox[0] * scale_w,
-                                    bbox[1] * scale_h,
-                                    bbox[2] * scale_w,
-                                    bbox[3] * scale_h,
-                                ]
-
-                    # Log detection result (debugging)
-                    if len(detections) > 0:
-                        logger.debug(
-                            "Async YOLOv8 detection [frame %d]: Found %d persons",
-                            frame_num,
-                            len(detections),
+                    # Pack bboxes into one contiguous (N, 4) array and scale back to
+                    # original frame size in a single vectorized op. Each kept detection gets
+                    # a row view, so downstream code sees the same [x1, y1, x2, y2] shape.
+                    if detections:
+                        n = len(detections)
+                        boxes = np.array(
+                            [det["bbox"][:4] for det in detections], dtype=np.float32
+                        ).reshape(n, 4)
+                        confs = np.fromiter(
+                            (det.get("confidence", 0.0) for det in detections),
+                            dtype=np.float32,
+                            count=n,
                         )
-                    else:
-                        logger.debug(
-                            "Async YOLOv8 detection [frame %d]: No persons detected",
-                            frame_num,
+                        class_ids = np.fromiter(
+                            (det.get("class_id", -1) for det in detections),
+                            dtype=np.int64,
+                            count=n,
                         )
+                        # Confidence (already filtered by detector's conf_threshold, but
+                        # double-check) and person class, as one mask
+                        keep = np.flatnonzero((confs >= self.conf_threshold) & (class_ids == 0))
+                        if scale_w != 1.0 or scale_h != 1.0:
+                            boxes *= np.array(
+                                [scale_w, scale_h, scale_w, scale_h], dtype=np.float32
+                            )
+                        kept = []
+                        for i in keep.tolist():
+                            det = detections[i]
+                            det["bbox"] = boxes[i]
+                            kept.append(det)
+                        detections = kept
+
+                    # Log detection result (debugging)
+                    if logger.isEnabledFor(logging.DEBUG):
+                        if len(detections) > 0:
+                            logger.debug(
+                                "Async YOLOv8 detection [frame %d]: Found %d persons",
+                                frame_num,
+                                len(detections),
+                            )
+                        else:
+                            logger.debug(
+                                "Async YOLOv8 detection [frame %d]: No persons detected",
+                                frame_num,
+                            )
 
                     return frame_num, detections
                 except Exception as e:
@@ -1599,23 +2307,89 @@ class LiveCameraProcessor:
             logger.error("Async detection error: %s", e, exc_info=True)
         return frame_num, []
 
-    def _store_detections_async(
-        self,
-        detections: List[Dict],
-        frame_num: int,
-        track_id_to_gender: Dict[int, str],
-        track_id_to_gender_conf: Dict[int, float],
+    def _store_counter_events(
+        self, events: List[Dict], frame_num: int, session_id: str
     ) -> None:
-        """Store detections asynchronously in worker thread."""
+        """Persist a frame's counter events as one multi-row insert (best-effort)."""
+        if self.db_manager is None or not events:
+            return
+        extra_json = {"run_id": self.run_id or "", "session_id": session_id}
+        rows = [
+            {
+                "channel_id": self.channel_id,
+                "zone_id": str(event.get("zone_id")),
+                "zone_name": str(event.get("zone_name")),
+                "event_type": str(event.get("type")),
+                "track_id": int(event["track_id"]) if event.get("track_id") is not None else None,
+                "person_id": None,
+                "frame_number": int(frame_num),
+                "extra_json": extra_json,
+            }
+            for event in events
+        ]
         try:
-            self._store_detections(
-                detections,
-                frame_num,
-                track_id_to_gender,
-                track_id_to_gender_conf,
-            )
+            self.db_manager.insert_counter_events(rows)
         except Exception as e:
-            logger.error("Async DB write error: %s", e)
+            logger.debug("Failed to insert counter_events: %s", e)
+
+    def _submit_db_write(self, droppable: bool, func: Callable[..., None], *args: Any) -> None:
+        """
+        Queue a DB write for the writer thread (runs inline without one).
+
+        Args:
+            droppable: True for detection rows and flush checks, which are dropped when
+                the queue is full; False for business data such as counter events,
+                which waits for room instead
+            func: Write to run on the writer thread
+            *args: Arguments for func
+        """
+        if self._db_thread is None:
+            func(*args)
+            return
+        item = (func, args)
+        if droppable:
+            try:
+                self._db_queue.put_nowait(item)
+            except queue.Full:
+                self._record_db_drop()
+            return
+        while True:
+            try:
+                self._db_queue.put(item, timeout=1.0)
+                return
+            except queue.Full:
+                if not self._db_thread.is_alive():
+                    self._record_db_drop()
+                    return
+
+    def _record_db_drop(self) -> None:
+        """Count a dropped DB write and warn at most every DB_DROP_WARN_INTERVAL_S."""
+        self._bump_stats(db_dropped=1)
+        self._db_dropped_unreported += 1
+        now = time.monotonic()
+        if now - self._db_drop_warned_at >= DB_DROP_WARN_INTERVAL_S:
+            logger.warning(
+                "DB writer backlog: dropped %d write(s) (queue size %d)",
+                self._db_dropped_unreported,
+                DB_QUEUE_SIZE,
+            )
+            self._db_dropped_unreported = 0
+            self._db_drop_warned_at = now
+
+    def _db_writer_worker(self) -> None:
+        """Run queued DB writes in submission order until the None sentinel."""
+        while True:
+            item = self._db_queue.get()
+            try:
+                if item is None:
+                    return
+                func, args = item
+                try:
+                    func(*args)
+                except Exception as e:
+                    logger.error("Async DB write error: %s", e)
+            finally:
+                self._db_queue.task_done()
 
     def release(self) -> None:
         """Release all resources."""
@@ -1626,8 +2400,14 @@ class LiveCameraProcessor:
         # Shutdown executors
         if self._detection_executor is not None:
             self._detection_executor.shutdown(wait=True)
-        if self._db_executor is not None:
-            self._db_executor.shutdown(wait=True)
+        if self._db_thread is not None and self._db_thread.is_alive():
+            # Pending writes are still run before the sentinel is reached
+            self._db_queue.put(None)
+            self._db_thread.join()
+        if self._render_executor is not None:
+            self._render_executor.shutdown(wait=True, cancel_futures=True)
+        if self._display_sink is not None:
+            self._display_sink.close()
 
         # Wait for frame reader thread
         if (
@@ -1668,11 +2448,27 @@ def build_rtsp_url(
     return f"rtsp://{auth}{server_host}:{server_port}/Streaming/Channels/{channel_id:02d}01"
 
 
+def _gender_main_v1_preset(
+    processor_args: Dict[str, Any], db_dsn: Optional[str], redis_url: Optional[str]
+) -> Dict[str, Any]:
+    """Processor settings applied by the gender_main_v1 preset."""
+    update = {**GENDER_MAIN_V1_PRESET, "db_dsn": db_dsn, "redis_url": redis_url}
+    # Don't override conf_threshold if explicitly set
+    if "conf_threshold" not in processor_args:
+        update["conf_threshold"] = 0.75  # Higher threshold for preset to reduce false positives
+    return update
+
+
+# Preset name -> function(processor_args, db_dsn, redis_url) returning the settings to apply
+PRESETS: Dict[
+    str, Callable[[Dict[str, Any], Optional[str], Optional[str]], Dict[str, Any]]
+] = {
+    "gender_main_v1": _gender_main_v1_preset,
+}
+
+
 def main() -> None:
     """Main entry point."""
-    import fcntl
-    import os
-
     parser = argparse.ArgumentParser(
         description="Process live RTSP camera streams with person detection"
     )
@@ -1710,7 +2506,7 @@ def main() -> None:
         "--preset",
         type=str,
         default=None,
-        choices=["gender_main_v1"],
+        choices=sorted(PRESETS),
         help="Optional named preset",
     )
     parser.add_argument(
@@ -1737,6 +2533,11 @@ def main() -> None:
         default=12.0,
         help="Display update rate (FPS) to reduce lag (default: 12.0)",
     )
+    parser.add_argument(
+        "--display-process",
+        action="store_true",
+        help="Show the display window from a separate process (keeps GUI work off the main loop)",
+    )
     parser.add_argument(
         "--conf-threshold",
         type=float,
@@ -1757,50 +2558,17 @@ def main() -> None:
     logging.getLogger().setLevel(level)
 
     try:
-        # Load camera config
-        config_path = Path(args.config)
-        if not config_path.exists():
-            logger.error("Camera config not found: %s", config_path)
-            sys.exit(1)
-
-        camera_config = load_camera_config(config_path)
-        channel_config = camera_config.get_channel(args.channel_id)
-
-        if channel_config is None:
-            logger.error("Channel %d not found in config", args.channel_id)
-            sys.exit(1)
-
-        # Use RTSP URL from config if available, otherwise build it
-        rtsp_url = channel_config.get("rtsp_url")
-        if not rtsp_url:
-            server_info = camera_config.get_server_info()
-            credentials = camera_config.get_credentials()
-            rtsp_url = build_rtsp_url(
-                server_info["host"],
-                server_info["port"],
-                args.channel_id,
-                credentials,
-            )
-            logger.warning("Using auto-built RTSP URL (not in config)")
-
-        credentials = camera_config.get_credentials()
-        logger.info(
-            "RTSP URL: %s", rtsp_url.replace(credentials.get("password", ""), "***")
-        )
-
         # Lock file to prevent multiple instances of same channel
-        # Each channel has its own lock file (moved here so we have channel_id)
-        import fcntl
-        import os
-
+        # Each channel has its own lock file; taken before any config parsing so a
+        # duplicate launch exits after one open + flock
         lock_file = Path(f"/tmp/kidsplaza_live_camera_ch{args.channel_id}.lock")
         try:
-            # Try to acquire exclusive lock (non-blocking)
-            lock_fd = os.open(str(lock_file), os.O_CREAT | os.O_WRONLY | os.O_TRUNC)
+            # Try to acquire exclusive lock (non-blocking); the lock lives in the kernel,
+            # so the file is never truncated or written
+            lock_fd = os.open(str(lock_file), os.O_CREAT | os.O_WRONLY | os.O_CLOEXEC, 0o644)
             fcntl.flock(lock_fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
-            # Keep lock file descriptor open
-            import atexit
 
+            # Keep lock file descriptor open
             def release_lock():
                 try:
                     fcntl.flock(lock_fd, fcntl.LOCK_UN)
@@ -1809,9 +2577,9 @@ def main() -> None:
                 except Exception:
                     pass
 
+            # Released at interpreter exit; signals are handled once the processor exists
+            # (the kernel drops the flock anyway if the process is killed before that)
             atexit.register(release_lock)
-            signal.signal(signal.SIGINT, lambda s, f: (release_lock(), sys.exit(0)))
-            signal.signal(signal.SIGTERM, lambda s, f: (release_lock(), sys.exit(0)))
         except (IOError, OSError):
             logger.error(
                 "Another instance of channel %d is already running! Exiting.",
@@ -1819,22 +2587,42 @@ def main() -> None:
             )
             sys.exit(1)
 
-        # Load database config if available
-        db_config_path = Path("config/database.json")
-        db_dsn = None
-        redis_url = None
-        if db_config_path.exists():
-            import json
+        # Load camera config
+        # Missing files surface as CameraConfigError from the load itself (no extra stat)
+        config_path = Path(args.config)
+        try:
+            camera_config = load_camera_config(config_path)
+        except CameraConfigError as e:
+            logger.error("%s", e)
+            sys.exit(1)
+        channel_config = camera_config.get_channel(args.channel_id)
 
-            with open(db_config_path) as f:
-                db_config = json.load(f)
-                db_dsn = db_config.get("postgresql", {}).get("dsn")
-                redis_url = db_config.get("redis", {}).get("url")
+        if channel_config is None:
+            logger.error("Channel %d not found in config", args.channel_id)
+            sys.exit(1)
 
-        # If DB DSN available, enable DB writes by default
-        if db_dsn:
-            processor_args["db_enable"] = True
-            processor_args["db_dsn"] = db_dsn
+        # Use RTSP URL from config if available, otherwise build it
+        rtsp_url = channel_config.get("rtsp_url")
+        if not rtsp_url:
+            server_info = camera_config.get_server_info()
+            rtsp_url = build_rtsp_url(
+                server_info["host"],
+                server_info["port"],
+                args.channel_id,
+                camera_config.get_credentials(),
+            )
+            logger.warning("Using auto-built RTSP URL (not in config)")
+
+        logger.info("RTSP URL: %s", redact_rtsp_url(rtsp_url))
+
+        # Load database config if available
+        db_config_path = Path("config/database.json")
+        try:
+            db_config = load_json_cached(db_config_path)
+        except FileNotFoundError:
+            db_config = {}
+        db_dsn = db_config.get("postgresql", {}).get("dsn")
+        redis_url = db_config.get("redis", {}).get("url")
 
         # Create processor (reuse VideoProcessor args pattern)
         # Initialize with defaults - will be overridden by config
@@ -1847,8 +2635,9 @@ def main() -> None:
             "run_id": args.run_id,
             "max_frames": args.max_frames,
             "display": args.display,
-            "display_fps": getattr(args, "display_fps", 12.0),
-            "conf_threshold": getattr(args, "conf_threshold", 0.5),
+            "display_fps": args.display_fps,
+            "display_process": args.display_process,
+            "conf_threshold": args.conf_threshold,
             # Tracker defaults (will be overridden by config)
             "tracker_max_age": 30,
             "tracker_min_hits": 2,
@@ -1856,43 +2645,20 @@ def main() -> None:
             "tracker_ema_alpha": 0.5,
         }
 
+        # If DB DSN available, enable DB writes by default
+        if db_dsn:
+            processor_args["db_enable"] = True
+            processor_args["db_dsn"] = db_dsn
+
         # Apply preset if specified
-        if args.preset == "gender_main_v1":
-            preset_update = {
-                "reid_enable": True,
-                "reid_every_k": 20,
-                "reid_ttl_seconds": 86400,  # 24 hours = 24 * 60 * 60 seconds (for daily person counting)
-                "reid_similarity_threshold": 0.65,
-                "reid_aggregation_method": "avg_sim",
-                "reid_append_mode": True,
-                "reid_max_embeddings": 3,
-                "gender_enable": True,
-                "gender_every_k": 15,
-                "gender_max_per_frame": 4,
-                "gender_model_type": "timm_mobile",
-                "gender_min_confidence": 0.50,
-                "gender_female_min_confidence": 0.50,
-                "gender_male_min_confidence": 0.50,
-                "gender_voting_window": 35,
-                "gender_adaptive_enabled": True,
-                "gender_queue_high_watermark": 200,
-                "gender_queue_low_watermark": 100,
-                "db_enable": True,
-                "db_dsn": db_dsn,
-                "db_batch_size": 200,
-                "db_flush_interval_ms": 500,
-                "redis_enable": True,
-                "redis_url": redis_url,
-            }
-            # Don't override conf_threshold if explicitly set
-            if "conf_threshold" not in processor_args:
-                preset_update[
-                    "conf_threshold"
-                ] = 0.75  # Higher threshold for preset to reduce false positives
-            processor_args.update(preset_update)
+        preset_fn = PRESETS.get(args.preset) if args.preset else None
+        preset_settings: Dict[str, Any] = (
+            preset_fn(processor_args, db_dsn, redis_url) if preset_fn is not None else {}
+        )
+        processor_args.update(preset_settings)
 
         # Override gender_enable if explicitly set via command line
-        if hasattr(args, "gender_enable") and args.gender_enable:
+        if args.gender_enable:
             processor_args["gender_enable"] = True
 
         # Load feature config from camera config
@@ -1908,42 +2674,64 @@ def main() -> None:
             # Load detect_every_n from config (per-channel override)
             if "detect_every_n" in body_config:
                 processor_args["detect_every_n"] = body_config.get("detect_every_n")
+            if "opencl_resize" in body_config:
+                processor_args["opencl_resize"] = bool(body_config.get("opencl_resize"))
+            # Per-channel detector model, e.g. yolov8n.onnx to run through ONNX Runtime
+            if body_config.get("model_path"):
+                processor_args["model_path"] = body_config["model_path"]
+            if "reader_decimation" in body_config:
+                processor_args["reader_decimation"] = bool(body_config.get("reader_decimation"))
+            if "hw_decode" in body_config:
+                processor_args["hw_decode"] = bool(body_config.get("hw_decode"))
             
             # Load tracking config
             tracking_config = channel_features.get("tracking", {})
             if tracking_config.get("enabled", True):
-                processor_args["tracker_max_age"] = tracking_config.get("max_age", 30)
-                processor_args["tracker_min_hits"] = tracking_config.get("min_hits", 2)
-                processor_args["tracker_iou_threshold"] = tracking_config.get("iou_threshold", 0.3)
-                processor_args["tracker_ema_alpha"] = tracking_config.get("ema_alpha", 0.5)
+                processor_args.update(
+                    {
+                        "tracker_max_age": tracking_config.get("max_age", 30),
+                        "tracker_min_hits": tracking_config.get("min_hits", 2),
+                        "tracker_iou_threshold": tracking_config.get("iou_threshold", 0.3),
+                        "tracker_ema_alpha": tracking_config.get("ema_alpha", 0.5),
+                    }
+                )
             
-            # Load Re-ID config if not in preset
-            if args.preset != "gender_main_v1":
+            # Load Re-ID config unless the preset already configures Re-ID
+            if "reid_enable" not in preset_settings:
                 reid_config = channel_features.get("reid", {})
                 if reid_config.get("enabled", False):
-                    processor_args["reid_enable"] = True
-                    processor_args["reid_every_k"] = reid_config.get("every_k_frames", 20)
-                    processor_args["reid_ttl_seconds"] = reid_config.get("ttl_seconds", 60)
-                    processor_args["reid_similarity_threshold"] = reid_config.get("similarity_threshold", 0.65)
-                    processor_args["reid_aggregation_method"] = reid_config.get("aggregation_method", "single")
-                    processor_args["reid_append_mode"] = reid_config.get("append_mode", False)
-                    processor_args["reid_max_embeddings"] = reid_config.get("max_embeddings", 1)
-                    # Prefer ArcFace face-based embeddings (GPU-capable)
-                    processor_args["reid_use_face"] = True
+                    processor_args.update(
+                        {
+                            "reid_enable": True,
+                            "reid_every_k": reid_config.get("every_k_frames", 20),
+                            "reid_ttl_seconds": reid_config.get("ttl_seconds", 60),
+                            "reid_similarity_threshold": reid_config.get("similarity_threshold", 0.65),
+                            "reid_aggregation_method": reid_config.get("aggregation_method", "single"),
+                            "reid_append_mode": reid_config.get("append_mode", False),
+                            "reid_max_embeddings": reid_config.get("max_embeddings", 1),
+                            # Prefer ArcFace face-based embeddings (GPU-capable)
+                            "reid_use_face": True,
+                        }
+                    )
             
             # Load gender classification config if not explicitly set
-            if not hasattr(args, "gender_enable") or not args.gender_enable:
+            if not args.gender_enable:
                 gender_config = channel_features.get("gender_classification", {})
                 if gender_config.get("enabled", False):
-                    processor_args["gender_enable"] = True
-                    processor_args["gender_every_k"] = gender_config.get("every_k_frames", 20)
-                    processor_args["gender_model_type"] = gender_config.get("model_type", "timm_mobile")
-                    processor_args["gender_min_confidence"] = gender_config.get("min_confidence", 0.5)
-                    processor_args["gender_female_min_confidence"] = gender_config.get("female_min_confidence")
-                    processor_args["gender_male_min_confidence"] = gender_config.get("male_min_confidence")
-                    processor_args["gender_voting_window"] = gender_config.get("voting_window", 10)
-                    processor_args["gender_max_per_frame"] = gender_config.get("max_per_frame", 4)
-                    processor_args["gender_adaptive_enabled"] = gender_config.get("adaptive_enabled", False)
+                    processor_args.update(
+                        {
+                            "gender_enable": True,
+                            "gender_every_k": gender_config.get("every_k_frames", 20),
+                            "gender_model_type": gender_config.get("model_type", "timm_mobile"),
+                            "gender_min_confidence": gender_config.get("min_confidence", 0.5),
+                            "gender_female_min_confidence": gender_config.get("female_min_confidence"),
+                            "gender_male_min_confidence": gender_config.get("male_min_confidence"),
+                            "gender_voting_window": gender_config.get("voting_window", 10),
+                            "gender_max_per_frame": gender_config.get("max_per_frame", 4),
+                            "gender_adaptive_enabled": gender_config.get("adaptive_enabled", False),
+                            "gender_lock_confidence": gender_config.get("lock_confidence"),
+                        }
+                    )
             
             # Load counter config
             counter_config = channel_features.get("counter", {})
@@ -1968,7 +2756,8 @@ def main() -> None:
 
         processor = LiveCameraProcessor(**processor_args)
 
-        # Setup signal handlers for graceful shutdown
+        # Setup signal handlers for graceful shutdown; process_stream() then returns
+        # normally, so release() and the atexit lock release both run
         def signal_handler(signum, frame):
             logger.info("Received shutdown signal")
             processor.request_shutdown()
@@ -1980,11 +2769,13 @@ def main() -> None:
             # Process stream
             result = processor.process_stream()
 
-            logger.info("Processing complete")
-            logger.info("Frames: %d", result["frames_processed"])
-            logger.info("Time: %.2fs", result["processing_time_seconds"])
-            logger.info("FPS: %.2f", result["avg_fps"])
-            logger.info("Tracks: %d", result["unique_tracks"])
+            logger.info(
+                "Processing complete: frames=%d time=%.2fs fps=%.2f tracks=%d",
+                result["frames_processed"],
+                result["processing_time_seconds"],
+                result["avg_fps"],
+                result["unique_tracks"],
+            )
 
         finally:
             processor.release()
@@ -7,13 +7,17 @@ Optimized for Apple M4 Pro with MPS acceleration.
 """
 
 import argparse
+import functools
 import json
 import logging
+import queue
 import sys
+import threading
 import time
+from collections import deque
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, cast
+from typing import Any, Dict, List, Optional, Tuple, cast
 
 import cv2
 import numpy as np
@@ -41,6 +45,17 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Initial size of the seen-track bitmap; grown by doubling if ids exceed it
+TRACK_SLOTS = 1 << 16
+
+# Decoded frames the reader thread may hold ahead of detection
+READ_AHEAD_FRAMES = 8
+
+
+def _now_ms() -> int:
+    """Monotonic clock in integer milliseconds (immune to wall-clock adjustments)."""
+    return time.monotonic_ns() // 1_000_000
+
 
 class VideoProcessor:
     """Process video files with detection pipeline."""
@@ -86,6 +101,7 @@ class VideoProcessor:
         db_flush_interval_ms: int = 500,
         redis_enable: bool = False,
         redis_url: Optional[str] = None,
+        detect_batch_size: int = 1,
     ) -> None:
         """
         Initialize video processor.
@@ -94,6 +110,7 @@ class VideoProcessor:
             model_path: Path to YOLOv8 model
             output_dir: Output directory for results
             conf_threshold: Detection confidence threshold
+            detect_batch_size: Frames read ahead and detected in one model call
         """
         base_output = Path(output_dir)
         base_output.mkdir(parents=True, exist_ok=True)
@@ -109,6 +126,7 @@ class VideoProcessor:
 
         # Initialize detector
         self.detector = Detector(model_path=model_path, conf_threshold=conf_threshold)
+        self.detect_batch_size = max(1, int(detect_batch_size))
 
         # Initialize tracker
         self.tracker = Tracker(
@@ -167,7 +185,7 @@ class VideoProcessor:
 
         # DB buffering
         self._db_buffer: List[PersonDetection] = []
-        self._last_db_flush_ms: float = time.time() * 1000.0
+        self._last_db_flush_ms: int = _now_ms()
 
         # Initialize Gender components (optional)
         self.gender_enable = gender_enable
@@ -255,20 +273,18 @@ class VideoProcessor:
         Returns:
             Frame with overlay
         """
-        overlay = frame.copy()
-
         # Calculate FPS
         fps = frame_num / elapsed_time if elapsed_time > 0 else 0
 
         # Info box background (top-left)
-        h, w = frame.shape[:2]
         box_height = 210
         box_width = 300
-        overlay = cv2.rectangle(overlay, (0, 0), (box_width, box_height), (0, 0, 0), -1)
 
-        # Add semi-transparent background
+        # Add semi-transparent black background; only the box region changes, so
+        # blend that region alone (filled rectangle corners are inclusive)
         alpha = 0.5
-        cv2.addWeighted(overlay, alpha, frame, 1 - alpha, 0, frame)
+        roi = frame[: box_height + 1, : box_width + 1]
+        cv2.addWeighted(np.zeros_like(roi), alpha, roi, 1 - alpha, 0, roi)
 
         # Draw info text
         font = cv2.FONT_HERSHEY_SIMPLEX
@@ -385,6 +401,75 @@ class VideoProcessor:
 
         return frame
 
+    @staticmethod
+    def _gender_infer(
+        crops: List[np.ndarray],
+        track_ids: List[int],
+        use_face: List[bool],
+        gc: Optional[GenderClassifier],
+        fgc: Optional[Any],
+        metrics: Optional[GenderMetrics],
+    ) -> List[Tuple[str, float]]:
+        """
+        Classify one frame's gender crops (runs on a gender worker).
+
+        Face crops share one forward pass of the face classifier; body crops, and
+        face crops when it is unavailable, use the per-track classifier.
+
+        Args:
+            crops: Face or upper-body crops
+            track_ids: Track id per crop
+            use_face: Whether each crop is a face crop
+            gc: Per-track body classifier
+            fgc: Face gender classifier with classify_batch
+            metrics: Gender metrics receiving the batch latency
+
+        Returns:
+            (gender, confidence) per crop
+        """
+        start_ns = time.monotonic_ns()
+        results: List[Optional[Tuple[str, float]]] = [None] * len(crops)
+        face_idx = [i for i, f in enumerate(use_face) if f and fgc is not None]
+        if face_idx:
+            assert fgc is not None
+            face_results = fgc.classify_batch([crops[i] for i in face_idx])
+            for i, res in zip(face_idx, face_results):
+                results[i] = res
+        for i, res in enumerate(results):
+            if res is None:
+                # gc is not None by branch guards
+                assert gc is not None
+                results[i] = gc.classify(crops[i], track_id=track_ids[i])
+        if metrics is not None:
+            metrics.observe_latency((time.monotonic_ns() - start_ns) / 1e6)
+        return [(gender, float(gconf)) for gender, gconf in cast(List[Tuple[str, float]], results)]
+
+    @staticmethod
+    def _read_frames(
+        cap: cv2.VideoCapture,
+        frame_queue: "queue.Queue[Optional[np.ndarray]]",
+        stop: threading.Event,
+        max_frames: int,
+    ) -> None:
+        """Decode up to max_frames frames into frame_queue, then put the None sentinel.
+
+        Every frame is kept (the queue applies backpressure instead of dropping), so
+        results match reading inline.
+        """
+        read = 0
+        while read < max_frames and not stop.is_set():
+            ret, frame = cap.read()
+            if not ret:
+                break
+            while not stop.is_set():
+                try:
+                    frame_queue.put(frame, timeout=0.1)
+                    break
+                except queue.Full:
+                    continue
+            read += 1
+        frame_queue.put(None)
+
     def process_video(
         self,
         video_path: Path,
@@ -450,7 +535,9 @@ class VideoProcessor:
         max_frames = min(total_frames, fps * 60 * 3)  # 3 minutes max
         start_time = time.time()
         session_id = video_path.stem
-        unique_track_ids = set()
+        # Seen flag per track id; the unique count is the number of set flags
+        seen_tracks = np.zeros(TRACK_SLOTS, dtype=bool)
+        unique_count = 0
         # Maintain stable gender per track for cumulative stats
         track_id_to_gender: Dict[int, str] = {}
         track_id_to_gender_conf: Dict[int, float] = {}
@@ -476,28 +563,73 @@ class VideoProcessor:
                 x1 = None
             return x1, y1, x2, y2
 
-        while frame_num < max_frames:
-            ret, frame = cap.read()
+        def _bbox_rows(dets: List[Dict]) -> np.ndarray:
+            # (N, 4) float64 xyxy boxes, NaN rows where the bbox cannot be parsed;
+            # well-formed bboxes are stacked in one call, anything else is parsed per row
+            try:
+                boxes = np.asarray([d.get("bbox") for d in dets], dtype=np.float64)
+                if boxes.shape == (len(dets), 4):
+                    return boxes
+            except (TypeError, ValueError):
+                pass
+            boxes = np.full((len(dets), 4), np.nan, dtype=np.float64)
+            for i, d in enumerate(dets):
+                x1, y1, x2, y2 = _parse_bbox_xyxy(d.get("bbox"))
+                if x1 is not None:
+                    boxes[i] = (x1, y1, x2, y2)
+            return boxes
+
+        # Decoding runs on its own thread so it overlaps detection and the rest of the loop
+        frame_queue: "queue.Queue[Optional[np.ndarray]]" = queue.Queue(
+            maxsize=max(READ_AHEAD_FRAMES, self.detect_batch_size)
+        )
+        stop_reading = threading.Event()
+        reader = threading.Thread(
+            target=self._read_frames,
+            args=(cap, frame_queue, stop_reading, max_frames),
+            name="video-reader",
+            daemon=True,
+        )
+        reader.start()
+        reader_done = False
 
-            if not ret:
-                break
+        # Frames read ahead with their detections; refilled one detection batch at a time
+        detected_frames: "deque[Tuple[np.ndarray, List[Dict]]]" = deque()
+        while frame_num < max_frames:
+            if not detected_frames:
+                batch: List[np.ndarray] = []
+                while not reader_done and len(batch) < self.detect_batch_size:
+                    batch_frame = frame_queue.get()
+                    if batch_frame is None:
+                        reader_done = True
+                        break
+                    batch.append(batch_frame)
+                if not batch:
+                    break
+                # Run detection
+                # Boxes are drawn once after tracking, and only when the output video is written
+                if len(batch) == 1:
+                    detected_frames.append((batch[0], self.detector.detect(batch[0])[0]))
+                else:
+                    for batch_frame, (batch_detections, _) in zip(
+                        batch, self.detector.detect_batch(batch)
+                    ):
+                        detected_frames.append((batch_frame, batch_detections))
 
+            frame, detections = detected_frames.popleft()
             frame_num += 1
 
-            # Run detection
-            detections, annotated = self.detector.detect(frame, return_image=True)
-
-            # Run tracking - tracker now returns detections with track_id attached
-            tracked_detections = self.tracker.update(
-                detections, frame=frame, session_id=session_id
-            )
-
-            # Use tracked_detections which already have track_id attached
-            detections = tracked_detections
+            # Run tracking - tracker now returns detections with track_id attached.
+            # With no detections and no live tracks the update would return []
+            if detections or self.tracker.tracks:
+                detections = self.tracker.update(
+                    detections, frame=frame, session_id=session_id
+                )
 
             # Integrate Re-ID (optional, every K frames)
             if (
-                self.reid_enable
+                detections
+                and self.reid_enable
                 and self.reid_embedder is not None
                 and self.reid_cache is not None
             ):
@@ -519,11 +651,19 @@ class VideoProcessor:
                 except Exception as e:
                     logger.warning(f"Re-ID integration error: {e}")
 
-            # Update unique track id set
-            for d in detections:
-                t_id = d.get("track_id")
-                if t_id is not None:
-                    unique_track_ids.add(int(t_id))
+            # Mark this frame's track ids as seen
+            t_ids = np.fromiter(
+                (int(d["track_id"]) for d in detections if d.get("track_id") is not None),
+                dtype=np.int64,
+            )
+            if t_ids.size > 0:
+                max_id = int(t_ids.max())
+                if max_id >= seen_tracks.shape[0]:
+                    grown = np.zeros(max(max_id + 1, seen_tracks.shape[0] * 2), dtype=bool)
+                    grown[: seen_tracks.shape[0]] = seen_tracks
+                    seen_tracks = grown
+                seen_tracks[t_ids] = True
+                unique_count = int(np.count_nonzero(seen_tracks))
 
             # Gender classification (optional, async, every K frames, budgeted per frame)
             if (
@@ -570,23 +710,27 @@ class VideoProcessor:
 
                 # Only enqueue every K frames (effective)
                 if frame_num % eff_every_k == 0:
-                    enqueued_this_frame = 0
-                    for d in detections:
-                        if enqueued_this_frame >= eff_max_per_frame:
+                    batch_task_ids: List[str] = []
+                    batch_track_ids: List[int] = []
+                    batch_crops: List[np.ndarray] = []
+                    batch_use_face: List[bool] = []
+
+                    # Clamp all tracked boxes to the frame at once and drop empty ones
+                    cands = [d for d in detections if d.get("track_id") is not None]
+                    boxes = _bbox_rows(cands)
+                    parsed = np.flatnonzero(~np.isnan(boxes).any(axis=1))
+                    xyxy = boxes[parsed].astype(np.int64)  # truncates like int()
+                    np.clip(
+                        xyxy, 0, (width - 1, height - 1, width - 1, height - 1), out=xyxy
+                    )
+                    nonempty = (xyxy[:, 2] > xyxy[:, 0]) & (xyxy[:, 3] > xyxy[:, 1])
+
+                    for i, (xi1, yi1, xi2, yi2) in zip(
+                        parsed[nonempty].tolist(), xyxy[nonempty].tolist()
+                    ):
+                        if len(batch_crops) >= eff_max_per_frame:
                             break
-                        if d.get("track_id") is None:
-                            continue
-                        bbox = d.get("bbox")
-                        x1, y1, x2, y2 = _parse_bbox_xyxy(bbox)
-                        if x1 is None:
-                            continue
-                        # Clamp and convert to int
-                        xi1 = max(0, min(width - 1, int(x1)))
-                        yi1 = max(0, min(height - 1, int(y1)))
-                        xi2 = max(0, min(width - 1, int(x2)))
-                        yi2 = max(0, min(height - 1, int(y2)))
-                        if xi2 <= xi1 or yi2 <= yi1:
-                            continue
+                        d = cands[i]
 
                         # Crop strategy: face detection or upper-body fallback
                         person_crop = frame[yi1:yi2, xi1:xi2].copy()
@@ -643,50 +787,36 @@ class VideoProcessor:
                         if crop.size == 0:
                             continue
                         t_id_int = int(d["track_id"])
-                        session_prefix = session_id
-                        task_id = f"{session_prefix}:{t_id_int}:{frame_num}"
-
-                        gc = self.gender_classifier
-                        fgc = self.face_gender_classifier
-
-                        def _make_func(
-                            c=crop,
-                            track_id_val=t_id_int,
-                            use_face=use_face_classifier,
-                            _gc=gc,
-                            _fgc=fgc,
-                        ):
-                            def _run():
-                                start_ms = time.time() * 1000.0
-                                if use_face and _fgc is not None:
-                                    (
-                                        gender,
-                                        gconf,
-                                    ) = _fgc.classify(c)
-                                else:
-                                    # _gc is not None by branch guards
-                                    assert _gc is not None
-                                    gender, gconf = _gc.classify(
-                                        c, track_id=track_id_val
-                                    )
-                                dur = (time.time() * 1000.0) - start_ms
-                                if self.gender_metrics is not None:
-                                    self.gender_metrics.observe_latency(dur)
-                                return gender, float(gconf)
-
-                            return _run
-
-                        ok = self.gender_worker.enqueue(
-                            task_id=task_id, priority=1, func=_make_func()
+                        batch_task_ids.append(f"{session_id}:{t_id_int}:{frame_num}")
+                        batch_track_ids.append(t_id_int)
+                        batch_crops.append(crop)
+                        batch_use_face.append(use_face_classifier)
+
+                    if batch_crops:
+                        # One queued task for all crops of this frame; the task holds
+                        # only data, bound to the shared inference function
+                        ok = self.gender_worker.enqueue_batch(
+                            task_ids=batch_task_ids,
+                            priority=1,
+                            func=functools.partial(
+                                self._gender_infer,
+                                batch_crops,
+                                batch_track_ids,
+                                batch_use_face,
+                                self.gender_classifier,
+                                self.face_gender_classifier,
+                                self.gender_metrics,
+                            ),
                         )
                         if ok:
-                            self._pending_gender_tasks.append(task_id)
-                            enqueued_this_frame += 1
+                            self._pending_gender_tasks.extend(batch_task_ids)
                             if self.gender_metrics is not None:
-                                self.gender_metrics.inc_call()
+                                for _ in batch_task_ids:
+                                    self.gender_metrics.inc_call()
                         else:
                             if self.gender_metrics is not None:
-                                self.gender_metrics.inc_dropped()
+                                for _ in batch_task_ids:
+                                    self.gender_metrics.inc_dropped()
 
                 # Update metrics snapshot periodically
                 if self.gender_metrics is not None and frame_num % 100 == 0:
@@ -736,7 +866,7 @@ class VideoProcessor:
                     "tracked_count": len(
                         [d for d in detections if d.get("track_id") is not None]
                     ),
-                    "unique_count": len(unique_track_ids),
+                    "unique_count": unique_count,
                     "gender_counts": gender_counts,
                     "detections": detections,
                     "tracks": [d for d in detections if d.get("track_id") is not None],
@@ -769,7 +899,7 @@ class VideoProcessor:
                     self._db_buffer.append(det)
 
                 # Flush policy: by batch size or time interval
-                now_ms = time.time() * 1000.0
+                now_ms = _now_ms()
                 if (
                     len(self._db_buffer) >= self.db_batch_size
                     or (now_ms - self._last_db_flush_ms) >= self.db_flush_interval_ms
@@ -782,50 +912,30 @@ class VideoProcessor:
                     self._db_buffer.clear()
                     self._last_db_flush_ms = now_ms
 
-            # Redraw annotations with track IDs if needed
-            if annotated is None and len(detections) > 0:
-                annotated = self.detector.processor.draw_detections(frame, detections)
-            elif annotated is not None:
-                # Redraw to include track IDs
-                annotated = self.detector.processor.draw_detections(
-                    annotated, detections
-                )
-
-            # Add overlay with info
+            # Annotate (boxes with track IDs + overlay) only when saving the video
             if save_annotated:
+                # The frame is not read after this point (gender crops are copies), so
+                # boxes and overlay are drawn straight onto it
+                if len(detections) > 0:
+                    self.detector.processor.draw_detections(frame, detections, inplace=True)
                 tracked_count = len(
                     [d for d in detections if d.get("track_id") is not None]
                 )
-                unique_count = len(unique_track_ids)
                 # Fetch tracker stats (including reid_matches)
                 tracker_stats = self.tracker.get_statistics()
                 reid_matches = int(tracker_stats.get("reid_matches", 0))
-                if annotated is not None:
-                    annotated = self._add_overlay(
-                        annotated,
-                        frame_num,
-                        len(detections),
-                        tracked_count,
-                        unique_count,
-                        gender_counts,
-                        time.time() - start_time,
-                        self.detector.model_loader.get_device(),
-                        self.detector.model_loader.is_mps_enabled(),
-                        reid_matches,
-                    )
-                else:
-                    annotated = self._add_overlay(
-                        frame,
-                        frame_num,
-                        len(detections),
-                        tracked_count,
-                        unique_count,
-                        gender_counts,
-                        time.time() - start_time,
-                        self.detector.model_loader.get_device(),
-                        self.detector.model_loader.is_mps_enabled(),
-                        reid_matches,
-                    )
+                annotated = self._add_overlay(
+                    frame,
+                    frame_num,
+                    len(detections),
+                    tracked_count,
+                    unique_count,
+                    gender_counts,
+                    time.time() - start_time,
+                    self.detector.model_loader.get_device(),
+                    self.detector.model_loader.is_mps_enabled(),
+                    reid_matches,
+                )
 
                 if video_writer is not None:
                     video_writer.write(annotated)
@@ -837,7 +947,16 @@ class VideoProcessor:
                     f"Progress: {progress:.1f}% ({frame_num}/{total_frames} frames)"
                 )
 
-        # Cleanup
+        # Cleanup; the reader must be done with cap before it is released
+        stop_reading.set()
+        if not reader_done:
+            # Unblock a reader waiting on a full queue
+            while True:
+                try:
+                    frame_queue.get_nowait()
+                except queue.Empty:
+                    break
+        reader.join()
         cap.release()
         if video_writer is not None:
             video_writer.release()
@@ -872,7 +991,7 @@ class VideoProcessor:
             "tracker_stats": self.tracker.get_statistics(),
             "frame_results": frame_results,
             "summary": {
-                "unique_tracks_total": len(unique_track_ids),
+                "unique_tracks_total": unique_count,
                 "gender_counts_total": gender_counts,
             },
         }
@@ -1041,6 +1160,12 @@ def main():
     parser.add_argument(
         "--no-annotate", action="store_true", help="Do not save annotated video"
     )
+    parser.add_argument(
+        "--detect-batch-size",
+        type=int,
+        default=1,
+        help="Frames per batched detection call (default: 1, larger batches help on GPU)",
+    )
 
     parser.add_argument(
         "--reid-enable",
@@ -1314,6 +1439,7 @@ def main():
             db_flush_interval_ms=args.db_flush_interval_ms,
             redis_enable=bool(args.redis_enable),
             redis_url=args.redis_url,
+            detect_batch_size=args.detect_batch_size,
         )
 
         try:
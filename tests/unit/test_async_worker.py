@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Unit tests for AsyncGenderWorker.
+"""
+
+import time
+
+import pytest
+
+pytest.importorskip("torch")  # demographics package imports torch-based classifiers
+
+from src.modules.demographics.async_worker import AsyncGenderWorker  # noqa: E402
+
+
+def _wait_for(worker: AsyncGenderWorker, task_id: str, timeout: float = 2.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        res = worker.try_get_result(task_id)
+        if res is not None:
+            return res
+        time.sleep(0.01)
+    return None
+
+
+def test_enqueue_single_task_stores_result():
+    worker = AsyncGenderWorker(max_workers=1, queue_size=4)
+    try:
+        assert worker.enqueue("s:1:10", priority=1, func=lambda: ("M", 0.9))
+        res = _wait_for(worker, "s:1:10")
+        assert res is not None
+        assert res[:2] == ("M", 0.9)
+    finally:
+        worker.shutdown()
+
+
+def test_enqueue_batch_stores_result_per_task_id():
+    worker = AsyncGenderWorker(max_workers=1, queue_size=4)
+    calls = []
+
+    def _run():
+        calls.append(1)
+        return [("M", 0.8), ("F", 0.7)]
+
+    try:
+        assert worker.enqueue_batch(["s:1:10", "s:2:10"], priority=1, func=_run)
+        first = _wait_for(worker, "s:1:10")
+        second = _wait_for(worker, "s:2:10")
+        assert first is not None and first[:2] == ("M", 0.8)
+        assert second is not None and second[:2] == ("F", 0.7)
+        assert len(calls) == 1
+    finally:
+        worker.shutdown()
+
+
+def test_enqueue_batch_rejects_empty():
+    worker = AsyncGenderWorker(max_workers=1, queue_size=4)
+    try:
+        assert worker.enqueue_batch([], priority=1, func=lambda: []) is False
+    finally:
+        worker.shutdown()
+
+
+def test_tuple_task_ids():
+    worker = AsyncGenderWorker(max_workers=1, queue_size=4)
+    try:
+        ids = [("s", 1, 10), ("s", 2, 10)]
+        assert worker.enqueue_batch(ids, priority=1, func=lambda: [("F", 0.6), ("M", 0.9)])
+        res = _wait_for(worker, ("s", 2, 10))
+        assert res is not None and res[:2] == ("M", 0.9)
+    finally:
+        worker.shutdown()
@@ -258,6 +258,22 @@ class TestZoneCounter:
         assert result_frame is not None
         assert result_frame.shape == frame.shape
 
+    def test_draw_zones_inplace(self, counter):
+        """Test in-place drawing matches drawing on a copy."""
+        # Arrange
+        frame = np.full((200, 200, 3), 50, dtype=np.uint8)
+        original = frame.copy()
+
+        # Act
+        copied = counter.draw_zones(frame)
+        unchanged = np.array_equal(frame, original)
+        result_frame = counter.draw_zones(frame, inplace=True)
+
+        # Assert
+        assert unchanged
+        assert result_frame is frame
+        np.testing.assert_array_equal(result_frame, copied)
+
     def test_update_no_detections(self, counter):
         """Test update with no detections."""
         # Arrange
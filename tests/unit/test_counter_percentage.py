@@ -98,6 +98,19 @@ class TestZoneCounterPercentage:
         assert points[2] == (960.0, 1080.0)  # Bottom-right
         assert points[3] == (0.0, 1080.0)  # Bottom-left
 
+    def test_zone_polygon_cached_per_frame_size(self, counter_polygon_percent):
+        """Test percentage polygon array is reused until the frame size changes."""
+        zone = counter_polygon_percent.zones[0]
+
+        first = counter_polygon_percent._get_zone_polygon(zone, 1920, 1080)
+        again = counter_polygon_percent._get_zone_polygon(zone, 1920, 1080)
+        resized = counter_polygon_percent._get_zone_polygon(zone, 1280, 720)
+
+        assert again is first
+        assert resized is not first
+        np.testing.assert_allclose(first[2], [960.0, 1080.0])
+        np.testing.assert_allclose(resized[2], [640.0, 720.0])
+
     def test_percentage_to_absolute_conversion_line(self, counter_line_percent):
         """Test percentage to absolute coordinate conversion for line."""
         # Arrange
@@ -5,7 +5,7 @@ from datetime import datetime
 import pytest
 
 from src.modules.database.models import PersonDetection, PersonTrack
-from src.modules.database.postgres_manager import PostgresManager
+from src.modules.database.postgres_manager import DETECTION_COLUMNS, PostgresManager
 from src.modules.database.redis_manager import RedisManager
 
 
@@ -19,6 +19,9 @@ class _FakeCursor:
     def execute(self, sql: str, params: tuple | None = None) -> None:
         self.executed.append((sql, params))
 
+    def copy_expert(self, sql: str, file) -> None:  # noqa: ANN001
+        self.executed.append((sql, file.read()))
+
     def __enter__(self) -> "_FakeCursor":
         return self
 
@@ -88,6 +91,102 @@ def test_postgres_manager_insert_and_upsert_monkeypatch(monkeypatch: pytest.Monk
     assert len(pool.conn.cur.executed) >= 1
 
 
+def test_postgres_manager_insert_detection_rows(monkeypatch: pytest.MonkeyPatch) -> None:
+    def _fake_init_pool(self: PostgresManager) -> None:  # type: ignore[no-redef]
+        self._pool = _FakePool()
+
+    monkeypatch.setattr(PostgresManager, "_init_pool", _fake_init_pool)
+    mgr = PostgresManager(dsn="postgres://fake")
+
+    row = (datetime.now(), 1, 1, "d1", 123, 0.9, 0, 0, 10, 10, "M", 0.88, 5)
+    assert len(row) == len(DETECTION_COLUMNS)
+    assert mgr.insert_detection_rows([row, row]) == 2
+    assert mgr.insert_detection_rows([]) == 0
+    pool = mgr._pool  # type: ignore[attr-defined]
+    assert len(pool.conn.cur.executed) == 1
+    sql, _params = pool.conn.cur.executed[0]
+    assert f"({','.join(DETECTION_COLUMNS)})" in sql
+    assert sql.endswith("VALUES (1),(1)")
+
+
+def test_postgres_manager_copy_detection_rows(monkeypatch: pytest.MonkeyPatch) -> None:
+    def _fake_init_pool(self: PostgresManager) -> None:  # type: ignore[no-redef]
+        self._pool = _FakePool()
+
+    monkeypatch.setattr(PostgresManager, "_init_pool", _fake_init_pool)
+    mgr = PostgresManager(dsn="postgres://fake")
+
+    ts = datetime(2024, 1, 2, 3, 4, 5)
+    row = (ts, 1, 1, "d1", 123, 0.9, 0, 0, 10, 10, "M", 0.88, 5)
+    untracked = (ts, 1, 1, "d2", None, 0.7, 1, 2, 3, 4, None, None, 5)
+    assert mgr.copy_detection_rows([row, untracked]) == 2
+    assert mgr.copy_detection_rows([]) == 0
+    pool = mgr._pool  # type: ignore[attr-defined]
+    assert pool.conn.commits == 1
+    assert len(pool.conn.cur.executed) == 1
+    sql, payload = pool.conn.cur.executed[0]
+    assert sql.startswith(f"COPY detections ({','.join(DETECTION_COLUMNS)}) FROM STDIN")
+    assert payload.splitlines() == [
+        "2024-01-02 03:04:05,1,1,d1,123,0.9,0,0,10,10,M,0.88,5",
+        "2024-01-02 03:04:05,1,1,d2,,0.7,1,2,3,4,,,5",
+    ]
+
+
+def test_postgres_manager_insert_counter_event(monkeypatch: pytest.MonkeyPatch) -> None:
+    def _fake_init_pool(self: PostgresManager) -> None:  # type: ignore[no-redef]
+        self._pool = _FakePool()
+
+    monkeypatch.setattr(PostgresManager, "_init_pool", _fake_init_pool)
+    mgr = PostgresManager(dsn="postgres://fake")
+
+    mgr.insert_counter_event(
+        channel_id=1,
+        zone_id="z1",
+        zone_name="Entrance",
+        event_type="enter",
+        track_id=7,
+        person_id=None,
+        frame_number=42,
+        extra_json={"run_id": "r1"},
+    )
+    pool = mgr._pool  # type: ignore[attr-defined]
+    assert len(pool.conn.cur.executed) == 1
+    _sql, params = pool.conn.cur.executed[0]
+    assert params[-1] == '{"run_id": "r1"}'
+    assert pool.conn.commits == 1
+
+
+def test_postgres_manager_insert_counter_events_single_statement(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    def _fake_init_pool(self: PostgresManager) -> None:  # type: ignore[no-redef]
+        self._pool = _FakePool()
+
+    monkeypatch.setattr(PostgresManager, "_init_pool", _fake_init_pool)
+    mgr = PostgresManager(dsn="postgres://fake")
+
+    events = [
+        {
+            "channel_id": 1,
+            "zone_id": "z1",
+            "zone_name": "Entrance",
+            "event_type": etype,
+            "track_id": 7,
+            "person_id": None,
+            "frame_number": 42,
+            "extra_json": {"run_id": "r1"},
+        }
+        for etype in ("enter", "exit")
+    ]
+    assert mgr.insert_counter_events(events) == 2
+    assert mgr.insert_counter_events([]) == 0
+    pool = mgr._pool  # type: ignore[attr-defined]
+    assert len(pool.conn.cur.executed) == 1
+    sql, _params = pool.conn.cur.executed[0]
+    assert sql.endswith("VALUES (1),(1)")
+    assert pool.conn.commits == 1
+
+
 class _FakeRedis:
     def __init__(self) -> None:
         self.store: dict[str, bytes] = {}
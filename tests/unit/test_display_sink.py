@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the out-of-process display sink.
+"""
+
+import os
+import time
+from multiprocessing import resource_tracker, shared_memory
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from src.modules.utils.display_sink import DisplaySink, _attach_untracked, _FrameReceiver
+
+
+def _record_loop(conn, out_dir, quit_event):
+    """Display loop stand-in: saves each received frame instead of showing it.
+
+    A frame that is all 255 requests quit, like pressing 'q' in the window.
+    """
+    receiver = _FrameReceiver()
+    count = 0
+    try:
+        while True:
+            msg = conn.recv()
+            if msg is None:
+                break
+            frame = receiver.frame(msg)
+            tmp = os.path.join(out_dir, "frame.tmp.npy")
+            np.save(tmp, frame)
+            os.replace(tmp, os.path.join(out_dir, f"frame{count}.npy"))
+            count += 1
+            if frame.size > 0 and frame.min() == 255:
+                quit_event.set()
+            conn.send(True)
+    except EOFError:
+        pass
+    finally:
+        receiver.close()
+
+
+def _wait_for(predicate, timeout=20.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.02)
+    return False
+
+
+def _show_when_idle(sink, frame, timeout=20.0):
+    return _wait_for(lambda: sink.show(frame), timeout)
+
+
+def test_attach_untracked_leaves_registration_to_owner():
+    """Attaching neither registers the segment nor breaks the owner's unlink."""
+    owner = shared_memory.SharedMemory(create=True, size=16)
+    register = resource_tracker.register
+    try:
+        attached = _attach_untracked(owner.name)
+        assert resource_tracker.register is register
+        attached.buf[0] = 7
+        assert owner.buf[0] == 7
+        attached.close()
+    finally:
+        owner.close()
+        owner.unlink()
+
+
+def test_display_sink_publishes_resizes_and_quits(tmp_path: Path):
+    """Frames reach the display process, new shapes get a new segment, quit and close work."""
+    sink = DisplaySink(str(tmp_path), loop=_record_loop)
+    try:
+        first = np.arange(4 * 6 * 3, dtype=np.uint8).reshape(4, 6, 3)
+        assert sink.show(first) is True
+        # Still waiting for the first acknowledgement, so the next frame is dropped
+        assert sink.show(first) is False
+        assert _wait_for((tmp_path / "frame0.npy").exists)
+        assert np.array_equal(np.load(tmp_path / "frame0.npy"), first)
+        first_segment = sink._shm.name
+
+        resized = np.full((8, 10, 3), 42, dtype=np.uint8)
+        assert _show_when_idle(sink, resized)
+        assert sink._shm.name != first_segment
+        assert _wait_for((tmp_path / "frame1.npy").exists)
+        assert np.array_equal(np.load(tmp_path / "frame1.npy"), resized)
+        # The replaced segment was unlinked by its owner
+        with pytest.raises(FileNotFoundError):
+            shared_memory.SharedMemory(name=first_segment)
+
+        assert sink.quit_requested is False
+        assert _show_when_idle(sink, np.full((8, 10, 3), 255, dtype=np.uint8))
+        assert _wait_for(lambda: sink.quit_requested)
+        last_segment = sink._shm.name
+    finally:
+        sink.close()
+
+    assert not sink._proc.is_alive()
+    with pytest.raises(FileNotFoundError):
+        shared_memory.SharedMemory(name=last_segment)
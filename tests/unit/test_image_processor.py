@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+Unit tests for image processor crop helpers.
+"""
+
+import numpy as np
+
+from src.modules.detection.image_processor import ImageProcessor
+
+
+class TestDetachCrop:
+    """Test suite for ImageProcessor.detach_crop."""
+
+    def test_small_region_is_copied_unchanged(self):
+        """Regions whose shorter side is within min_side are copied as-is."""
+        frame = np.random.randint(0, 255, (480, 640, 3), dtype=np.uint8)
+        region = frame[10:410, 20:220]  # 200 wide, 400 high
+
+        crop = ImageProcessor().detach_crop(region, 227)
+
+        assert crop.shape == region.shape
+        assert np.array_equal(crop, region)
+        assert not np.shares_memory(crop, frame)
+
+    def test_large_region_keeps_short_side_at_min_side(self):
+        """Larger regions are downscaled with the aspect ratio kept and short side at min_side."""
+        frame = np.random.randint(0, 255, (720, 1280, 3), dtype=np.uint8)
+        region = frame[0:480, 100:400]  # 300 wide, 480 high
+
+        crop = ImageProcessor().detach_crop(region, 227)
+
+        assert crop.shape == (363, 227, 3)
+        assert min(crop.shape[:2]) >= 227
+        assert not np.shares_memory(crop, frame)
+
+    def test_frame_mutation_does_not_affect_crop(self):
+        """The detached crop survives later in-place writes to the frame."""
+        frame = np.zeros((600, 600, 3), dtype=np.uint8)
+        crop = ImageProcessor().detach_crop(frame[0:500, 0:500], 227)
+        frame[:] = 255
+
+        assert crop.max() == 0
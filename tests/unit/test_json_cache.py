@@ -0,0 +1,23 @@
+#!/usr/bin/env python3
+"""
+Unit tests for memoized JSON loading.
+"""
+
+import json
+
+from src.modules.utils.json_cache import clear_json_cache, load_json_cached
+
+
+def test_load_json_cached_reuses_and_reloads(tmp_path):
+    """Unchanged files return the cached object; edited files are re-parsed."""
+    clear_json_cache()
+    path = tmp_path / "database.json"
+    path.write_text(json.dumps({"postgresql": {"dsn": "a"}}))
+
+    first = load_json_cached(path)
+    assert load_json_cached(str(path)) is first
+
+    path.write_text(json.dumps({"postgresql": {"dsn": "changed"}}))
+    second = load_json_cached(path)
+    assert second is not first
+    assert second["postgresql"]["dsn"] == "changed"
@@ -27,3 +27,15 @@ def test_cache_set_get_roundtrip(monkeypatch):
     assert got is None
 
 
+def test_embed_batch_matches_single_embed():
+    embedder = ReIDEmbedder()
+    rng = np.random.default_rng(0)
+    crops = [
+        rng.integers(0, 255, (256, 128, 3), dtype=np.uint8),
+        rng.integers(0, 255, (90, 40, 3), dtype=np.uint8),
+    ]
+    batch = embedder.embed_batch(crops)
+    assert len(batch) == 2
+    for crop, emb in zip(crops, batch):
+        np.testing.assert_allclose(emb, embedder.embed(crop), rtol=1e-4, atol=1e-5)
+    assert embedder.embed_batch([]) == []
@@ -6,7 +6,7 @@ Unit tests for tracking module.
 from typing import List, Dict
 import numpy as np
 
-from src.modules.tracking.tracker import Tracker
+from src.modules.tracking.tracker import Tracker, iou_matrix
 
 
 def _make_det(x1: float, y1: float, x2: float, y2: float, conf: float = 0.9) -> Dict:
@@ -74,3 +74,48 @@ def test_tracker_ema_smoothing_effect():
     assert 0.0 < float(bbox[0]) < 100.0
 
 
+def test_iou_matrix_matches_pairwise_iou():
+    tracker = Tracker()
+    boxes_a = np.array([[0, 0, 10, 10], [5, 5, 15, 15], [100, 100, 110, 120]], dtype=np.float32)
+    boxes_b = np.array([[0, 0, 10, 10], [50, 50, 60, 60]], dtype=np.float32)
+
+    matrix = iou_matrix(boxes_a, boxes_b)
+    assert matrix.shape == (3, 2)
+    for i, a in enumerate(boxes_a):
+        for j, b in enumerate(boxes_b):
+            assert np.isclose(matrix[i, j], tracker._iou(a, b))
+
+
+def test_tracker_reid_embeds_unmatched_detections_in_one_batch():
+    class _BatchEmbedder:
+        def __init__(self) -> None:
+            self.batch_sizes: List[int] = []
+
+        def embed(self, img: np.ndarray) -> np.ndarray:
+            raise AssertionError("per-crop embed should not be used")
+
+        def embed_batch(self, crops: List[np.ndarray]) -> List[np.ndarray]:
+            self.batch_sizes.append(len(crops))
+            return [np.ones(8, dtype=np.float32) for _ in crops]
+
+    class _EmptyCache:
+        def get(self, session_id: str, track_id: int) -> object:
+            return None
+
+    embedder = _BatchEmbedder()
+    tracker = Tracker(
+        min_hits=1, reid_enable=True, reid_cache=_EmptyCache(), reid_embedder=embedder
+    )
+    frame = np.zeros((300, 300, 3), dtype=np.uint8)
+    # First frame seeds a track without Re-ID
+    tracker.update([_make_det(10, 10, 50, 60)], frame=frame, session_id="s")
+
+    # Two detections far from the existing track are both unmatched
+    tracked = tracker.update(
+        [_make_det(150, 150, 190, 220), _make_det(240, 20, 290, 90)],
+        frame=frame,
+        session_id="s",
+    )
+
+    assert embedder.batch_sizes == [2]
+    assert len({d["track_id"] for d in tracked}) == 2